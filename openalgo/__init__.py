@@ -8,8 +8,10 @@ from .data import DataAPI
 from .account import AccountAPI
 from .strategy import Strategy
 from .feed import FeedAPI
+from .shards import ShardedFeed
 from .options import OptionsAPI
 from .telegram import TelegramAPI
+from .aio import AsyncDataAPI
 from .indicators import ta
 
 # ------------------------------------------------------------------
@@ -31,7 +33,14 @@ class api(OrderAPI, DataAPI, AccountAPI, FeedAPI, OptionsAPI, TelegramAPI):
     """
     pass
 
+class AsyncAPI(AsyncDataAPI, OrderAPI, AccountAPI, OptionsAPI, TelegramAPI):
+    """
+    OpenAlgo asyncio API client class.
+    Same methods and keyword arguments as api (REST only); every call must be awaited.
+    """
+    pass
+
 __version__ = "1.0.33"
 
 # Export main components for easy access
-__all__ = ['api', 'Strategy', 'ta', 'nbjit', 'prange']
+__all__ = ['api', 'AsyncAPI', 'ShardedFeed', 'Strategy', 'ta', 'nbjit', 'prange']
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""
+OpenAlgo REST API Documentation - Asyncio Base Class
+    https://docs.openalgo.in
+"""
+
+import asyncio
+import httpx
+from .base import BaseAPI
+from .data import DataAPI
+
+class AsyncBaseAPI(BaseAPI):
+    """
+    Asyncio variant of BaseAPI backed by a pooled httpx.AsyncClient.
+
+    Mixing this class in front of the REST mixins turns every endpoint method
+    into an awaitable with the same keyword signature and error-dict shape as
+    the synchronous client.
+    """
+
+    def _create_client(self):
+        """Create the pooled asyncio HTTP client shared by all REST mixins."""
+        return httpx.AsyncClient(limits=self.limits, http2=self.http2, timeout=self.timeout)
+
+    async def close(self):
+        """Close the pooled HTTP client and release its connections."""
+        if not self.client.is_closed:
+            await self.client.aclose()
+
+    aclose = close
+
+    def __enter__(self):
+        raise TypeError("Use 'async with' with the asyncio client")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def _make_request(self, endpoint, payload):
+        """Make HTTP request with proper error handling"""
+        url = self.base_url + endpoint
+        limiter = self._rate_limiter(endpoint)
+        if limiter:
+            await limiter.acquire_async()
+        try:
+            response = await self.client.post(url, content=self.codec.dumps(payload), headers=self.headers,
+                                              timeout=self.timeout)
+            return self._handle_response(response)
+        except Exception as e:
+            return self._handle_exception(e)
+
+    async def _cached_request(self, endpoint, payload):
+        """Serve a reference-data request from reference_cache, falling back to the server"""
+        if self.reference_cache is None:
+            return await self._make_request(endpoint, payload)
+        cached = self.reference_cache.get(endpoint, payload)
+        if cached is not None:
+            return cached
+        result = await self._make_request(endpoint, payload)
+        if result.get('status') == 'success':
+            self.reference_cache.set(endpoint, payload, result)
+        return result
+
+class AsyncDataAPI(AsyncBaseAPI, DataAPI):
+    """
+    Asyncio Data API methods for OpenAlgo.
+    Overrides the DataAPI methods that post-process the response.
+    """
+
+    async def quotes_many(self, instruments, max_concurrency=10, format="dict"):
+        """
+        Get real-time quotes for many symbols concurrently over the pooled client.
+        See DataAPI.quotes_many() for parameters and return values.
+        """
+        keys, requests = self._instrument_requests(instruments)
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def fetch(request):
+            if request is None:
+                return None
+            async with semaphore:
+                return await self.quotes(**request)
+
+        responses = await asyncio.gather(*[fetch(request) for request in requests])
+        return self._collect_quotes(keys, requests, responses, format)
+
+    async def history_many(self, instruments, *, interval, start_date, end_date, max_concurrency=4, format="dict",
+                           use_cache=True):
+        """
+        Get historical data for many symbols concurrently over the pooled client.
+        See DataAPI.history_many() for parameters and return values.
+        """
+        keys, requests = self._instrument_requests(instruments)
+        options = {
+            "interval": interval,
+            "start_date": start_date,
+            "end_date": end_date,
+            "use_cache": use_cache,
+            "format": "numpy" if format == "panel" else "dataframe"
+        }
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def fetch(request):
+            if request is None:
+                return None
+            async with semaphore:
+                return await self.history(**request, **options)
+
+        responses = await asyncio.gather(*[fetch(request) for request in requests])
+        return self._collect_history(keys, requests, responses, format)
+
+    async def history(self, *, symbol, exchange, interval, start_date, end_date, chunk_days=None, max_concurrency=4,
+                      use_cache=True, format="dataframe"):
+        """
+        Get historical data for a symbol in pandas DataFrame format.
+        See DataAPI.history() for parameters and return values.
+        """
+        payloads, missing = self._history_plan(symbol, exchange, interval, start_date, end_date, chunk_days, use_cache)
+        result = await self._fetch_history_async(payloads, max_concurrency)
+        return self._finish_history(result, symbol, exchange, interval, start_date, end_date, missing, format)
+
+    async def _fetch_history_async(self, payloads, max_concurrency):
+        """Download every history payload, concurrently when there is more than one"""
+        if len(payloads) == 1:
+            return await self._make_request("history", payloads[0])
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def fetch(payload):
+            async with semaphore:
+                return await self._make_request("history", payload)
+
+        results = await asyncio.gather(*[fetch(payload) for payload in payloads])
+        return self._merge_history_results(results)
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+"""
+OpenAlgo WebSocket Feed - Streaming Bar Builder
+    https://docs.openalgo.in
+"""
+
+import re
+import threading
+import numpy as np
+import pandas as pd
+
+IST_OFFSET = 19800  # seconds east of UTC
+BAR_FIELDS = ('open', 'high', 'low', 'close', 'volume')
+UNIT_SECONDS = {'s': 1, 'm': 60, 'h': 3600}
+
+def interval_seconds(interval):
+    """Length of an interval such as '1m', '5m', '1h' or 'D' in seconds"""
+    if interval == 'D':
+        return 86400
+    match = re.fullmatch(r'(\d+)([smh])', str(interval))
+    if not match:
+        raise ValueError(f"Unsupported bar interval '{interval}'. Use e.g. '30s', '1m', '5m', '1h' or 'D'.")
+    return int(match.group(1)) * UNIT_SECONDS[match.group(2)]
+
+class _Series:
+    """Closed bars of one instrument and interval in growable NumPy columns"""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.size = 0
+        size = min(64, capacity)
+        self.columns = {'timestamp': np.zeros(size, dtype=np.int64)}
+        for field in BAR_FIELDS:
+            self.columns[field] = np.zeros(size, dtype=np.float64)
+
+    def append(self, bar):
+        if self.size == len(self.columns['timestamp']):
+            if self.size >= self.capacity:
+                # Keep the newest half when the capacity is reached
+                keep = self.capacity // 2
+                for values in self.columns.values():
+                    values[:keep] = values[self.size - keep:self.size]
+                self.size = keep
+            else:
+                new_size = min(self.capacity, 2 * self.size)
+                for name, values in self.columns.items():
+                    grown = np.zeros(new_size, dtype=values.dtype)
+                    grown[:self.size] = values[:self.size]
+                    self.columns[name] = grown
+        for name, values in self.columns.items():
+            values[self.size] = bar[name]
+        self.size += 1
+
+    def arrays(self):
+        return {name: values[:self.size].copy() for name, values in self.columns.items()}
+
+class BarBuilder:
+    """
+    Aggregates ticks into OHLCV bars for several intervals at once.
+
+    Intraday bars are aligned to the IST session start (09:15 by default), so
+    1m/5m/15m/1h bars line up with exchange candles; 'D' bars follow the IST
+    calendar day. A bar closes when the first tick of a later bar arrives or
+    when flush() passes its end time plus a grace period, and on_bar is called
+    with the closed bar. Ticks that arrive for a bar that is already closed are
+    dropped and counted in late_ticks, so every bar is emitted once.
+
+    Closed bars are kept as NumPy columns with int64 epoch-second timestamps
+    (bar open time) and float64 OHLCV, the same layout as
+    history(format="numpy"). Volume is taken from the cumulative day volume
+    in quote ticks, so bars built from LTP ticks have zero volume.
+    """
+
+    def __init__(self, intervals=('1m', '5m', '15m'), on_bar=None, capacity=10000, session_start='09:15', grace=1.0):
+        """
+        Attributes:
+        - intervals (tuple): Bar intervals, e.g. ('1m', '5m', '15m', '1h', 'D').
+        - on_bar (callable, optional): Called with each closed bar dict
+          {'symbol', 'exchange', 'interval', 'timestamp', 'open', 'high', 'low', 'close', 'volume'}.
+        - capacity (int): Closed bars kept per instrument and interval. Defaults to 10000.
+        - session_start (str): IST session start 'HH:MM' that intraday bars are aligned to. Defaults to '09:15'.
+        - grace (float): Seconds after a bar's end time before flush() closes it, so ticks delayed
+          in transit still land in their bar. Defaults to 1.0.
+        """
+        self.intervals = tuple(intervals)
+        self.seconds = {interval: interval_seconds(interval) for interval in self.intervals}
+        self.on_bar = on_bar
+        self.capacity = max(2, int(capacity))
+        hours, minutes = (int(part) for part in session_start.split(':'))
+        self.session_offset = hours * 3600 + minutes * 60
+        self._bars = {}     # (symbol_key, interval) -> forming bar dict
+        self._series = {}   # (symbol_key, interval) -> _Series of closed bars
+        self._volume = {}   # symbol_key -> last cumulative volume
+        self._closed = {}   # (symbol_key, interval) -> start of the last closed bar
+        self.grace = grace
+        self.late_ticks = 0
+        self._lock = threading.Lock()
+
+    def bar_start(self, timestamp, interval):
+        """Epoch second at which the bar containing timestamp (epoch seconds) opens"""
+        seconds = self.seconds[interval]
+        local = timestamp + IST_OFFSET
+        day = local - local % 86400
+        if interval == 'D':
+            # Daily bars are stamped with the IST date at 00:00 UTC, like history()
+            return day
+        session = day + self.session_offset
+        return session + (local - session) // seconds * seconds - IST_OFFSET
+
+    def update(self, symbol_key, timestamp, price, volume=None):
+        """
+        Add a tick to every interval of an instrument.
+
+        Parameters:
+        - symbol_key (str): 'EXCHANGE:SYMBOL'.
+        - timestamp (int, float or numeric str): Tick time in epoch seconds or milliseconds.
+        - price (float): Traded price.
+        - volume (float, optional): Cumulative day volume.
+
+        Returns:
+        list: Bars closed by this tick.
+        """
+        if price is None or price != price:
+            return []
+        if isinstance(timestamp, (str, bytes)):
+            try:
+                timestamp = float(timestamp)
+            except ValueError:
+                raise ValueError(f"Tick timestamp must be epoch seconds or milliseconds, got {timestamp!r}") from None
+        ts = int(timestamp // 1000 if timestamp > 10_000_000_000 else timestamp)
+        closed = []
+        with self._lock:
+            traded = 0.0
+            if volume is not None and volume == volume:
+                previous = self._volume.get(symbol_key)
+                if previous is not None and volume >= previous:
+                    traded = volume - previous
+                self._volume[symbol_key] = volume
+            for interval in self.intervals:
+                key = (symbol_key, interval)
+                start = self.bar_start(ts, interval)
+                bar = self._bars.get(key)
+                if bar is not None and start > bar['timestamp']:
+                    closed.append(self._close(key, bar))
+                    bar = None
+                if (bar is not None and start < bar['timestamp']) or \
+                        (bar is None and start <= self._closed.get(key, start - 1)):
+                    # Late tick for a bar that has already closed
+                    self.late_ticks += 1
+                    continue
+                if bar is None:
+                    self._bars[key] = {'timestamp': start, 'open': price, 'high': price, 'low': price,
+                                       'close': price, 'volume': traded}
+                elif start == bar['timestamp']:
+                    if price > bar['high']:
+                        bar['high'] = price
+                    if price < bar['low']:
+                        bar['low'] = price
+                    bar['close'] = price
+                    bar['volume'] += traded
+        self._emit(closed)
+        return closed
+
+    def flush(self, now):
+        """
+        Close every forming bar whose end time plus the grace period is at or before
+        now (epoch seconds), so bars of instruments without new ticks close on time.
+
+        Returns:
+        list: Bars closed.
+        """
+        closed = []
+        with self._lock:
+            for key, bar in list(self._bars.items()):
+                if bar['timestamp'] + self.seconds[key[1]] + self.grace <= now:
+                    del self._bars[key]
+                    closed.append(self._close(key, bar))
+        self._emit(closed)
+        return closed
+
+    def _close(self, key, bar):
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = _Series(self.capacity)
+        series.append(bar)
+        self._closed[key] = bar['timestamp']
+        exchange, _, symbol = key[0].partition(':')
+        return dict(bar, symbol=symbol, exchange=exchange, interval=key[1])
+
+    def _emit(self, closed):
+        if self.on_bar is None:
+            return
+        for bar in closed:
+            try:
+                self.on_bar(bar)
+            except Exception as e:
+                print(f"Error in bar callback: {e}")
+
+    def seed(self, symbol_key, interval, arrays):
+        """
+        Preload closed bars, e.g. from history(format="numpy"), so indicators see
+        a full series from the first live bar.
+        """
+        with self._lock:
+            series = self._series[(symbol_key, interval)] = _Series(self.capacity)
+            for i in range(len(arrays['timestamp'])):
+                series.append({name: arrays[name][i] if name in arrays else 0.0
+                               for name in ('timestamp',) + BAR_FIELDS})
+            if len(arrays['timestamp']):
+                self._closed[(symbol_key, interval)] = int(arrays['timestamp'][-1])
+
+    def bars(self, symbol_key, interval, include_partial=False, format="numpy"):
+        """
+        Get the bar history of an instrument.
+
+        Parameters:
+        - include_partial (bool): Append the bar still forming. Defaults to False.
+        - format (str): "numpy" for {'timestamp', 'open', 'high', 'low', 'close', 'volume'} arrays,
+          or "dataframe" for a DataFrame indexed like history() output.
+
+        Returns:
+        dict or pandas.DataFrame
+        """
+        with self._lock:
+            series = self._series.get((symbol_key, interval))
+            arrays = series.arrays() if series is not None else {
+                'timestamp': np.empty(0, dtype=np.int64), **{f: np.empty(0) for f in BAR_FIELDS}}
+            partial = self._bars.get((symbol_key, interval)) if include_partial else None
+        if partial is not None:
+            arrays = {name: np.append(values, partial[name]).astype(values.dtype) for name, values in arrays.items()}
+        if format == "dataframe":
+            df = pd.DataFrame({field: arrays[field] for field in BAR_FIELDS})
+            index = pd.to_datetime(arrays['timestamp'], unit='s')
+            if interval != 'D':
+                index = index.tz_localize('UTC').tz_convert('Asia/Kolkata')
+            df.index = pd.Index(index, name='timestamp')
+            return df
+        return arrays
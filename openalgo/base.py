@@ -5,13 +5,26 @@ OpenAlgo REST API Documentation - Base API Class
 """
 
 import httpx
+from .ratelimit import ENDPOINT_GROUPS, build_rate_limiters
+from .cache import HistoryCache, TTLCache
+from .codec import get_codec
 
 class BaseAPI:
     """
     Base class to handle all the API calls to OpenAlgo.
+
+    A single pooled httpx.Client is shared by every REST mixin, so repeated
+    calls reuse keep-alive connections instead of paying a TCP/TLS handshake
+    per request. Call close() (or use the object as a context manager) to
+    release the pooled connections.
+
+    Optional client-side token buckets throttle order, quote and history
+    calls separately so bursts are queued instead of hitting HTTP 429.
     """
 
-    def __init__(self, api_key, host="http://127.0.0.1:5000", version="v1", timeout=120.0):
+    def __init__(self, api_key, host="http://127.0.0.1:5000", version="v1", timeout=120.0,
+                 max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0, http2=False,
+                 rate_limits=None, history_cache=None, reference_cache=None, json_codec="auto"):
         """
         Initialize the api object with an API key and optionally a host URL and API version.
 
@@ -20,6 +33,22 @@ class BaseAPI:
         - host (str): Base URL for the API endpoints. Defaults to localhost.
         - version (str): API version. Defaults to "v1".
         - timeout (float): Request timeout in seconds. Defaults to 120.0 seconds.
+        - max_connections (int): Maximum number of concurrent connections in the pool. Defaults to 100.
+        - max_keepalive_connections (int): Maximum number of idle connections kept alive. Defaults to 20.
+        - keepalive_expiry (float): Seconds an idle connection is kept open. Defaults to 30.0 seconds.
+        - http2 (bool): Enable HTTP/2. Requires the 'h2' package (pip install httpx[http2]). Defaults to False.
+        - rate_limits (dict, optional): Requests per second per endpoint group, e.g.
+          {'order': 10, 'quote': (50, 100), 'history': 3}. A tuple sets (rate, burst).
+          Groups: 'order' (place/modify/cancel...), 'quote' (quotes, depth), 'history'.
+          Defaults to None (no client-side limiting).
+        - history_cache (str or HistoryCache, optional): Directory (or HistoryCache instance) of a
+          local OHLCV store used by history() to download only ranges it has not seen before.
+          Defaults to None (no caching).
+        - reference_cache (bool, str or TTLCache, optional): Cache symbol(), search(), expiry() and
+          intervals() responses. True keeps them in memory, a file path also persists them across
+          restarts, and a TTLCache instance allows custom TTLs and size. Defaults to None (no caching).
+        - json_codec (str): JSON codec for request bodies, responses and feed frames: "auto" (msgspec or
+          orjson when installed, else the standard library), "msgspec", "orjson" or "json". Defaults to "auto".
         """
         self.api_key = api_key
         self.base_url = f"{host}/api/{version}/"
@@ -27,3 +56,138 @@ class BaseAPI:
             'Content-Type': 'application/json'
         }
         self.timeout = timeout
+        self.codec = get_codec(json_codec)
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.http2 = http2
+        self.client = self._create_client()
+        self.rate_limiters = build_rate_limiters(rate_limits)
+        if history_cache is not None and not isinstance(history_cache, HistoryCache):
+            history_cache = HistoryCache(history_cache)
+        self.history_cache = history_cache
+        if reference_cache is True:
+            reference_cache = TTLCache()
+        elif isinstance(reference_cache, str):
+            reference_cache = TTLCache(path=reference_cache)
+        elif reference_cache is False:
+            reference_cache = None
+        self.reference_cache = reference_cache
+
+    def _create_client(self):
+        """Create the pooled HTTP client shared by all REST mixins."""
+        return httpx.Client(limits=self.limits, http2=self.http2, timeout=self.timeout)
+
+    def close(self):
+        """Close the pooled HTTP client and release its connections."""
+        if not self.client.is_closed:
+            self.client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def rate_limit_status(self):
+        """
+        Get the current state of the client-side rate limiters.
+
+        Returns:
+        dict: {group: {'rate', 'burst', 'queue_depth', 'wait_time', 'total_requests', 'total_wait'}}
+        """
+        return {group: limiter.status() for group, limiter in self.rate_limiters.items()}
+
+    def _rate_limiter(self, endpoint):
+        """Return the limiter for an endpoint's group, if one is configured"""
+        if self.rate_limiters:
+            return self.rate_limiters.get(ENDPOINT_GROUPS.get(endpoint))
+        return None
+
+    def _make_request(self, endpoint, payload):
+        """Make HTTP request with proper error handling"""
+        url = self.base_url + endpoint
+        limiter = self._rate_limiter(endpoint)
+        if limiter:
+            limiter.acquire()
+        try:
+            response = self.client.post(url, content=self.codec.dumps(payload), headers=self.headers,
+                                        timeout=self.timeout)
+            return self._handle_response(response)
+        except Exception as e:
+            return self._handle_exception(e)
+
+    def _cached_request(self, endpoint, payload):
+        """Serve a reference-data request from reference_cache, falling back to the server"""
+        if self.reference_cache is None:
+            return self._make_request(endpoint, payload)
+        cached = self.reference_cache.get(endpoint, payload)
+        if cached is not None:
+            return cached
+        result = self._make_request(endpoint, payload)
+        if result.get('status') == 'success':
+            self.reference_cache.set(endpoint, payload, result)
+        return result
+
+    def _handle_exception(self, error):
+        """Map a transport exception to the standard error response"""
+        if isinstance(error, httpx.TimeoutException):
+            return {
+                'status': 'error',
+                'message': 'Request timed out. The server took too long to respond.',
+                'error_type': 'timeout_error'
+            }
+        if isinstance(error, httpx.ConnectError):
+            return {
+                'status': 'error',
+                'message': 'Failed to connect to the server. Please check if the server is running.',
+                'error_type': 'connection_error'
+            }
+        if isinstance(error, httpx.HTTPError):
+            return {
+                'status': 'error',
+                'message': f'HTTP error occurred: {str(error)}',
+                'error_type': 'http_error'
+            }
+        return {
+            'status': 'error',
+            'message': f'An unexpected error occurred: {str(error)}',
+            'error_type': 'unknown_error'
+        }
+
+    def _handle_response(self, response):
+        """Helper method to handle API responses"""
+        try:
+            if response.status_code != 200:
+                return {
+                    'status': 'error',
+                    'message': f'HTTP {response.status_code}: {response.text}',
+                    'code': response.status_code,
+                    'error_type': 'http_error'
+                }
+
+            data = self.codec.loads(response.content)
+            if data.get('status') == 'error':
+                return {
+                    'status': 'error',
+                    'message': data.get('message', 'Unknown error'),
+                    'code': response.status_code,
+                    'error_type': 'api_error'
+                }
+            return data
+
+        except ValueError:
+            return {
+                'status': 'error',
+                'message': 'Invalid JSON response from server',
+                'raw_response': response.text,
+                'error_type': 'json_error'
+            }
+        except Exception as e:
+            return {
+                'status': 'error',
+                'message': str(e),
+                'error_type': 'unknown_error'
+            }
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""
+OpenAlgo WebSocket Feed - Throughput and Latency Benchmark
+    https://docs.openalgo.in
+
+Usage:
+    python -m openalgo.benchmark --symbols 200 --modes 1 2 --rate 20000 --duration 10
+"""
+
+import argparse
+import multiprocessing
+import threading
+import time
+import numpy as np
+from .feed import FeedAPI
+from .mockserver import MockFeedServer, TickGenerator
+
+API_KEY = "benchmark-api-key-0000"
+
+def _serve(pipe, generator_settings):
+    """Run a MockFeedServer in a child process until the parent asks for its stats"""
+    server = MockFeedServer(api_key=API_KEY, generator=TickGenerator(**generator_settings)).start()
+    pipe.send(server.port)
+    pipe.recv()
+    stats = dict(server.stats)
+    server.stop()
+    pipe.send(stats)
+
+def run_feed_benchmark(symbols=100, modes=(1,), rate=10000, burst_rate=None, burst_every=1.0, burst_length=0.1,
+                       duration=10.0, warmup=1.0, json_codec="auto", batch_size=100, dispatcher_workers=None,
+                       server_process=True):
+    """
+    Measure FeedAPI against a local mock server streaming synthetic ticks.
+
+    Parameters:
+    - symbols (int): Instruments subscribed in every mode. Defaults to 100.
+    - modes (tuple): Feed modes to subscribe (1 LTP, 2 Quote, 3 Depth). Defaults to (1,).
+    - rate (float): Ticks per second sent by the server, 0 to send as fast as possible. Defaults to 10000.
+    - burst_rate, burst_every, burst_length: Burst profile, see TickGenerator.
+    - duration (float): Seconds measured. Defaults to 10.
+    - warmup (float): Seconds of traffic before measuring. Defaults to 1.
+    - json_codec (str): Codec of the client, see BaseAPI. Defaults to "auto".
+    - batch_size (int): Instruments per subscription frame. Defaults to 100.
+    - dispatcher_workers (int, optional): Run callbacks on a TickDispatcher with this many workers.
+    - server_process (bool): Run the server in a separate process so CPU time is the client's only.
+      Defaults to True.
+
+    Returns:
+    dict: {'ticks', 'seconds', 'ticks_per_second', 'ticks_sent', 'latency_ms': {'p50', 'p90', 'p99',
+    'p999', 'max'}, 'cpu_ms_per_1k_ticks', 'cpu_utilization', 'codec'}.
+    """
+    generator_settings = dict(rate=rate, burst_rate=burst_rate, burst_every=burst_every,
+                              burst_length=burst_length, precise_timestamps=True, seed=7)
+    if server_process:
+        pipe, child_pipe = multiprocessing.Pipe()
+        process = multiprocessing.get_context("spawn").Process(
+            target=_serve, args=(child_pipe, generator_settings), daemon=True)
+        process.start()
+        url = f"ws://127.0.0.1:{pipe.recv()}"
+    else:
+        server = MockFeedServer(api_key=API_KEY, generator=TickGenerator(**generator_settings)).start()
+        url = server.url
+
+    latencies = []
+    measuring = threading.Event()
+    clock = time.time
+
+    def on_data(data):
+        if measuring.is_set():
+            latencies.append(clock() * 1000 - data['data']['timestamp'])
+
+    client = FeedAPI(API_KEY, ws_url=url, json_codec=json_codec)
+    try:
+        if not client.connect():
+            raise ConnectionError(f"Could not connect to the mock server at {url}")
+        if dispatcher_workers:
+            client.start_dispatcher(workers=dispatcher_workers)
+        instruments = [{"exchange": "NSE", "symbol": f"SYM{i}"} for i in range(symbols)]
+        subscribe = {1: client.subscribe_ltp, 2: client.subscribe_quote, 3: client.subscribe_depth}
+        for mode in modes:
+            subscribe[mode](instruments, on_data_received=on_data, batch_size=batch_size)
+
+        time.sleep(warmup)
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        measuring.set()
+        time.sleep(duration)
+        measuring.clear()
+        seconds = time.perf_counter() - wall_start
+        cpu = time.process_time() - cpu_start
+    finally:
+        client.close()
+        if server_process:
+            pipe.send("stop")
+            server_stats = pipe.recv()
+            process.join(5)
+        else:
+            server_stats = dict(server.stats)
+            server.stop()
+
+    values = np.asarray(latencies, dtype=np.float64)
+    ticks = len(values)
+    percentiles = np.percentile(values, [50, 90, 99, 99.9]) if ticks else [float('nan')] * 4
+    return {
+        'ticks': ticks,
+        'seconds': seconds,
+        'ticks_per_second': ticks / seconds if seconds > 0 else 0.0,
+        'ticks_sent': server_stats['ticks_sent'],
+        'latency_ms': {
+            'p50': float(percentiles[0]),
+            'p90': float(percentiles[1]),
+            'p99': float(percentiles[2]),
+            'p999': float(percentiles[3]),
+            'max': float(values.max()) if ticks else float('nan'),
+        },
+        'cpu_ms_per_1k_ticks': cpu * 1000 / ticks * 1000 if ticks else float('nan'),
+        'cpu_utilization': cpu / seconds if seconds > 0 else 0.0,
+        'codec': client.codec.name,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the OpenAlgo WebSocket feed against a local mock server")
+    parser.add_argument("--symbols", type=int, default=100)
+    parser.add_argument("--modes", type=int, nargs="+", default=[1], choices=[1, 2, 3])
+    parser.add_argument("--rate", type=float, default=10000, help="ticks/s sent by the server, 0 for unlimited")
+    parser.add_argument("--burst-rate", type=float, default=None)
+    parser.add_argument("--burst-every", type=float, default=1.0)
+    parser.add_argument("--burst-length", type=float, default=0.1)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--warmup", type=float, default=1.0)
+    parser.add_argument("--codec", default="auto")
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=None, help="run callbacks on a dispatcher")
+    args = parser.parse_args(argv)
+
+    result = run_feed_benchmark(
+        symbols=args.symbols, modes=tuple(args.modes), rate=args.rate, burst_rate=args.burst_rate,
+        burst_every=args.burst_every, burst_length=args.burst_length, duration=args.duration,
+        warmup=args.warmup, json_codec=args.codec, batch_size=args.batch_size,
+        dispatcher_workers=args.workers)
+
+    latency = result['latency_ms']
+    print("\nFeed benchmark")
+    print("=" * 50)
+    print(f"Codec:              {result['codec']}")
+    print(f"Ticks received:     {result['ticks']} in {result['seconds']:.2f}s (server sent {result['ticks_sent']} in total)")
+    print(f"Sustained rate:     {result['ticks_per_second']:.0f} ticks/s")
+    print(f"Callback latency:   p50 {latency['p50']:.3f} ms | p90 {latency['p90']:.3f} ms | "
+          f"p99 {latency['p99']:.3f} ms | p99.9 {latency['p999']:.3f} ms | max {latency['max']:.3f} ms")
+    print(f"CPU per 1k ticks:   {result['cpu_ms_per_1k_ticks']:.2f} ms ({result['cpu_utilization']:.0%} of one core)")
+    return result
+
+if __name__ == "__main__":
+    main()
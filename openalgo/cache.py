@@ -0,0 +1,328 @@
+# -*- coding: utf-8 -*-
+"""
+OpenAlgo Local Caches - History and Reference Data
+    https://docs.openalgo.in
+"""
+
+import copy
+import json
+import os
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime, timedelta, timezone
+import numpy as np
+
+IST = timezone(timedelta(hours=5, minutes=30))
+EPOCH_DATE = date(1970, 1, 1)
+DAILY_INTERVALS = ('D', 'W', 'M')
+
+class HistoryCache:
+    """
+    On-disk OHLCV store for DataAPI.history(), keyed by (symbol, exchange, interval).
+
+    Each key is a directory holding one memory-mappable .npy file per column
+    (int64 epoch 'timestamp', int64 for integer fields such as volume, float64
+    for every other field, as history() would parse them) and a meta.json
+    with the date ranges already downloaded. history() asks for the missing
+    ranges only and reads everything else locally. The current IST trading
+    day is never marked as covered, so it is refreshed on every call.
+    """
+
+    def __init__(self, directory):
+        """
+        Attributes:
+        - directory (str): Root directory of the cache. Created if missing.
+        """
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        os.makedirs(self.directory, exist_ok=True)
+        self._lock = threading.RLock()
+
+    def _path(self, symbol, exchange, interval):
+        parts = [str(part).replace(os.sep, '_').replace(':', '_') for part in (exchange, symbol, interval)]
+        return os.path.join(self.directory, *parts)
+
+    def _meta(self, path):
+        try:
+            with open(os.path.join(path, 'meta.json'), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {'columns': [], 'ranges': []}
+
+    def ranges(self, symbol, exchange, interval):
+        """Return the downloaded date ranges as a list of (start, end) date objects"""
+        with self._lock:
+            meta = self._meta(self._path(symbol, exchange, interval))
+        return [(date.fromisoformat(start), date.fromisoformat(end)) for start, end in meta['ranges']]
+
+    def missing_ranges(self, symbol, exchange, interval, start_date, end_date):
+        """
+        Return the (start, end) date ranges inside [start_date, end_date]
+        that are not in the cache yet, as 'YYYY-MM-DD' strings.
+        """
+        start = _to_date(start_date)
+        end = _to_date(end_date)
+        missing = []
+        cursor = start
+        for covered_start, covered_end in self.ranges(symbol, exchange, interval):
+            if covered_end < cursor:
+                continue
+            if covered_start > end:
+                break
+            if covered_start > cursor:
+                missing.append((cursor, covered_start - timedelta(days=1)))
+            cursor = max(cursor, covered_end + timedelta(days=1))
+        if cursor <= end:
+            missing.append((cursor, end))
+        return [(s.isoformat(), e.isoformat()) for s, e in missing]
+
+    def update(self, symbol, exchange, interval, bars, fetched_ranges):
+        """
+        Merge freshly downloaded bars into the cache.
+
+        A range is only marked as downloaded between its first and last returned
+        bar, so a response the server cut short is fetched again next time. A
+        range that returned no bars at all (holidays, weekends) is marked whole.
+
+        Parameters:
+        - bars (list): Bar dicts as returned by the history endpoint.
+        - fetched_ranges (list): (start, end) date ranges the bars were downloaded for, one per request.
+        """
+        path = self._path(symbol, exchange, interval)
+        with self._lock:
+            os.makedirs(path, exist_ok=True)
+            meta = self._meta(path)
+            columns = self._read_columns(path, meta['columns'])
+
+            fields = list(meta['columns'])
+            for bar in bars:
+                for field in bar:
+                    if field not in fields:
+                        fields.append(field)
+            if 'timestamp' in fields:
+                fields.remove('timestamp')
+
+            size = len(columns.get('timestamp', ()))
+            new_ts = np.array([int(bar['timestamp']) for bar in bars], dtype=np.int64)
+            merged = {'timestamp': np.concatenate([columns.get('timestamp', np.empty(0, np.int64)), new_ts])}
+            for field in fields:
+                new = _column([bar.get(field) for bar in bars])
+                if field in columns:
+                    old = columns[field]
+                else:
+                    old = np.full(size, np.nan) if size else np.empty(0, dtype=new.dtype)
+                merged[field] = np.concatenate([old, new])
+
+            # Sort by timestamp; on duplicates the freshly downloaded bar wins
+            order = np.argsort(merged['timestamp'], kind='stable')
+            ts = merged['timestamp'][order]
+            keep = order[np.append(ts[1:] != ts[:-1], True)] if len(ts) else order
+            for name, values in merged.items():
+                self._write_array(path, name, values[keep])
+
+            # Never mark today (IST) as complete - the session may still be running
+            last_complete = datetime.now(IST).date() - timedelta(days=1)
+            ranges = [(date.fromisoformat(s), date.fromisoformat(e)) for s, e in meta['ranges']]
+            offset = 0 if interval in DAILY_INTERVALS else -int(IST.utcoffset(None).total_seconds())
+            bar_days = (new_ts - offset) // 86400
+            for start, end in fetched_ranges:
+                start, end = _to_date(start), _to_date(end)
+                returned = bar_days[(bar_days >= _day_number(start)) & (bar_days <= _day_number(end))]
+                if len(returned):
+                    start = EPOCH_DATE + timedelta(days=int(returned.min()))
+                    end = EPOCH_DATE + timedelta(days=int(returned.max()))
+                end = min(end, last_complete)
+                if start <= end:
+                    ranges.append((start, end))
+            meta = {'columns': fields, 'ranges': [[s.isoformat(), e.isoformat()] for s, e in _merge_ranges(ranges)]}
+            tmp = os.path.join(path, 'meta.json.tmp')
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+            os.replace(tmp, os.path.join(path, 'meta.json'))
+
+    def read(self, symbol, exchange, interval, start_date, end_date):
+        """
+        Read cached bars between start_date and end_date (inclusive, IST dates).
+
+        Returns:
+        dict: {'timestamp': int64 array, 'open': float64 array, 'volume': int64 array, ...}
+        """
+        path = self._path(symbol, exchange, interval)
+        with self._lock:
+            meta = self._meta(path)
+            columns = self._read_columns(path, meta['columns'], mmap_mode='r')
+        if 'timestamp' not in columns:
+            return {}
+
+        # Intraday epochs are UTC; daily epochs already encode the IST date
+        offset = 0 if interval in DAILY_INTERVALS else -int(IST.utcoffset(None).total_seconds())
+        lo = _epoch(_to_date(start_date)) + offset
+        hi = _epoch(_to_date(end_date) + timedelta(days=1)) + offset
+        ts = columns['timestamp']
+        i, j = np.searchsorted(ts, [lo, hi], side='left')
+        return {name: np.array(values[i:j]) for name, values in columns.items()}
+
+    def clear(self, symbol=None, exchange=None, interval=None):
+        """Remove one cached key, or the whole cache when called without arguments"""
+        with self._lock:
+            if symbol is None:
+                shutil.rmtree(self.directory, ignore_errors=True)
+                os.makedirs(self.directory, exist_ok=True)
+            else:
+                shutil.rmtree(self._path(symbol, exchange, interval), ignore_errors=True)
+
+    def _read_columns(self, path, fields, mmap_mode=None):
+        columns = {}
+        for name in ['timestamp'] + list(fields):
+            file = os.path.join(path, f'{name}.npy')
+            if os.path.exists(file):
+                columns[name] = np.load(file, mmap_mode=mmap_mode)
+        return columns
+
+    def _write_array(self, path, name, values):
+        tmp = os.path.join(path, f'{name}.tmp.npy')
+        np.save(tmp, np.ascontiguousarray(values))
+        os.replace(tmp, os.path.join(path, f'{name}.npy'))
+
+def _to_date(value):
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+def _column(values):
+    """Integer fields stay int64, as in the uncached DataFrame; anything else is float64 with NaN gaps"""
+    if all(type(value) is int for value in values):
+        return np.array(values, dtype=np.int64)
+    return np.array([_to_float(value) for value in values], dtype=np.float64)
+
+def _day_number(day):
+    return (day - EPOCH_DATE).days
+
+def _epoch(day):
+    return int(datetime(day.year, day.month, day.day, tzinfo=timezone.utc).timestamp())
+
+def _merge_ranges(ranges):
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + timedelta(days=1):
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+class TTLCache:
+    """
+    Size-bounded LRU cache with per-endpoint time-to-live for reference data
+    (symbol, search, expiry, intervals).
+
+    Only successful responses are stored. When a path is given the cache is
+    written through to a JSON file and reloaded on start-up, so restarts do
+    not refetch data that is still fresh.
+    """
+
+    DEFAULT_TTL = {
+        'symbol': 6 * 3600,
+        'search': 6 * 3600,
+        'expiry': 6 * 3600,
+        'intervals': 24 * 3600,
+    }
+
+    def __init__(self, ttl=None, maxsize=4096, path=None):
+        """
+        Attributes:
+        - ttl (dict, optional): Seconds to keep each endpoint's responses, merged over DEFAULT_TTL.
+        - maxsize (int): Maximum number of cached responses. Defaults to 4096.
+        - path (str, optional): JSON file used to persist the cache across restarts.
+        """
+        self.ttl = dict(self.DEFAULT_TTL, **(ttl or {}))
+        self.maxsize = maxsize
+        self.path = os.path.abspath(os.path.expanduser(path)) if path else None
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if self.path:
+            self._load()
+
+    @staticmethod
+    def _key(endpoint, params):
+        params = {name: value for name, value in params.items() if name != 'apikey' and value is not None}
+        return f"{endpoint}|{json.dumps(params, sort_keys=True, default=str)}"
+
+    def get(self, endpoint, params):
+        """Return a copy of the cached response, or None if missing or expired"""
+        key = self._key(endpoint, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.time():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return copy.deepcopy(entry[1])
+
+    def set(self, endpoint, params, value):
+        """Store a response if the endpoint is cacheable"""
+        ttl = self.ttl.get(endpoint)
+        if not ttl:
+            return
+        key = self._key(endpoint, params)
+        with self._lock:
+            self._entries[key] = (time.time() + ttl, copy.deepcopy(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            self._save()
+
+    def invalidate(self, endpoint=None, **params):
+        """
+        Drop cached responses.
+
+        - invalidate(): everything
+        - invalidate('symbol'): every cached symbol() response
+        - invalidate('symbol', symbol='RELIANCE', exchange='NSE'): one response
+        """
+        with self._lock:
+            if endpoint is None:
+                self._entries.clear()
+            elif params:
+                self._entries.pop(self._key(endpoint, params), None)
+            else:
+                prefix = f"{endpoint}|"
+                for key in [key for key in self._entries if key.startswith(prefix)]:
+                    del self._entries[key]
+            self._save()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return
+        now = time.time()
+        for key, expires_at, value in entries[-self.maxsize:]:
+            if expires_at > now:
+                self._entries[key] = (expires_at, value)
+
+    def _save(self):
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = f"{self.path}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump([[key, expires_at, value] for key, (expires_at, value) in self._entries.items()], f)
+        os.replace(tmp, self.path)
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+OpenAlgo JSON Codecs - REST Responses and Feed Frames
+    https://docs.openalgo.in
+"""
+
+import json
+from typing import Dict, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+def _default(obj):
+    """Serialize NumPy scalars (np.int64, np.float64, np.str_) that callers often pass in payloads"""
+    item = getattr(obj, 'item', None)
+    if item is not None:
+        return item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+class StdlibCodec:
+    """JSON codec backed by the standard library json module"""
+
+    name = "json"
+
+    def loads(self, data):
+        return json.loads(data)
+
+    def dumps(self, obj):
+        # Compact UTF-8, byte for byte what orjson and msgspec produce
+        return json.dumps(obj, default=_default, separators=(',', ':'), ensure_ascii=False).encode()
+
+    def decode_frame(self, data):
+        """Decode a WebSocket frame. Backends with typed decoding override this."""
+        return self.loads(data)
+
+class OrjsonCodec(StdlibCodec):
+    """JSON codec backed by orjson"""
+
+    name = "orjson"
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+    def dumps(self, obj):
+        return orjson.dumps(obj, default=_default)
+
+if msgspec is not None:
+    Number = Union[int, float]
+    UNSET = msgspec.UNSET
+
+    class _FrameStruct(msgspec.Struct, forbid_unknown_fields=True):
+        """
+        Dict-like access to a decoded frame. An absent field is UNSET and behaves like a missing key,
+        while a JSON null stays None, exactly as with a plain dict.
+        """
+
+        def get(self, name, default=None):
+            value = getattr(self, name, UNSET)
+            return default if value is UNSET else value
+
+        def __contains__(self, name):
+            return getattr(self, name, UNSET) is not UNSET
+
+        def __getitem__(self, name):
+            value = getattr(self, name, UNSET)
+            if value is UNSET:
+                raise KeyError(name)
+            return value
+
+    class Tick(_FrameStruct):
+        """Typed market_data payload. Supports .get(), [] and 'in' like the dict it replaces."""
+        ltp: Union[Number, None, msgspec.UnsetType] = UNSET
+        open: Union[Number, None, msgspec.UnsetType] = UNSET
+        high: Union[Number, None, msgspec.UnsetType] = UNSET
+        low: Union[Number, None, msgspec.UnsetType] = UNSET
+        close: Union[Number, None, msgspec.UnsetType] = UNSET
+        volume: Union[Number, None, msgspec.UnsetType] = UNSET
+        bid: Union[Number, None, msgspec.UnsetType] = UNSET
+        ask: Union[Number, None, msgspec.UnsetType] = UNSET
+        timestamp: Union[Number, None, msgspec.UnsetType] = UNSET
+        ltt: Union[int, str, None, msgspec.UnsetType] = UNSET
+        depth: Union[Dict, None, msgspec.UnsetType] = UNSET
+
+    class MarketDataFrame(_FrameStruct):
+        """Typed WebSocket frame envelope. Only market_data frames are decoded with it."""
+        type: str = ""
+        exchange: Union[str, None, msgspec.UnsetType] = UNSET
+        symbol: Union[str, None, msgspec.UnsetType] = UNSET
+        mode: Union[int, None, msgspec.UnsetType] = UNSET
+        data: Union[Tick, None, msgspec.UnsetType] = UNSET
+
+class MsgspecCodec(StdlibCodec):
+    """
+    JSON codec backed by msgspec.
+
+    decode_frame() decodes market_data frames straight into typed structs
+    (no intermediate dicts). Other frames, and market_data frames with fields
+    or types the structs do not cover, fall back to plain dicts, so every
+    codec hands the feed the same values.
+    """
+
+    name = "msgspec"
+
+    def __init__(self):
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder(enc_hook=_default)
+        self._frame_decoder = msgspec.json.Decoder(MarketDataFrame)
+
+    def loads(self, data):
+        try:
+            return self._decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    def dumps(self, obj):
+        return self._encoder.encode(obj)
+
+    def decode_frame(self, data):
+        try:
+            frame = self._frame_decoder.decode(data)
+        except msgspec.ValidationError:
+            return self.loads(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+        if frame.type != "market_data":
+            return self.loads(data)
+        return frame
+
+CODECS = {"json": StdlibCodec, "orjson": OrjsonCodec, "msgspec": MsgspecCodec}
+
+def available_codecs():
+    """Names of the codecs that can be used in this environment"""
+    names = ["json"]
+    if orjson is not None:
+        names.insert(0, "orjson")
+    if msgspec is not None:
+        names.insert(0, "msgspec")
+    return names
+
+def get_codec(codec="auto"):
+    """
+    Resolve a JSON codec.
+
+    Parameters:
+    - codec (str or object): "auto" (msgspec, then orjson, then json, whichever is installed),
+      "msgspec", "orjson", "json", or an object with loads()/dumps()/decode_frame().
+
+    Returns:
+    StdlibCodec: The codec instance.
+    """
+    if not isinstance(codec, str):
+        return codec
+    if codec == "auto":
+        codec = available_codecs()[0]
+    if codec not in CODECS:
+        raise ValueError(f"Unknown JSON codec '{codec}'. Use one of {list(CODECS)} or 'auto'.")
+    if codec not in available_codecs():
+        raise ImportError(f"JSON codec '{codec}' is not installed (pip install {codec})")
+    return CODECS[codec]()
@@ -4,10 +4,11 @@ OpenAlgo REST API Documentation - Data Methods
     https://docs.openalgo.in
 """
 
-import httpx
+import numpy as np
 import pandas as pd
 from datetime import datetime
 import time
+from concurrent.futures import ThreadPoolExecutor
 from .base import BaseAPI
 
 class DataAPI(BaseAPI):
@@ -16,72 +17,6 @@ class DataAPI(BaseAPI):
     Inherits from the BaseAPI class.
     """
 
-    def _make_request(self, endpoint, payload):
-        """Make HTTP request with proper error handling"""
-        url = self.base_url + endpoint
-        try:
-            response = httpx.post(url, json=payload, headers=self.headers, timeout=self.timeout)
-            return self._handle_response(response)
-        except httpx.TimeoutException:
-            return {
-                'status': 'error',
-                'message': 'Request timed out. The server took too long to respond.',
-                'error_type': 'timeout_error'
-            }
-        except httpx.ConnectError:
-            return {
-                'status': 'error',
-                'message': 'Failed to connect to the server. Please check if the server is running.',
-                'error_type': 'connection_error'
-            }
-        except httpx.HTTPError as e:
-            return {
-                'status': 'error',
-                'message': f'HTTP error occurred: {str(e)}',
-                'error_type': 'http_error'
-            }
-        except Exception as e:
-            return {
-                'status': 'error',
-                'message': f'An unexpected error occurred: {str(e)}',
-                'error_type': 'unknown_error'
-            }
-    
-    def _handle_response(self, response):
-        """Helper method to handle API responses"""
-        try:
-            if response.status_code != 200:
-                return {
-                    'status': 'error',
-                    'message': f'HTTP {response.status_code}: {response.text}',
-                    'code': response.status_code,
-                    'error_type': 'http_error'
-                }
-            
-            data = response.json()
-            if data.get('status') == 'error':
-                return {
-                    'status': 'error',
-                    'message': data.get('message', 'Unknown error'),
-                    'code': response.status_code,
-                    'error_type': 'api_error'
-                }
-            return data
-            
-        except ValueError:
-            return {
-                'status': 'error',
-                'message': 'Invalid JSON response from server',
-                'raw_response': response.text,
-                'error_type': 'json_error'
-            }
-        except Exception as e:
-            return {
-                'status': 'error',
-                'message': str(e),
-                'error_type': 'unknown_error'
-            }
-
     def quotes(self, *, symbol, exchange):
         """
         Get real-time quotes for a symbol.
@@ -100,6 +35,85 @@ class DataAPI(BaseAPI):
         }
         return self._make_request("quotes", payload)
 
+    def quotes_many(self, instruments, max_concurrency=10, format="dict"):
+        """
+        Get real-time quotes for many symbols concurrently over the pooled client.
+
+        Parameters:
+        - instruments (list): List of dicts with 'symbol' and 'exchange' keys. Required.
+        - max_concurrency (int): Maximum number of requests in flight. Defaults to 10.
+        - format (str): Shape of the successful quotes. Defaults to "dict".
+            - "dict": {'EXCHANGE:SYMBOL': quote_data, ...}
+            - "dataframe": pandas.DataFrame indexed by 'EXCHANGE:SYMBOL', one column per quote field
+            - "numpy": {'keys': [...], 'field': numpy.ndarray(float64), ...} aligned with 'keys'
+
+        Returns:
+        dict: {'status': 'success', 'data': <format>, 'errors': {'EXCHANGE:SYMBOL': error_dict, ...}}
+              status is 'error' only when no quote could be fetched.
+        """
+        keys, requests = self._instrument_requests(instruments)
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(requests) or 1))) as executor:
+            responses = list(executor.map(lambda req: self.quotes(**req) if req else None, requests))
+        return self._collect_quotes(keys, requests, responses, format)
+
+    def _instrument_requests(self, instruments):
+        """Build the 'EXCHANGE:SYMBOL' keys and symbol/exchange keyword arguments for an instrument list"""
+        keys = []
+        requests = []
+        for instrument in instruments:
+            symbol = instrument.get("symbol")
+            exchange = instrument.get("exchange")
+            keys.append(f"{exchange}:{symbol}")
+            requests.append({"symbol": symbol, "exchange": exchange} if symbol and exchange else None)
+        return keys, requests
+
+    def _collect_quotes(self, keys, requests, responses, format):
+        """Split per-instrument quote responses into successes and errors and shape the result"""
+        quotes = {}
+        errors = {}
+        for key, request, response in zip(keys, requests, responses):
+            if request is None:
+                errors[key] = {
+                    'status': 'error',
+                    'message': 'Instrument requires both symbol and exchange',
+                    'error_type': 'validation_error'
+                }
+            elif response.get('status') == 'success' and isinstance(response.get('data'), dict):
+                quotes[key] = response['data']
+            else:
+                errors[key] = response
+
+        if format == "dataframe":
+            data = pd.DataFrame.from_dict(quotes, orient='index')
+            data.index.name = 'symbol'
+        elif format == "numpy":
+            fields = []
+            for quote in quotes.values():
+                for field in quote:
+                    if field not in fields:
+                        fields.append(field)
+            data = {'keys': list(quotes)}
+            for field in fields:
+                column = np.full(len(quotes), np.nan)
+                for i, quote in enumerate(quotes.values()):
+                    try:
+                        column[i] = float(quote.get(field))
+                    except (TypeError, ValueError):
+                        pass
+                data[field] = column
+        else:
+            data = quotes
+
+        if errors and not quotes:
+            return {
+                'status': 'error',
+                'message': 'Failed to fetch quotes for all instruments',
+                'data': data,
+                'errors': errors,
+                'error_type': 'api_error'
+            }
+        return {'status': 'success', 'data': data, 'errors': errors}
+
     def depth(self, *, symbol, exchange):
         """
         Get market depth (order book) for a symbol.
@@ -134,7 +148,7 @@ class DataAPI(BaseAPI):
             "symbol": symbol,
             "exchange": exchange
         }
-        return self._make_request("symbol", payload)
+        return self._cached_request("symbol", payload)
         
     def search(self, *, query, exchange=None):
         """
@@ -163,9 +177,10 @@ class DataAPI(BaseAPI):
         if exchange:
             payload["exchange"] = exchange
             
-        return self._make_request("search", payload)
+        return self._cached_request("search", payload)
         
-    def history(self, *, symbol, exchange, interval, start_date, end_date):
+    def history(self, *, symbol, exchange, interval, start_date, end_date, chunk_days=None, max_concurrency=4,
+                use_cache=True, format="dataframe"):
         """
         Get historical data for a symbol in pandas DataFrame format.
 
@@ -176,13 +191,156 @@ class DataAPI(BaseAPI):
                        Use interval() method to get supported intervals.
         - start_date (str): Start date in format 'YYYY-MM-DD'. Required.
         - end_date (str): End date in format 'YYYY-MM-DD'. Required.
+        - chunk_days (int or str, optional): Split the date range into chunks of this many
+                       days and download them concurrently. "auto" picks a chunk size
+                       from the interval. Defaults to None (single request).
+        - max_concurrency (int): Maximum chunk requests in flight. Defaults to 4.
+        - use_cache (bool): Serve cached ranges from the client's history_cache and download
+                       only the missing ones. Ignored if no cache is configured. Defaults to True.
+        - format (str): "dataframe" (default) or "numpy". "numpy" skips pandas entirely and returns
+                       {'timestamp': int64 epoch seconds, 'open': float64, 'high': ..., 'low': ...,
+                        'close': ..., 'volume': ...} as contiguous arrays sorted by timestamp.
 
         Returns:
         pandas.DataFrame or dict: DataFrame with historical data if successful,
                                 error dict if failed. DataFrame has timestamp as index.
                                 For intraday data (non-daily timeframes), timestamps
                                 are converted to IST. Daily data is already in IST.
+                                With format="numpy", a dict of arrays; timestamps are
+                                left as the raw epoch seconds returned by the server.
+        """
+        payloads, missing = self._history_plan(symbol, exchange, interval, start_date, end_date, chunk_days, use_cache)
+        result = self._fetch_history(payloads, max_concurrency)
+        return self._finish_history(result, symbol, exchange, interval, start_date, end_date, missing, format)
+
+    def history_many(self, instruments, *, interval, start_date, end_date, max_concurrency=4, format="dict",
+                     use_cache=True):
+        """
+        Get historical data for many symbols concurrently over the pooled client.
+
+        Parameters:
+        - instruments (list): List of dicts with 'symbol' and 'exchange' keys. Required.
+        - interval (str): Time interval for the data. Required.
+        - start_date (str): Start date in format 'YYYY-MM-DD'. Required.
+        - end_date (str): End date in format 'YYYY-MM-DD'. Required.
+        - max_concurrency (int): Maximum number of requests in flight. Defaults to 4.
+        - format (str): Shape of the successful downloads. Defaults to "dict".
+            - "dict": {'EXCHANGE:SYMBOL': DataFrame, ...} as returned by history()
+            - "panel": {'timestamp': int64 (T,), 'symbols': [...], 'close': float64 (T, N), ...}
+              aligned on the union of all timestamps, NaN where a symbol has no bar
+        - use_cache (bool): Use the client's history_cache if configured. Defaults to True.
+
+        Returns:
+        dict: {'status': 'success', 'data': <format>, 'errors': {'EXCHANGE:SYMBOL': error_dict, ...}}
+              status is 'error' only when nothing could be fetched.
         """
+        keys, requests = self._instrument_requests(instruments)
+        options = {
+            "interval": interval,
+            "start_date": start_date,
+            "end_date": end_date,
+            "use_cache": use_cache,
+            "format": "numpy" if format == "panel" else "dataframe"
+        }
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(requests) or 1))) as executor:
+            responses = list(executor.map(lambda req: self.history(**req, **options) if req else None, requests))
+        return self._collect_history(keys, requests, responses, format)
+
+    def _collect_history(self, keys, requests, responses, format):
+        """Split per-instrument history responses into successes and errors and shape the result"""
+        frames = {}
+        errors = {}
+        for key, request, response in zip(keys, requests, responses):
+            if request is None:
+                errors[key] = {
+                    'status': 'error',
+                    'message': 'Instrument requires both symbol and exchange',
+                    'error_type': 'validation_error'
+                }
+            elif isinstance(response, dict) and 'status' in response:
+                errors[key] = response
+            else:
+                frames[key] = response
+
+        data = self._history_panel(frames) if format == "panel" else frames
+        if errors and not frames:
+            return {
+                'status': 'error',
+                'message': 'Failed to fetch history for all instruments',
+                'data': data,
+                'errors': errors,
+                'error_type': 'api_error'
+            }
+        return {'status': 'success', 'data': data, 'errors': errors}
+
+    @staticmethod
+    def _history_panel(arrays_by_key):
+        """Align per-symbol history arrays into (time x symbol) float64 panels padded with NaN"""
+        symbols = list(arrays_by_key)
+        if not symbols:
+            return {'timestamp': np.empty(0, dtype=np.int64), 'symbols': []}
+        timestamps = np.unique(np.concatenate([arrays['timestamp'] for arrays in arrays_by_key.values()]))
+
+        fields = []
+        for arrays in arrays_by_key.values():
+            for field in arrays:
+                if field != 'timestamp' and field not in fields:
+                    fields.append(field)
+
+        panel = {'timestamp': timestamps, 'symbols': symbols}
+        for field in fields:
+            panel[field] = np.full((len(timestamps), len(symbols)), np.nan)
+        for column, arrays in enumerate(arrays_by_key.values()):
+            rows = np.searchsorted(timestamps, arrays['timestamp'])
+            for field in fields:
+                if field in arrays:
+                    panel[field][rows, column] = arrays[field]
+        return panel
+
+    def _fetch_history(self, payloads, max_concurrency):
+        """Download every history payload, concurrently when there is more than one"""
+        if len(payloads) == 1:
+            return self._make_request("history", payloads[0])
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(payloads)))) as executor:
+            results = list(executor.map(lambda payload: self._make_request("history", payload), payloads))
+        return self._merge_history_results(results)
+
+    def _history_plan(self, symbol, exchange, interval, start_date, end_date, chunk_days, use_cache):
+        """
+        Work out which history payloads to request.
+
+        Returns (payloads, missing) where missing lists the date range of every
+        payload, all outside the history cache, or None when the cache is not used.
+        """
+        if self.history_cache is None or not use_cache:
+            return self._history_payloads(symbol, exchange, interval, start_date, end_date, chunk_days), None
+        missing = self.history_cache.missing_ranges(symbol, exchange, interval, start_date, end_date)
+        payloads = []
+        for missing_start, missing_end in missing:
+            payloads.extend(self._history_payloads(symbol, exchange, interval, missing_start, missing_end, chunk_days))
+        # Per request, so the cache can tell which chunk came back short
+        return payloads, [(payload['start_date'], payload['end_date']) for payload in payloads]
+
+    def _finish_history(self, result, symbol, exchange, interval, start_date, end_date, missing, format="dataframe"):
+        """Store downloaded bars in the history cache (if used) and build the DataFrame"""
+        if missing is not None and result.get('status') == 'success':
+            try:
+                if missing:
+                    self.history_cache.update(symbol, exchange, interval, result.get('data') or [], missing)
+                result = {
+                    'status': 'success',
+                    'data': self.history_cache.read(symbol, exchange, interval, start_date, end_date)
+                }
+            except Exception as e:
+                return {
+                    'status': 'error',
+                    'message': f'Failed to update history cache: {str(e)}',
+                    'error_type': 'cache_error'
+                }
+        return self._process_history(result, interval, format)
+
+    def _history_payloads(self, symbol, exchange, interval, start_date, end_date, chunk_days=None):
+        """Build one history payload per date chunk"""
         payload = {
             "apikey": self.api_key,
             "symbol": symbol,
@@ -191,11 +349,59 @@ class DataAPI(BaseAPI):
             "start_date": start_date,
             "end_date": end_date
         }
+        if not chunk_days:
+            return [payload]
 
-        result = self._make_request("history", payload)
-        
+        if chunk_days == "auto":
+            chunk_days = self._history_chunk_days(interval)
+        start = pd.Timestamp(start_date).date()
+        end = pd.Timestamp(end_date).date()
+        step = pd.Timedelta(days=int(chunk_days))
+
+        payloads = []
+        chunk_start = start
+        while chunk_start <= end:
+            chunk_end = min(chunk_start + step - pd.Timedelta(days=1), end)
+            payloads.append(dict(payload, start_date=chunk_start.isoformat(), end_date=chunk_end.isoformat()))
+            chunk_start = chunk_end + pd.Timedelta(days=1)
+        return payloads or [payload]
+
+    @staticmethod
+    def _history_chunk_days(interval):
+        """Interval-aware chunk size in days, sized to keep each response moderate"""
+        unit = interval[-1:]
+        try:
+            multiplier = int(interval[:-1] or 1)
+        except ValueError:
+            multiplier = 1
+        if unit == 's':
+            return max(1, multiplier)
+        if unit == 'm':
+            return min(365, 30 * multiplier)
+        if unit == 'h':
+            return min(1825, 180 * multiplier)
+        # Daily, weekly and monthly bars fit in a single request
+        return 36500
+
+    @staticmethod
+    def _merge_history_results(results):
+        """Concatenate chunked history responses; the first failed chunk fails the whole request"""
+        if not results:
+            return {'status': 'success', 'data': []}
+        data = []
+        for result in results:
+            if result.get('status') != 'success':
+                return result
+            data.extend(result.get('data') or [])
+        return {'status': 'success', 'data': data}
+
+    def _process_history(self, result, interval, format="dataframe"):
+        """Convert a raw history response into a timestamp-indexed DataFrame (or NumPy arrays)"""
         if result.get('status') == 'success' and 'data' in result:
             try:
+                if format == "numpy":
+                    return self._history_arrays(result['data'])
+
                 df = pd.DataFrame(result['data'])
                 if df.empty:
                     return {
@@ -214,9 +420,11 @@ class DataAPI(BaseAPI):
                 # Set timestamp as index
                 df.set_index('timestamp', inplace=True)
                 
-                # Sort index and remove duplicates
-                df = df.sort_index()
-                df = df[~df.index.duplicated(keep='first')]
+                # Sort index and remove duplicates (skipped when already in order)
+                if not df.index.is_monotonic_increasing:
+                    df = df.sort_index()
+                if not df.index.is_unique:
+                    df = df[~df.index.duplicated(keep='first')]
                 
                 return df
             except Exception as e:
@@ -228,6 +436,43 @@ class DataAPI(BaseAPI):
                 }
         return result
 
+    @staticmethod
+    def _history_arrays(data):
+        """
+        Convert history bars to contiguous NumPy columns without going through pandas.
+        Accepts a list of bar dicts or a dict of columns.
+        """
+        if isinstance(data, dict):
+            columns = data
+            timestamps = np.asarray(columns.get('timestamp', []), dtype=np.int64)
+        else:
+            columns = None
+            timestamps = np.array([bar['timestamp'] for bar in data], dtype=np.int64)
+
+        if len(timestamps) == 0:
+            return {
+                'status': 'error',
+                'message': 'No data available for the specified period',
+                'error_type': 'no_data'
+            }
+
+        fields = [field for field in (columns if columns is not None else data[0]) if field != 'timestamp']
+        arrays = {'timestamp': timestamps}
+        for field in fields:
+            if columns is not None:
+                arrays[field] = np.asarray(columns[field], dtype=np.float64)
+            else:
+                arrays[field] = np.array([bar.get(field) for bar in data], dtype=np.float64)
+
+        # Strictly increasing timestamps are already sorted and unique
+        if len(timestamps) > 1 and not np.all(timestamps[1:] > timestamps[:-1]):
+            order = np.argsort(timestamps, kind='stable')
+            sorted_ts = timestamps[order]
+            order = order[np.concatenate(([True], sorted_ts[1:] != sorted_ts[:-1]))]
+            arrays = {name: values[order] for name, values in arrays.items()}
+
+        return {name: np.ascontiguousarray(values) for name, values in arrays.items()}
+
     def intervals(self):
         """
         Get supported time intervals for historical data from the API.
@@ -239,7 +484,7 @@ class DataAPI(BaseAPI):
         payload = {
             "apikey": self.api_key
         }
-        return self._make_request("intervals", payload)
+        return self._cached_request("intervals", payload)
         
     def interval(self):
         """
@@ -269,4 +514,4 @@ class DataAPI(BaseAPI):
             "exchange": exchange,
             "instrumenttype": instrumenttype
         }
-        return self._make_request("expiry", payload)
+        return self._cached_request("expiry", payload)
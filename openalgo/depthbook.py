@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+OpenAlgo WebSocket Feed - Columnar Market Depth Book
+    https://docs.openalgo.in
+"""
+
+import numpy as np
+from openalgo.numba_shim import jit
+
+PRICE, QTY, ORDERS = 0, 1, 2
+BID, ASK = 0, 1
+METRICS = ('mid', 'microprice', 'spread', 'imbalance')
+
+@jit(nopython=True)
+def _book_metrics(book, out):
+    """
+    Derive mid, microprice, spread and depth imbalance from one (2, levels, 3) book.
+
+    The microprice weights the best bid and ask by the opposite side's top
+    quantity; the imbalance is (bid qty - ask qty) / (bid qty + ask qty) over
+    all levels. Values are NaN when a side is empty.
+    """
+    bid = book[0, 0, 0]
+    ask = book[1, 0, 0]
+    bid_qty = book[0, 0, 1]
+    ask_qty = book[1, 0, 1]
+    if bid > 0.0 and ask > 0.0:
+        out[0] = (bid + ask) / 2.0
+        top = bid_qty + ask_qty
+        if top > 0.0:
+            out[1] = (bid * ask_qty + ask * bid_qty) / top
+        else:
+            out[1] = out[0]
+        out[2] = ask - bid
+    else:
+        out[0] = np.nan
+        out[1] = np.nan
+        out[2] = np.nan
+
+    total_bid = 0.0
+    total_ask = 0.0
+    for level in range(book.shape[1]):
+        if book[0, level, 1] > 0.0:
+            total_bid += book[0, level, 1]
+        if book[1, level, 1] > 0.0:
+            total_ask += book[1, level, 1]
+    total = total_bid + total_ask
+    out[3] = (total_bid - total_ask) / total if total > 0.0 else np.nan
+
+@jit(nopython=True)
+def _all_metrics(books, out):
+    for i in range(books.shape[0]):
+        _book_metrics(books[i], out[i])
+
+class DepthBook:
+    """
+    Market depth of many instruments in one preallocated NumPy array.
+
+    books has shape (instruments, 2, levels, 3): side 0 is bids and side 1 asks,
+    and each level holds (price, quantity, orders). Rows are indexed by the
+    feed's symbol IDs and overwritten in place on every depth update. metrics
+    has shape (instruments, 4) with mid, microprice, spread and imbalance, and
+    a compiled kernel refreshes an instrument's row on each update.
+
+    The arrays are reallocated (doubled) when an ID beyond the capacity
+    arrives, so re-read books/metrics rather than holding on to old views.
+    """
+
+    def __init__(self, levels=5, capacity=256):
+        """
+        Attributes:
+        - levels (int): Depth levels kept per side. Defaults to 5.
+        - capacity (int): Initial number of instrument rows. Defaults to 256.
+        """
+        self.levels = int(levels)
+        self.books = np.full((capacity, 2, self.levels, 3), np.nan)
+        self.metrics = np.full((capacity, len(METRICS)), np.nan)
+        self.ltp = np.full(capacity, np.nan)
+        self.timestamp = np.zeros(capacity, dtype=np.int64)
+        self.updates = np.zeros(capacity, dtype=np.int64)
+
+    def _ensure(self, symbol_id):
+        capacity = len(self.books)
+        if symbol_id < capacity:
+            return
+        while capacity <= symbol_id:
+            capacity *= 2
+        for name in ('books', 'metrics', 'ltp', 'timestamp', 'updates'):
+            old = getattr(self, name)
+            new = np.full((capacity,) + old.shape[1:], np.nan if old.dtype.kind == 'f' else 0, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def update(self, symbol_id, buy, sell, ltp=np.nan, timestamp=0):
+        """
+        Overwrite an instrument's book from depth levels and refresh its metrics.
+
+        Parameters:
+        - symbol_id (int): Row of the instrument (the feed's symbol ID).
+        - buy, sell (list): Levels as dicts with 'price', 'quantity' and 'orders', best first.
+        """
+        self._ensure(symbol_id)
+        book = self.books[symbol_id]
+        for side, levels in ((BID, buy or ()), (ASK, sell or ())):
+            rows = book[side]
+            count = min(len(levels), self.levels)
+            for i in range(count):
+                level = levels[i]
+                row = rows[i]
+                row[PRICE] = _number(level.get('price'))
+                row[QTY] = _number(level.get('quantity'))
+                row[ORDERS] = _number(level.get('orders'))
+            if count < self.levels:
+                rows[count:] = np.nan
+        self.ltp[symbol_id] = _number(ltp)
+        self.timestamp[symbol_id] = int(timestamp or 0)
+        self.updates[symbol_id] += 1
+        _book_metrics(book, self.metrics[symbol_id])
+
+    def clear(self, symbol_id):
+        """Forget an instrument's book, e.g. after unsubscribing"""
+        if symbol_id is None or symbol_id >= len(self.books):
+            return
+        self.books[symbol_id] = np.nan
+        self.metrics[symbol_id] = np.nan
+        self.ltp[symbol_id] = np.nan
+        self.timestamp[symbol_id] = 0
+        self.updates[symbol_id] = 0
+
+    def book(self, symbol_id):
+        """Return the (2, levels, 3) view of an instrument's book"""
+        return self.books[symbol_id]
+
+    def get_metrics(self, symbol_id):
+        """Return {'mid', 'microprice', 'spread', 'imbalance'} for an instrument"""
+        return {name: float(value) for name, value in zip(METRICS, self.metrics[symbol_id])}
+
+    def refresh(self):
+        """Recompute the metrics of every row with the compiled kernel"""
+        _all_metrics(self.books, self.metrics)
+        return self.metrics
+
+def _number(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""
+OpenAlgo WebSocket Feed - Callback Dispatcher
+    https://docs.openalgo.in
+"""
+
+import asyncio
+import inspect
+import threading
+import time
+from collections import deque
+
+OVERFLOW_POLICIES = ('block', 'drop_oldest', 'conflate')
+
+class TickDispatcher:
+    """
+    Hands feed callbacks off the WebSocket reader thread.
+
+    Ticks are queued on bounded per-worker queues and delivered by a pool of
+    worker threads, or on an asyncio event loop when one is given. Every
+    instrument is pinned to one worker, so ticks for the same instrument are
+    delivered in order.
+
+    Overflow policies when a worker queue is full:
+    - 'block': the reader waits for space (no tick is lost).
+    - 'drop_oldest': the oldest queued tick is discarded.
+    - 'conflate': a queued tick for the same instrument is replaced by the new one;
+      if the instrument is not queued, the oldest tick is discarded.
+    """
+
+    def __init__(self, workers=1, maxsize=10000, overflow='block', loop=None, late_threshold=1.0):
+        """
+        Attributes:
+        - workers (int): Number of worker threads. Defaults to 1.
+        - maxsize (int): Maximum queued ticks per worker. Defaults to 10000.
+        - overflow (str): 'block', 'drop_oldest' or 'conflate'. Defaults to 'block'.
+        - loop (asyncio.AbstractEventLoop, optional): Run callbacks on this loop. Coroutine callbacks
+          are awaited; a worker waits for each callback to finish before taking the next tick.
+        - late_threshold (float): Seconds a tick may wait in the queue (receipt to dequeue) before it counts
+          as late. The callback's own run time is reported separately as max_callback_time.
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}, got '{overflow}'")
+        self.workers = max(1, int(workers))
+        self.maxsize = max(1, int(maxsize))
+        self.overflow = overflow
+        self.loop = loop
+        self.late_threshold = late_threshold
+
+        self.delivered = 0
+        self.dropped = 0
+        self.conflated = 0
+        self.late = 0
+        self.errors = 0
+        self.max_latency = 0.0
+        self.max_callback_time = 0.0
+
+        self._queues = [deque() for _ in range(self.workers)]
+        self._pending = [{} for _ in range(self.workers)]  # key -> queued item, for conflation
+        self._conditions = [threading.Condition() for _ in range(self.workers)]
+        self._stats_lock = threading.Lock()
+        self._running = True
+        self._threads = []
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._run, args=(index,), name=f"openalgo-dispatch-{index}")
+            thread.daemon = True
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, key, callback, data, route=None):
+        """
+        Queue a callback invocation.
+
+        Parameters:
+        - key (hashable): Instrument key, e.g. (mode, 'NSE:RELIANCE'). Used for ordering and conflation.
+        - callback (callable): Function or coroutine function taking the tick dict.
+        - data (dict): Tick passed to the callback.
+        - route (hashable, optional): Picks the worker instead of key, e.g. the symbol alone so that
+          every mode of an instrument is delivered in order by one worker. Defaults to key.
+
+        Returns:
+        bool: False if the dispatcher has been stopped.
+        """
+        if not self._running:
+            return False
+        index = hash(key if route is None else route) % self.workers
+        queue, pending, condition = self._queues[index], self._pending[index], self._conditions[index]
+        item = [key, callback, data, time.monotonic()]
+        with condition:
+            if self.overflow == 'conflate' and key in pending:
+                # Keep the queue position and receipt time of the older tick
+                pending[key][1:3] = callback, data
+                self._count('conflated')
+                return True
+            while len(queue) >= self.maxsize:
+                if self.overflow == 'block':
+                    condition.wait(0.1)
+                    if not self._running:
+                        return False
+                    continue
+                dropped = queue.popleft()
+                if pending.get(dropped[0]) is dropped:
+                    del pending[dropped[0]]
+                self._count('dropped')
+            queue.append(item)
+            if self.overflow == 'conflate':
+                pending[key] = item
+            condition.notify_all()
+        return True
+
+    def _run(self, index):
+        queue, pending, condition = self._queues[index], self._pending[index], self._conditions[index]
+        while True:
+            with condition:
+                while not queue and self._running:
+                    condition.wait()
+                if not queue:
+                    return
+                item = queue.popleft()
+                if pending.get(item[0]) is item:
+                    del pending[item[0]]
+                condition.notify_all()
+            key, callback, data, received = item
+            started = time.monotonic()
+            latency = started - received
+            try:
+                if self.loop is not None:
+                    asyncio.run_coroutine_threadsafe(_call(callback, data), self.loop).result()
+                else:
+                    callback(data)
+            except Exception as e:
+                self._count('errors')
+                print(f"Error in feed callback for {key}: {e}")
+            callback_time = time.monotonic() - started
+            with self._stats_lock:
+                self.delivered += 1
+                self.max_latency = max(self.max_latency, latency)
+                self.max_callback_time = max(self.max_callback_time, callback_time)
+                if latency > self.late_threshold:
+                    self.late += 1
+
+    def _count(self, name):
+        with self._stats_lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    @property
+    def queue_depth(self):
+        """Number of ticks waiting for delivery"""
+        return sum(len(queue) for queue in self._queues)
+
+    def stats(self):
+        """
+        Get dispatcher counters.
+
+        Returns:
+        dict: queue_depth, delivered, dropped, conflated, late, errors, max_latency (longest queue
+        wait, seconds) and max_callback_time (longest callback run, seconds).
+        """
+        with self._stats_lock:
+            return {
+                'queue_depth': self.queue_depth,
+                'delivered': self.delivered,
+                'dropped': self.dropped,
+                'conflated': self.conflated,
+                'late': self.late,
+                'errors': self.errors,
+                'max_latency': self.max_latency,
+                'max_callback_time': self.max_callback_time,
+            }
+
+    def stop(self, timeout=5.0):
+        """Deliver the queued ticks (within timeout) and stop the workers"""
+        self._running = False
+        for condition in self._conditions:
+            with condition:
+                condition.notify_all()
+        deadline = time.monotonic() + timeout
+        for thread in self._threads:
+            if thread is not threading.current_thread():
+                thread.join(max(0.0, deadline - time.monotonic()))
+
+async def _call(callback, data):
+    result = callback(data)
+    if inspect.isawaitable(result):
+        await result
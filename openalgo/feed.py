@@ -4,12 +4,109 @@ OpenAlgo WebSocket API Documentation - Feed Methods
     https://docs.openalgo.in
 """
 
-import json
+import asyncio
+import logging
+import os
+import random
 import threading
 import time
-from typing import List, Dict, Any, Callable, Optional
+from typing import List, Dict, Any, Callable, Mapping, Optional
 import websocket
 from .base import BaseAPI
+from .dispatch import TickDispatcher
+from .tickstore import TickRing
+from .bars import BarBuilder
+from .symbols import SymbolRegistry, SymbolKeyedView
+from .depthbook import DepthBook
+from .sharedring import TickPublisher
+from .recorder import TickRecorder, TickLog, replay
+
+class TickLogger:
+    """
+    Level-gated, rate-limited sink for per-tick feed log lines.
+
+    The feed only formats a line after allow() has returned True, so a
+    disabled level or an exhausted rate budget costs a comparison per tick.
+    Lines over the budget are counted and reported once the next window opens.
+    """
+
+    def __init__(self, sink=print, level=logging.INFO, max_per_second=10):
+        """
+        Attributes:
+        - sink (callable or logging.Logger): Receives each formatted line. A Logger is called
+          with logger.log(level, line). Defaults to print.
+        - level (int): Minimum level to emit; logging.INFO logs one line per tick,
+          logging.DEBUG adds the full depth tables. Defaults to logging.INFO.
+        - max_per_second (int, optional): Maximum lines per second, None for no limit. Defaults to 10.
+        """
+        self.sink = sink
+        self.level = level
+        self.max_per_second = max_per_second
+        self.suppressed = 0
+        self._window = 0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def allow(self, level):
+        """Return True if a line at this level should be formatted and emitted now"""
+        if level < self.level:
+            return False
+        if self.max_per_second is None:
+            return True
+        window = int(time.monotonic())
+        with self._lock:
+            if window != self._window:
+                suppressed, self.suppressed = self.suppressed, 0
+                self._window = window
+                self._count = 0
+                if suppressed:
+                    self._write(logging.WARNING, f"Tick log: suppressed {suppressed} lines")
+            if self._count >= self.max_per_second:
+                self.suppressed += 1
+                return False
+            self._count += 1
+            return True
+
+    def emit(self, level, line):
+        """Write a line to the sink"""
+        self._write(level, line)
+
+    def _write(self, level, line):
+        try:
+            if isinstance(self.sink, logging.Logger):
+                self.sink.log(level, line)
+            else:
+                self.sink(line)
+        except Exception as e:
+            print(f"Error in tick log sink: {e}")
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float('nan')
+
+def _best_price(levels):
+    """Price of the first depth level, or NaN if the side is empty"""
+    return _to_float(levels[0].get('price')) if levels else float('nan')
+
+def _format_depth(symbol_key, depth_data):
+    """Format a depth update as buy and sell tables"""
+    lines = [f"\nDepth {symbol_key} - LTP: {depth_data.get('ltp')}"]
+    for side, label in (('buy', 'BUY'), ('sell', 'SELL')):
+        levels = depth_data.get('depth', {}).get(side, [])
+        lines.append(f"\n{label} DEPTH:")
+        lines.append("-" * 40)
+        lines.append(f"{'Level':<6} {'Price':<10} {'Quantity':<10} {'Orders':<10}")
+        lines.append("-" * 40)
+        if levels:
+            for i, level in enumerate(levels):
+                lines.append(f"{i+1:<6} {level.get('price', 'N/A'):<10} {level.get('quantity', 'N/A'):<10} "
+                             f"{level.get('orders', 'N/A'):<10}")
+        else:
+            lines.append(f"No {side} depth data available")
+    lines.append("-" * 40)
+    return "\n".join(lines)
 
 class FeedAPI(BaseAPI):
     """
@@ -17,7 +114,10 @@ class FeedAPI(BaseAPI):
     Inherits from the BaseAPI class.
     """
 
-    def __init__(self, api_key, host="http://127.0.0.1:5000", version="v1", ws_port=8765, ws_url=None):
+    MODE_NAMES = {1: "LTP", 2: "Quote", 3: "Market Depth"}
+    MODE_CODES = {"LTP": 1, "QUOTE": 2, "Quote": 2, "DEPTH": 3, "Depth": 3}
+
+    def __init__(self, api_key, host="http://127.0.0.1:5000", version="v1", ws_port=8765, ws_url=None, **kwargs):
         """
         Initialize the FeedAPI object with API key and optionally a host URL, API version, and WebSocket details.
 
@@ -27,8 +127,11 @@ class FeedAPI(BaseAPI):
         - version (str): API version. Defaults to "v1".
         - ws_port (int): WebSocket server port. Defaults to 8765.
         - ws_url (str, optional): Custom WebSocket URL. If provided, this overrides host and ws_port settings.
+        - **kwargs: HTTP client settings passed through to BaseAPI
+          (timeout, max_connections, max_keepalive_connections, keepalive_expiry, http2, rate_limits, history_cache,
+          reference_cache, json_codec).
         """
-        super().__init__(api_key, host, version)
+        super().__init__(api_key, host, version, **kwargs)
         
         # WebSocket configuration
         self.ws_port = ws_port
@@ -55,14 +158,78 @@ class FeedAPI(BaseAPI):
         self.authenticated = False
         self.ws_thread = None
         
+        # Connection state signalling (see wait_until_ready)
+        self._state_condition = threading.Condition(threading.RLock())
+        self._ready_event = threading.Event()
+        self._ready_waiters = []  # (loop, asyncio.Event) pairs for wait_until_ready_async
+        self._socket_closed = False
+        self._auth_status = None
+        
         # Message management
         self.message_queue = []
         self.lock = threading.Lock()
+
+        # Current subscription set per mode, replayed after a reconnect
+        self.subscriptions = {1: set(), 2: set(), 3: set()}  # Structure: {mode: {(exchange, symbol), ...}}
+        
+        # Auto-reconnect state (see connect)
+        self.auto_reconnect = False
+        self.reconnect_delay = 0.5
+        self.max_reconnect_delay = 30.0
+        self.max_reconnect_attempts = None
+        self.resubscribe_batch_size = 100
+        self.reconnect_stats = {'disconnects': 0, 'reconnects': 0, 'attempts': 0, 'last_gap_ms': 0.0,
+                                'max_gap_ms': 0.0, 'total_gap_ms': 0.0, 'last_disconnect': None}
+        self._closing = threading.Event()
+        self._reconnecting = False
+        self._disconnected_at = 0.0
+
+        # Subscription acknowledgements and flow control for batched subscriptions
+        self.subscription_acks = {}  # Structure: {(mode, 'EXCHANGE:SYMBOL'): 'pending' | 'success' | 'error'}
+        self.max_inflight_frames = 8
+        self.ack_timeout = 5.0
+        self._inflight_frames = 0
+        self._ack_condition = threading.Condition()
         
         # Data storage
-        self.ltp_data = {}  # Structure: {'EXCHANGE:SYMBOL': {'price': price, 'timestamp': timestamp}}
-        self.quotes_data = {}  # Structure: {'EXCHANGE:SYMBOL': {'open': open, 'high': high, 'low': low, 'close': close, 'ltp': ltp, 'timestamp': timestamp}}
-        self.depth_data = {}  # Structure: {'EXCHANGE:SYMBOL': {'ltp': ltp, 'timestamp': timestamp, 'depth': {'buy': [...], 'sell': [...]}}}
+        # Instruments get dense integer IDs at subscribe time; the stores are keyed by ID
+        # (ltp_data/quotes_data/depth_data are read-only views of them keyed by 'EXCHANGE:SYMBOL')
+        self.symbols = SymbolRegistry()
+        self._ltp_store = {}  # Structure: {symbol_id: {'price': price, 'timestamp': timestamp}}
+        self._quote_store = {}  # Structure: {symbol_id: {'open': open, 'high': high, 'low': low, 'close': close, 'ltp': ltp, 'timestamp': timestamp}}
+        self._depth_store = {}  # Structure: {symbol_id: {'ltp': ltp, 'timestamp': timestamp, 'depth': {'buy': [...], 'sell': [...]}}}
+        self._stores = {1: self._ltp_store, 2: self._quote_store, 3: self._depth_store}
+        self._ltp_view = SymbolKeyedView(self.symbols, self._ltp_store)
+        self._quote_view = SymbolKeyedView(self.symbols, self._quote_store)
+        self._depth_view = SymbolKeyedView(self.symbols, self._depth_store)
+        
+        # Per-tick console logging, off by default (see set_tick_logging)
+        self.tick_logger = None
+        
+        # Optional dispatcher that runs callbacks off the WebSocket thread (see start_dispatcher)
+        self.dispatcher = None
+        
+        # Conflated modes: {mode: set of symbol IDs changed since the last drain()}
+        self.conflation = {}
+        
+        # Optional per-instrument tick ring buffers (see enable_tick_store)
+        self.tick_stores = {}  # Structure: {symbol_id: TickRing}
+        self.tick_store_modes = ()
+        self.tick_store_capacity = 10000
+        
+        # Optional binary frame recorder (see start_recording)
+        self.recorder = None
+        
+        # Optional shared-memory tick publisher (see enable_publisher)
+        self.publisher = None
+        
+        # Optional columnar depth book (see enable_depth_book)
+        self.depth_book = None
+        
+        # Optional streaming bar builder (see enable_bars)
+        self.bar_builder = None
+        self.bar_modes = ()
+        self._bar_flush_stop = None
         
         # Callback registry
         self.ltp_callback = None
@@ -70,78 +237,248 @@ class FeedAPI(BaseAPI):
         self.quotes_callback = None
         self.depth_callback = None
 
-    def connect(self) -> bool:
+    def connect(self, auto_reconnect: bool = False, reconnect_delay: float = 0.5,
+                max_reconnect_delay: float = 30.0, max_reconnect_attempts: Optional[int] = None) -> bool:
         """
         Connect to the WebSocket server and authenticate.
         
+        Args:
+            auto_reconnect: Reconnect automatically when the connection drops, re-authenticate and
+                resubscribe all current subscriptions. Defaults to False.
+            reconnect_delay: Initial reconnect delay in seconds, doubled after every failed attempt
+                and randomised (jitter) so that many clients do not reconnect in lockstep.
+            max_reconnect_delay: Upper bound for the reconnect delay in seconds.
+            max_reconnect_attempts: Give up after this many failed attempts. Defaults to None (keep trying).
+        
         Returns:
             bool: True if connection and authentication are successful, False otherwise.
         """
+        self.auto_reconnect = auto_reconnect
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.max_reconnect_attempts = max_reconnect_attempts
+        self._closing.clear()
         try:
-            def on_message(ws, message):
-                self._process_message(message)
-                
-            def on_error(ws, error):
-                print(f"WebSocket error: {error}")
-                
-            def on_open(ws):
-                print(f"Connected to {self.ws_url}")
-                self.connected = True
-                self._authenticate()
-                
-            def on_close(ws, close_status_code, close_reason):
-                print(f"Disconnected from {self.ws_url}")
-                self.connected = False
-                self.authenticated = False
+            self._open_socket()
+            return self._wait_for_handshake(5)
             
-            # Initialize WebSocket connection
-            self.ws = websocket.WebSocketApp(
-                self.ws_url,
-                on_message=on_message,
-                on_error=on_error,
-                on_open=on_open,
-                on_close=on_close
-            )
+        except Exception as e:
+            print(f"Error connecting to WebSocket: {e}")
+            return False
+
+    def _wait_for_handshake(self, timeout: float) -> bool:
+        """Wait for the socket opened by _open_socket() to connect and authenticate."""
+        # Wait for connection to establish (or the attempt to fail)
+        if not self._wait_until(lambda: self.connected or self._socket_closed, timeout) or not self.connected:
+            print("Failed to connect to the WebSocket server")
+            return False
+            
+        # Wait for the authentication response
+        self._wait_until(lambda: self._auth_status is not None or not self.connected, timeout)
+        return self.authenticated
+
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the feed is connected and authenticated.
+
+        Args:
+            timeout: Maximum seconds to wait. Defaults to None (wait indefinitely).
+
+        Returns:
+            bool: True if the feed is ready, False on timeout.
+        """
+        return self._ready_event.wait(timeout)
+
+    async def wait_until_ready_async(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait on the running asyncio loop until the feed is connected and authenticated.
+
+        Args:
+            timeout: Maximum seconds to wait. Defaults to None (wait indefinitely).
+
+        Returns:
+            bool: True if the feed is ready, False on timeout.
+        """
+        if self._ready_event.is_set():
+            return True
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._state_condition:
+            self._ready_waiters.append(waiter)
+        try:
+            if self._ready_event.is_set():
+                return True
+            await asyncio.wait_for(waiter[1].wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            with self._state_condition:
+                self._ready_waiters.remove(waiter)
+
+    def _set_state(self, connected: Optional[bool] = None, authenticated: Optional[bool] = None) -> None:
+        """Update the connection state and wake every thread or coroutine waiting on it."""
+        with self._state_condition:
+            if connected is not None:
+                self.connected = connected
+            if authenticated is not None:
+                self.authenticated = authenticated
+            if self.connected and self.authenticated:
+                self._ready_event.set()
+                for loop, event in self._ready_waiters:
+                    loop.call_soon_threadsafe(event.set)
+            else:
+                self._ready_event.clear()
+            self._state_condition.notify_all()
+
+    def _open_socket(self) -> None:
+        """Create a WebSocketApp for ws_url and run it on a daemon thread."""
+        def on_message(ws, message):
+            self._process_message(message)
             
-            # Start WebSocket connection in a separate thread
-            self.ws_thread = threading.Thread(target=self.ws.run_forever)
-            self.ws_thread.daemon = True
-            self.ws_thread.start()
+        def on_error(ws, error):
+            print(f"WebSocket error: {error}")
             
-            # Wait for connection to establish
-            timeout = 5
-            start_time = time.time()
-            while not self.connected and time.time() - start_time < timeout:
-                time.sleep(0.1)
+        def on_open(ws):
+            if ws is not self.ws:
+                return
+            print(f"Connected to {self.ws_url}")
+            self._set_state(connected=True)
+            self._authenticate()
             
-            if not self.connected:
-                print("Failed to connect to the WebSocket server")
-                return False
+        def on_close(ws, close_status_code, close_reason):
+            self._handle_close(ws)
+        
+        with self._state_condition:
+            self._socket_closed = False
+            self._auth_status = None
+        
+        # Initialize WebSocket connection
+        self.ws = websocket.WebSocketApp(
+            self.ws_url,
+            on_message=on_message,
+            on_error=on_error,
+            on_open=on_open,
+            on_close=on_close
+        )
+        
+        # Start WebSocket connection in a separate thread. Text frames are decoded and checked
+        # by the JSON codec anyway, so skip websocket-client's pure-Python UTF-8 validation.
+        self.ws_thread = threading.Thread(target=self.ws.run_forever, kwargs={"skip_utf8_validation": True})
+        self.ws_thread.daemon = True
+        self.ws_thread.start()
+
+    def _handle_close(self, ws: Any) -> None:
+        """Reset connection state when a socket closes and start reconnecting if enabled."""
+        if ws is not self.ws:
+            # A socket that has already been replaced
+            return
+        was_connected = self.connected
+        with self._state_condition:
+            self._socket_closed = True
+            self._set_state(connected=False, authenticated=False)
+        with self._ack_condition:
+            self._inflight_frames = 0
+            self._ack_condition.notify_all()
+        if was_connected:
+            print(f"Disconnected from {self.ws_url}")
+        
+        if self.auto_reconnect and not self._closing.is_set() and not self._reconnecting and was_connected:
+            self._reconnecting = True
+            self.reconnect_stats['disconnects'] += 1
+            self._disconnected_at = time.monotonic()
+            self.reconnect_stats['last_disconnect'] = time.time()
+            thread = threading.Thread(target=self._reconnect_loop, name="openalgo-feed-reconnect")
+            thread.daemon = True
+            thread.start()
+
+    def _reconnect_loop(self) -> None:
+        """Reconnect with jittered exponential backoff, then re-authenticate and resubscribe."""
+        attempt = 0
+        try:
+            while not self._closing.is_set():
+                delay = min(self.max_reconnect_delay, self.reconnect_delay * (2 ** attempt))
+                if self._closing.wait(delay * random.uniform(0.5, 1.0)):
+                    return
+                attempt += 1
+                self.reconnect_stats['attempts'] += 1
+                print(f"Reconnecting to {self.ws_url} (attempt {attempt})")
                 
-            # Wait for authentication to complete
-            timeout = 5
-            start_time = time.time()
-            while not self.authenticated and time.time() - start_time < timeout and self.connected:
-                time.sleep(0.1)
+                try:
+                    self._open_socket()
+                    if self._wait_for_handshake(5):
+                        gap_ms = (time.monotonic() - self._disconnected_at) * 1000
+                        stats = self.reconnect_stats
+                        stats['reconnects'] += 1
+                        stats['last_gap_ms'] = gap_ms
+                        stats['max_gap_ms'] = max(stats['max_gap_ms'], gap_ms)
+                        stats['total_gap_ms'] += gap_ms
+                        print(f"Reconnected to {self.ws_url} after {gap_ms:.0f} ms")
+                        # Allow the next drop to start a new reconnect while this one resubscribes
+                        self._reconnecting = False
+                        self._resubscribe()
+                        return
+                except Exception as e:
+                    print(f"Error reconnecting to WebSocket: {e}")
                 
-            return self.authenticated
-            
-        except Exception as e:
-            print(f"Error connecting to WebSocket: {e}")
-            return False
+                # Drop the failed socket before the next attempt
+                ws, self.ws = self.ws, None
+                if ws is not None:
+                    try:
+                        ws.close()
+                    except Exception:
+                        pass
+                self._set_state(connected=False, authenticated=False)
+                
+                if self.max_reconnect_attempts is not None and attempt >= self.max_reconnect_attempts:
+                    print(f"Giving up reconnecting to {self.ws_url} after {attempt} attempts")
+                    return
+        finally:
+            self._reconnecting = False
+
+    def _resubscribe(self) -> None:
+        """Replay the current subscription set in batched frames."""
+        for mode in (1, 2, 3):
+            with self.lock:
+                instruments = [{"exchange": exchange, "symbol": symbol}
+                               for exchange, symbol in sorted(self.subscriptions[mode])]
+            if instruments:
+                self._send_subscriptions("subscribe", mode, instruments, self.resubscribe_batch_size)
+
+    def get_reconnect_stats(self) -> Dict[str, Any]:
+        """
+        Get connection gap metrics for auto-reconnect.
+
+        Returns:
+            dict: disconnects, reconnects, attempts, last_gap_ms, max_gap_ms, total_gap_ms,
+                  last_disconnect (epoch seconds) and current_gap_ms (while reconnecting, else 0).
+        """
+        stats = dict(self.reconnect_stats)
+        stats['current_gap_ms'] = (time.monotonic() - self._disconnected_at) * 1000 if self._reconnecting else 0.0
+        return stats
+
+    def _wait_until(self, predicate: Callable[[], bool], timeout: float) -> bool:
+        """Wait up to timeout seconds for predicate() to become true, waking on every state change."""
+        with self._state_condition:
+            return self._state_condition.wait_for(predicate, timeout)
 
     def disconnect(self) -> None:
         """Disconnect from the WebSocket server."""
+        self._closing.set()
         if self.ws:
             self.ws.close()
             # Wait for websocket to close
-            timeout = 2
-            start_time = time.time()
-            while self.connected and time.time() - start_time < timeout:
-                time.sleep(0.1)
+            self._wait_until(lambda: not self.connected, 2)
             self.ws = None
-            self.connected = False
-            self.authenticated = False
+            self._set_state(connected=False, authenticated=False)
+
+    def close(self) -> None:
+        """Disconnect the WebSocket feed, stop the callback dispatcher and close the pooled HTTP client."""
+        self.disconnect()
+        self.disable_bars()
+        self.disable_publisher()
+        self.stop_recording()
+        self.stop_dispatcher()
+        super().close()
 
     def _authenticate(self) -> None:
         """Authenticate with the WebSocket server using the API key."""
@@ -156,7 +493,7 @@ class FeedAPI(BaseAPI):
         
         # Print authentication info like the test example
         print(f"Authenticating with API key: {self.api_key[:8]}...{self.api_key[-8:]}")
-        self.ws.send(json.dumps(auth_msg))
+        self.ws.send(self.codec.dumps(auth_msg))
 
     def _process_message(self, message_str: str) -> None:
         """
@@ -166,57 +503,78 @@ class FeedAPI(BaseAPI):
             message_str (str): The message string received from the WebSocket.
         """
         try:
-            message = json.loads(message_str)
+            message = self.codec.decode_frame(message_str)
             
             # Handle authentication response
             if message.get("type") == "auth":
                 # Print full authentication response like in the test example
                 print(f"Authentication response: {message}")
-                if message.get("status") == "success":
-                    self.authenticated = True
+                with self._state_condition:
+                    self._auth_status = message.get("status")
+                    self._set_state(authenticated=message.get("status") == "success")
+                if self.authenticated:
                     print("Authentication successful!")
                 else:
                     print(f"Authentication failed: {message}")
                 return
                 
             # Handle subscription response
-            if message.get("type") == "subscribe":
-                print(f"Subscription response: {message}")
+            if message.get("type") in ("subscribe", "unsubscribe"):
+                self._process_subscription_response(message)
+                if message.get("type") == "subscribe":
+                    print(f"Subscription response: {message}")
                 return
                 
             # Handle market data
             if message.get("type") == "market_data":
+                recorder = self.recorder
+                if recorder is not None:
+                    recorder.write(message_str)
                 exchange = message.get("exchange")
                 symbol = message.get("symbol")
                 if exchange and symbol:
                     mode = message.get("mode")
                     market_data = message.get("data", {})
+                    tick_logger = self.tick_logger
+                    publisher = self.publisher
+                    symbol_id = self.symbols.intern(exchange, symbol)
+                    symbol_key = self.symbols.keys[symbol_id]
                     
                     # Handle LTP data (mode 1)
                     if mode == 1 and "ltp" in market_data:
+                        # Get LTP and timestamp from the message
+                        ltp = market_data.get("ltp")
+                        timestamp = market_data.get("timestamp", int(time.time() * 1000))
                         with self.lock:
-                            # Get LTP and timestamp from the message
-                            ltp = market_data.get("ltp")
-                            timestamp = market_data.get("timestamp", int(time.time() * 1000))
-                            
-                            # Store both price and timestamp with format 'EXCHANGE:SYMBOL'
-                            symbol_key = f"{exchange}:{symbol}"
-                            self.ltp_data[symbol_key] = {
+                            # Store both price and timestamp by symbol ID
+                            self._ltp_store[symbol_id] = {
                                 'price': ltp,
                                 'timestamp': timestamp
                             }
-                            
-                            # Print when LTP data is received (same as test file)
-                            print(f"LTP {symbol_key}: {ltp} | Time: {timestamp}")
+                            if 1 in self.tick_store_modes:
+                                self._tick_ring(symbol_id).append(timestamp, ltp)
+                            changed = self.conflation.get(mode)
+                            if changed is not None:
+                                changed.add(symbol_id)
+                        
+                        if tick_logger is not None and tick_logger.allow(logging.INFO):
+                            tick_logger.emit(logging.INFO, f"LTP {symbol_key}: {ltp} | Time: {timestamp}")
+                        
+                        if publisher is not None:
+                            publisher.publish(symbol_id, symbol_key, mode, timestamp, _to_float(ltp))
+                        
+                        if self.bar_builder is not None and mode in self.bar_modes:
+                            self.bar_builder.update(symbol_key, timestamp, _to_float(ltp))
                         
-                        # Invoke callback if set
-                        if self.ltp_callback:
+                        # Invoke callback if set (conflated modes are drained instead)
+                        if changed is None and self.ltp_callback:
                             try:
                                 # Create a clean market data update without redundant fields
                                 clean_data = {
                                     'type': 'market_data',
                                     'symbol': symbol,
                                     'exchange': exchange,
+                                    'symbol_id': symbol_id,
                                     'mode': mode,
                                     'data': {
                                         'ltp': ltp,
@@ -231,115 +589,489 @@ class FeedAPI(BaseAPI):
                                     clean_data['data']['ltt'] = market_data['data']['ltt']
                                     
                                 # Pass the cleaned message to callback
-                                self.ltp_callback(clean_data)
+                                self._dispatch(self.ltp_callback, mode, symbol_id, clean_data)
                             except Exception as e:
                                 print(f"Error in LTP callback: {str(e)}")                 
                     # Handle Quotes data (mode 2)
                     elif mode == 2:
+                        # Extract quote data fields
+                        quote_data = {
+                            'open': market_data.get("open", 0),
+                            'high': market_data.get("high", 0),
+                            'low': market_data.get("low", 0),
+                            'close': market_data.get("close", 0),
+                            'ltp': market_data.get("ltp", 0),
+                            'volume': market_data.get("volume", 0),
+                            'timestamp': market_data.get("timestamp", int(time.time() * 1000))
+                        }
                         with self.lock:
-                            # Extract quote data fields
-                            quote_data = {
-                                'open': market_data.get("open", 0),
-                                'high': market_data.get("high", 0),
-                                'low': market_data.get("low", 0),
-                                'close': market_data.get("close", 0),
-                                'ltp': market_data.get("ltp", 0),
-                                'volume': market_data.get("volume", 0),
-                                'timestamp': market_data.get("timestamp", int(time.time() * 1000))
-                            }
-                            
-                            # Store quote data with format 'EXCHANGE:SYMBOL'
-                            symbol_key = f"{exchange}:{symbol}"
-                            self.quotes_data[symbol_key] = quote_data
-                            
-                            # Print when quote data is received (same as test file)
-                            print(f"Quote {symbol_key}: Open: {quote_data['open']} | High: {quote_data['high']} | "
-                                  f"Low: {quote_data['low']} | Close: {quote_data['close']} | "
-                                  f"LTP: {quote_data['ltp']}")
+                            # Store quote data by symbol ID
+                            self._quote_store[symbol_id] = quote_data
+                            if 2 in self.tick_store_modes:
+                                self._tick_ring(symbol_id).append(
+                                    quote_data['timestamp'], quote_data['ltp'], quote_data['volume'],
+                                    _to_float(market_data.get("bid")), _to_float(market_data.get("ask")))
+                            changed = self.conflation.get(mode)
+                            if changed is not None:
+                                changed.add(symbol_id)
+                        
+                        if tick_logger is not None and tick_logger.allow(logging.INFO):
+                            tick_logger.emit(logging.INFO,
+                                             f"Quote {symbol_key}: Open: {quote_data['open']} | High: {quote_data['high']} | "
+                                             f"Low: {quote_data['low']} | Close: {quote_data['close']} | "
+                                             f"LTP: {quote_data['ltp']}")
                         
-                        # Invoke callback if set
-                        if self.quote_callback:
+                        if publisher is not None:
+                            publisher.publish(symbol_id, symbol_key, mode, quote_data['timestamp'],
+                                              _to_float(quote_data['ltp']), _to_float(quote_data['open']),
+                                              _to_float(quote_data['high']), _to_float(quote_data['low']),
+                                              _to_float(quote_data['close']), _to_float(quote_data['volume']),
+                                              _to_float(market_data.get("bid")), _to_float(market_data.get("ask")))
+                        
+                        if self.bar_builder is not None and mode in self.bar_modes:
+                            self.bar_builder.update(symbol_key, quote_data['timestamp'], _to_float(quote_data['ltp']),
+                                                    _to_float(quote_data['volume']))
+                        
+                        # Invoke callback if set (conflated modes are drained instead)
+                        if changed is None and self.quote_callback:
                             try:
                                 # Create a clean market data update without redundant fields
                                 clean_data = {
                                     'type': 'market_data',
                                     'symbol': symbol,
                                     'exchange': exchange,
+                                    'symbol_id': symbol_id,
                                     'mode': mode,
                                     'data': quote_data.copy()
                                 }
                                 # Pass the cleaned message to callback
-                                self.quote_callback(clean_data)
+                                self._dispatch(self.quote_callback, mode, symbol_id, clean_data)
                             except Exception as e:
                                 print(f"Error in Quote callback: {str(e)}")                 
                     # Handle Market Depth data (mode 3)
                     elif mode == 3 and "depth" in market_data:
+                        # Extract depth data
+                        depth_data = {
+                            'ltp': market_data.get("ltp", 0),
+                            'timestamp': market_data.get("timestamp", int(time.time() * 1000)),
+                            'depth': market_data.get("depth", {"buy": [], "sell": []})
+                        }
                         with self.lock:
-                            # Extract depth data
-                            depth_data = {
-                                'ltp': market_data.get("ltp", 0),
-                                'timestamp': market_data.get("timestamp", int(time.time() * 1000)),
-                                'depth': market_data.get("depth", {"buy": [], "sell": []})
-                            }
-                            
-                            # Store depth data with format 'EXCHANGE:SYMBOL'
-                            symbol_key = f"{exchange}:{symbol}"
-                            self.depth_data[symbol_key] = depth_data
-                            
-                            # Print when depth data is received
-                            buy_depth = depth_data.get('depth', {}).get('buy', [])
-                            sell_depth = depth_data.get('depth', {}).get('sell', [])
-                            
-                            print(f"\nDepth {symbol_key} - LTP: {depth_data.get('ltp')}")
-                            
-                            # Print buy depth summary
-                            print("\nBUY DEPTH:")
-                            print("-" * 40)
-                            print(f"{'Level':<6} {'Price':<10} {'Quantity':<10} {'Orders':<10}")
-                            print("-" * 40)
-                            
-                            if buy_depth:
-                                for i, level in enumerate(buy_depth):
-                                    print(f"{i+1:<6} {level.get('price', 'N/A'):<10} {level.get('quantity', 'N/A'):<10} {level.get('orders', 'N/A'):<10}")
-                            else:
-                                print("No buy depth data available")
-                                
-                            # Print sell depth summary
-                            print("\nSELL DEPTH:")
-                            print("-" * 40)
-                            print(f"{'Level':<6} {'Price':<10} {'Quantity':<10} {'Orders':<10}")
-                            print("-" * 40)
-                            
-                            if sell_depth:
-                                for i, level in enumerate(sell_depth):
-                                    print(f"{i+1:<6} {level.get('price', 'N/A'):<10} {level.get('quantity', 'N/A'):<10} {level.get('orders', 'N/A'):<10}")
-                            else:
-                                print("No sell depth data available")
-                                
-                            print("-" * 40)
+                            # Store depth data by symbol ID
+                            self._depth_store[symbol_id] = depth_data
+                            if self.depth_book is not None:
+                                book = depth_data['depth']
+                                self.depth_book.update(symbol_id, book.get('buy'), book.get('sell'),
+                                                       depth_data['ltp'], depth_data['timestamp'])
+                            if 3 in self.tick_store_modes:
+                                book = depth_data['depth']
+                                self._tick_ring(symbol_id).append(
+                                    depth_data['timestamp'], depth_data['ltp'], _to_float(market_data.get("volume")),
+                                    _best_price(book.get('buy')), _best_price(book.get('sell')))
+                            changed = self.conflation.get(mode)
+                            if changed is not None:
+                                changed.add(symbol_id)
+                        
+                        if tick_logger is not None:
+                            # Full book at DEBUG, one line at INFO; rate-limited once either way
+                            level = logging.DEBUG if tick_logger.level <= logging.DEBUG else logging.INFO
+                            if tick_logger.allow(level):
+                                if level == logging.DEBUG:
+                                    tick_logger.emit(level, _format_depth(symbol_key, depth_data))
+                                else:
+                                    tick_logger.emit(level, f"Depth {symbol_key} - LTP: {depth_data.get('ltp')}")
+                        
+                        if publisher is not None:
+                            book = depth_data['depth']
+                            publisher.publish(symbol_id, symbol_key, mode, depth_data['timestamp'],
+                                              _to_float(depth_data['ltp']), volume=_to_float(market_data.get("volume")),
+                                              bid=_best_price(book.get('buy')), ask=_best_price(book.get('sell')))
                         
-                        # Invoke callback if set
-                        if self.depth_callback:
+                        # Invoke callback if set (conflated modes are drained instead)
+                        if changed is None and self.depth_callback:
                             try:
                                 # Create a clean market data update
                                 clean_data = {
                                     'type': 'market_data',
                                     'symbol': symbol,
                                     'exchange': exchange,
+                                    'symbol_id': symbol_id,
                                     'mode': mode,
                                     'data': depth_data.copy()
                                 }
                                 # Pass the cleaned message to callback
-                                self.depth_callback(clean_data)
+                                self._dispatch(self.depth_callback, mode, symbol_id, clean_data)
                             except Exception as e:
                                 print(f"Error in Depth callback: {str(e)}")
                         
-        except json.JSONDecodeError:
+        except ValueError:
             print(f"Invalid JSON message: {message_str}")
         except Exception as e:
             print(f"Error handling message: {e}")
 
-    def subscribe_ltp(self, instruments: List[Dict[str, Any]], on_data_received: Optional[Callable] = None) -> bool:
+    def start_dispatcher(self, workers: int = 1, maxsize: int = 10000, overflow: str = "block",
+                         loop: Any = None, late_threshold: float = 1.0) -> TickDispatcher:
+        """
+        Run data callbacks on a worker pool or asyncio loop instead of the WebSocket thread,
+        so slow callbacks do not hold up the socket.
+
+        Args:
+            workers: Number of worker threads. Ticks for one instrument always go to the same worker.
+            maxsize: Maximum queued ticks per worker.
+            overflow: What to do when a queue is full: "block", "drop_oldest" or "conflate"
+                (replace the queued tick for the same instrument).
+            loop: asyncio event loop to run callbacks on. Coroutine callbacks are awaited.
+            late_threshold: Seconds from receipt to delivery after which a tick counts as late.
+
+        Returns:
+            TickDispatcher: The dispatcher; its stats() reports queue depth and dropped/late counters.
+        """
+        self.stop_dispatcher()
+        self.dispatcher = TickDispatcher(workers, maxsize, overflow, loop, late_threshold)
+        return self.dispatcher
+
+    def stop_dispatcher(self, timeout: float = 5.0) -> None:
+        """Deliver queued ticks and return to calling callbacks on the WebSocket thread."""
+        dispatcher, self.dispatcher = self.dispatcher, None
+        if dispatcher is not None:
+            dispatcher.stop(timeout)
+
+    def get_dispatcher_stats(self) -> Dict[str, Any]:
+        """
+        Get callback dispatcher counters.
+
+        Returns:
+            dict: queue_depth, delivered, dropped, conflated, late, errors and max_latency,
+                  or an empty dict when no dispatcher is running.
+        """
+        return self.dispatcher.stats() if self.dispatcher is not None else {}
+
+    def set_conflation(self, enabled: bool = True, modes: tuple = (1, 2, 3)) -> None:
+        """
+        Switch modes to conflated (latest-value-wins) delivery.
+
+        In a conflated mode each tick only overwrites the instrument's latest value; the data
+        callback is not invoked. Consumers call drain() at their own cadence to get the
+        instruments that changed since the previous drain.
+
+        Args:
+            enabled: True to conflate, False to return to per-tick callbacks.
+            modes: Modes to switch: 1 (LTP), 2 (Quote), 3 (Depth). Defaults to all.
+        """
+        with self.lock:
+            for mode in modes:
+                if enabled:
+                    self.conflation.setdefault(mode, set())
+                else:
+                    self.conflation.pop(mode, None)
+
+    def drain(self, mode: int = 1, by_id: bool = False) -> Dict[Any, Any]:
+        """
+        Get the latest data for instruments that changed since the previous drain.
+
+        Args:
+            mode: 1 (LTP), 2 (Quote) or 3 (Depth). The mode must be conflated (see set_conflation()).
+            by_id: Key the result by symbol ID instead of 'EXCHANGE:SYMBOL'. Defaults to False.
+
+        Returns:
+            dict: {'EXCHANGE:SYMBOL': data}, where data is {'ltp', 'timestamp'} for LTP and the
+                  same dict passed to quote/depth callbacks for the other modes.
+        """
+        data_store = self._stores[mode]
+        with self.lock:
+            changed = self.conflation.get(mode)
+            if not changed:
+                return {}
+            self.conflation[mode] = set()
+            latest = {symbol_id: data_store[symbol_id] for symbol_id in changed if symbol_id in data_store}
+        keys = self.symbols.keys
+        if mode == 1:
+            return {symbol_id if by_id else keys[symbol_id]: {'ltp': data['price'], 'timestamp': data['timestamp']}
+                    for symbol_id, data in latest.items()}
+        return {symbol_id if by_id else keys[symbol_id]: dict(data) for symbol_id, data in latest.items()}
+
+    def enable_tick_store(self, capacity: int = 10000, modes: tuple = (2,)) -> None:
+        """
+        Keep the last ticks of every subscribed instrument in preallocated NumPy ring buffers.
+
+        Args:
+            capacity: Ticks kept per instrument. Defaults to 10000.
+            modes: Modes whose ticks are recorded: 1 (LTP), 2 (Quote, adds volume and bid/ask if sent),
+                3 (Depth, adds best bid/ask). Defaults to (2,). Every mode delivers its own tick for the
+                same trade, so record one mode per instrument unless each is subscribed for different ones.
+        """
+        with self.lock:
+            if capacity != self.tick_store_capacity:
+                self.tick_stores = {}
+            self.tick_store_capacity = capacity
+            self.tick_store_modes = tuple(modes)
+            for mode in self.tick_store_modes:
+                for exchange, symbol in self.subscriptions[mode]:
+                    self._tick_ring(self.symbols.intern(exchange, symbol))
+
+    def disable_tick_store(self) -> None:
+        """Stop recording ticks and release the ring buffers."""
+        with self.lock:
+            self.tick_store_modes = ()
+            self.tick_stores = {}
+
+    def get_ticks(self, exchange: str, symbol: str, n: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get the last n ticks of an instrument as zero-copy NumPy views.
+
+        Args:
+            exchange: Exchange code
+            symbol: Trading symbol
+            n: Number of ticks. Defaults to all buffered ticks.
+
+        Returns:
+            dict: {'timestamp', 'ltp', 'volume', 'bid', 'ask'} read-only arrays, oldest first,
+                  or None if no ticks are stored for the instrument.
+        """
+        with self.lock:
+            ring = self.tick_stores.get(self.symbols.get(exchange, symbol))
+            return ring.window(n) if ring is not None else None
+
+    def _tick_ring(self, symbol_id: int) -> TickRing:
+        """Return the ring buffer for an instrument, creating it if needed. Call with self.lock held."""
+        ring = self.tick_stores.get(symbol_id)
+        if ring is None:
+            ring = self.tick_stores[symbol_id] = TickRing(self.tick_store_capacity)
+        return ring
+
+    def start_recording(self, path: Optional[str] = None, directory: str = "recordings") -> str:
+        """
+        Record every market_data frame, with its receive time, to a binary log for replay().
+
+        Args:
+            path: Log file. Defaults to directory/feed-YYYYMMDD-HHMMSS.oatr for this session.
+            directory: Folder for the default file name. Defaults to "recordings".
+
+        Returns:
+            str: Path of the log.
+        """
+        self.stop_recording()
+        if path is None:
+            path = os.path.join(directory, time.strftime("feed-%Y%m%d-%H%M%S.oatr"))
+        self.recorder = TickRecorder(path)
+        return path
+
+    def stop_recording(self) -> Optional[Dict[str, Any]]:
+        """
+        Stop recording and close the log.
+
+        Returns:
+            dict: {'path', 'frames', 'bytes'} of the finished log, or None if not recording.
+        """
+        recorder, self.recorder = self.recorder, None
+        if recorder is None:
+            return None
+        recorder.close()
+        return {'path': recorder.path, 'frames': recorder.frames, 'bytes': recorder.bytes}
+
+    def replay(self, path: str, speed: Optional[float] = None, on_ltp: Optional[Callable] = None,
+               on_quote: Optional[Callable] = None, on_depth: Optional[Callable] = None,
+               start: int = 0, stop: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Replay a recorded log through this feed without a server connection.
+
+        Frames go through the same decoding, stores, tick store, bars and callbacks
+        (ltp_callback, quote_callback, depth_callback) as live data.
+
+        Args:
+            path: Log written by start_recording().
+            speed: 1.0 for the recorded pace, e.g. 10.0 for ten times faster, None for as fast as possible.
+            on_ltp, on_quote, on_depth: Callbacks to set before replaying. Defaults to the current ones.
+            start, stop: Range of frame indices to replay. Defaults to the whole log.
+
+        Returns:
+            dict: {'frames', 'elapsed', 'frames_per_second', 'recorded_seconds', 'max_lag'}.
+        """
+        if on_ltp:
+            self.ltp_callback = on_ltp
+        if on_quote:
+            self.quote_callback = on_quote
+        if on_depth:
+            self.depth_callback = on_depth
+        log = TickLog(path)
+        try:
+            return replay(log, self._process_message, speed, start, stop)
+        finally:
+            log.close()
+
+    def enable_publisher(self, name: str = "openalgo-ticks", capacity: int = 65536,
+                         max_symbols: int = 4096, overwrite: bool = False) -> TickPublisher:
+        """
+        Publish every decoded tick to a shared-memory ring that other local processes can read
+        with TickSubscriber, so strategies, risk and UI processes share one WebSocket connection.
+
+        Args:
+            name: Shared memory block name. Defaults to "openalgo-ticks".
+            capacity: Tick slots in the ring. Defaults to 65536.
+            max_symbols: Size of the shared symbol table (symbol IDs). Defaults to 4096.
+            overwrite: Replace a block whose publisher is still running. Defaults to False, which raises
+                FileExistsError; blocks left behind by a dead publisher are always replaced.
+
+        Returns:
+            TickPublisher: The publisher.
+        """
+        self.disable_publisher()
+        self.publisher = TickPublisher(name, capacity, max_symbols, overwrite)
+        return self.publisher
+
+    def disable_publisher(self) -> None:
+        """Stop publishing ticks and remove the shared memory block."""
+        publisher, self.publisher = self.publisher, None
+        if publisher is not None:
+            publisher.close()
+
+    def enable_depth_book(self, levels: int = 5, capacity: int = 256) -> DepthBook:
+        """
+        Keep market depth in preallocated NumPy arrays with compiled microstructure metrics.
+
+        Every depth update overwrites the instrument's row of depth_book.books
+        (instruments x 2 sides x levels x [price, quantity, orders]) in place and refreshes
+        depth_book.metrics (mid, microprice, spread, imbalance). Rows are indexed by symbol ID.
+
+        Args:
+            levels: Depth levels kept per side. Defaults to 5.
+            capacity: Initial number of instrument rows; grows as needed.
+
+        Returns:
+            DepthBook: The depth book.
+        """
+        with self.lock:
+            self.depth_book = DepthBook(levels, max(capacity, len(self.symbols)))
+            for symbol_id, data in self._depth_store.items():
+                book = data.get('depth', {})
+                self.depth_book.update(symbol_id, book.get('buy'), book.get('sell'), data.get('ltp'), data.get('timestamp'))
+        return self.depth_book
+
+    def disable_depth_book(self) -> None:
+        """Stop maintaining the columnar depth book and release its arrays."""
+        with self.lock:
+            self.depth_book = None
+
+    def get_book(self, exchange: str, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the columnar depth book of an instrument.
+
+        Args:
+            exchange: Exchange code
+            symbol: Trading symbol
+
+        Returns:
+            dict: {'bids': (levels, 3) array, 'asks': (levels, 3) array of [price, quantity, orders],
+                   'ltp', 'timestamp', 'mid', 'microprice', 'spread', 'imbalance'},
+                  or None if the depth book is off or the instrument has no depth yet.
+        """
+        symbol_id = self.symbols.get(exchange, symbol)
+        with self.lock:
+            book = self.depth_book
+            if book is None or symbol_id is None or symbol_id >= len(book.updates) or not book.updates[symbol_id]:
+                return None
+            result = {
+                'bids': book.books[symbol_id, 0].copy(),
+                'asks': book.books[symbol_id, 1].copy(),
+                'ltp': float(book.ltp[symbol_id]),
+                'timestamp': int(book.timestamp[symbol_id]),
+            }
+            result.update(book.get_metrics(symbol_id))
+        return result
+
+    def enable_bars(self, intervals: tuple = ("1m", "5m", "15m"), on_bar: Optional[Callable] = None,
+                    capacity: int = 10000, modes: tuple = (1, 2), flush_interval: Optional[float] = 1.0,
+                    grace: float = 1.0) -> BarBuilder:
+        """
+        Build OHLCV bars from feed ticks for several intervals at once.
+
+        Args:
+            intervals: Bar intervals, e.g. ("1m", "5m", "15m", "1h", "D"). Intraday bars are aligned to 09:15 IST.
+            on_bar: Called with each closed bar {'symbol', 'exchange', 'interval', 'timestamp',
+                'open', 'high', 'low', 'close', 'volume'}. Runs through the dispatcher when one is started.
+            capacity: Closed bars kept per instrument and interval.
+            modes: Modes whose ticks are aggregated: 1 (LTP) and/or 2 (Quote, which also provides volume).
+            flush_interval: Seconds between checks that close bars of instruments without new ticks.
+                None closes bars only when the next tick arrives.
+            grace: Seconds after a bar's end before the flush closes it. Ticks for a bar
+                that is already closed are dropped and counted in bar_builder.late_ticks.
+
+        Returns:
+            BarBuilder: The bar builder; use get_bars() to read bar history.
+        """
+        self.disable_bars()
+        callback = None
+        if on_bar is not None:
+            callback = lambda bar: self._dispatch(on_bar, f"bar:{bar['interval']}",
+                                                  f"{bar['exchange']}:{bar['symbol']}", bar)
+        self.bar_builder = BarBuilder(intervals, callback, capacity, grace=grace)
+        self.bar_modes = tuple(modes)
+        if flush_interval:
+            stop = self._bar_flush_stop = threading.Event()
+            builder = self.bar_builder
+
+            def flush():
+                while not stop.wait(flush_interval):
+                    builder.flush(time.time())
+
+            thread = threading.Thread(target=flush, name="openalgo-bar-flush")
+            thread.daemon = True
+            thread.start()
+        return self.bar_builder
+
+    def disable_bars(self) -> None:
+        """Stop building bars."""
+        if self._bar_flush_stop is not None:
+            self._bar_flush_stop.set()
+            self._bar_flush_stop = None
+        self.bar_builder = None
+        self.bar_modes = ()
+
+    def get_bars(self, exchange: str, symbol: str, interval: str, include_partial: bool = False,
+                 format: str = "numpy") -> Any:
+        """
+        Get bars built from the feed for an instrument.
+
+        Args:
+            exchange: Exchange code
+            symbol: Trading symbol
+            interval: One of the intervals passed to enable_bars()
+            include_partial: Include the bar that is still forming. Defaults to False.
+            format: "numpy" for arrays like history(format="numpy"), or "dataframe" for a DataFrame like history().
+
+        Returns:
+            dict or pandas.DataFrame, or None if bars are not enabled.
+        """
+        if self.bar_builder is None:
+            return None
+        return self.bar_builder.bars(f"{exchange}:{symbol}", interval, include_partial, format)
+
+    def _dispatch(self, callback: Callable, mode: Any, symbol_id: Any, data: Dict[str, Any]) -> None:
+        """Invoke a data callback directly or through the dispatcher."""
+        dispatcher = self.dispatcher
+        if dispatcher is None:
+            callback(data)
+        else:
+            dispatcher.submit((mode, symbol_id), callback, data)
+
+    def set_tick_logging(self, sink: Any = print, level: int = logging.INFO,
+                         max_per_second: Optional[int] = 10) -> Optional[TickLogger]:
+        """
+        Enable or disable per-tick log lines. Tick logging is off by default.
+
+        Args:
+            sink: Callable receiving each line, or a logging.Logger. Pass None to disable.
+            level: logging.INFO logs one line per tick; logging.DEBUG adds the full depth tables.
+            max_per_second: Maximum lines per second, None for no limit. Defaults to 10.
+
+        Returns:
+            TickLogger: The active tick logger, or None when disabled.
+        """
+        self.tick_logger = TickLogger(sink, level, max_per_second) if sink is not None else None
+        return self.tick_logger
+
+    def subscribe_ltp(self, instruments: List[Dict[str, Any]], on_data_received: Optional[Callable] = None,
+                      batch_size: Optional[int] = None) -> bool:
         """
         Subscribe to LTP updates for instruments.
         
@@ -349,6 +1081,9 @@ class FeedAPI(BaseAPI):
                 - symbol (str): Trading symbol
                 - exchange_token (str, optional): Exchange token for the instrument
             on_data_received: Callback function for data updates
+            batch_size: Instruments per subscription frame. When set, frames are pipelined
+                without delays under flow control (see get_subscription_acks()). Defaults to
+                None, which sends one frame per instrument with a 0.1s delay.
                 
         Returns:
             bool: True if subscription successful, False otherwise
@@ -365,42 +1100,9 @@ class FeedAPI(BaseAPI):
         if on_data_received:
             self.ltp_callback = on_data_received
         
-        # Subscribe to each instrument individually (matching the working test implementation)
-        for instrument in instruments:
-            exchange = instrument.get("exchange")
-            symbol = instrument.get("symbol")
-            exchange_token = instrument.get("exchange_token")
-            
-            # If only exchange_token is provided, we need to map it to a symbol
-            if not symbol and exchange_token:
-                symbol = exchange_token
-                
-            if not exchange or not symbol:
-                print(f"Invalid instrument: {instrument}")
-                continue
-                
-            # Use the exact same message format as the working test
-            subscription_msg = {
-                "action": "subscribe",
-                "symbol": symbol,
-                "exchange": exchange,
-                "mode": 1,  # 1 for LTP
-                "depth": 5  # Default depth level
-            }
-            
-            print(f"Subscribing to {exchange}:{symbol} LTP")
-            try:
-                self.ws.send(json.dumps(subscription_msg))
-                
-                # Small delay to ensure the message is processed separately (just like the test)
-                time.sleep(0.1)
-            except Exception as e:
-                print(f"Error subscribing to {exchange}:{symbol}: {e}")
-                return False
-        
-        return True
+        return self._send_subscriptions("subscribe", 1, instruments, batch_size)
 
-    def unsubscribe_ltp(self, instruments: List[Dict[str, Any]]) -> bool:
+    def unsubscribe_ltp(self, instruments: List[Dict[str, Any]], batch_size: Optional[int] = None) -> bool:
         """
         Unsubscribe from LTP updates for instruments.
         
@@ -409,6 +1111,7 @@ class FeedAPI(BaseAPI):
                 - exchange (str): Exchange code (e.g., 'NSE', 'BSE', 'NFO')
                 - symbol (str): Trading symbol
                 - exchange_token (str, optional): Exchange token for the instrument
+            batch_size: Instruments per unsubscription frame. Defaults to None (one frame per instrument).
                 
         Returns:
             bool: True if unsubscription successful, False otherwise
@@ -416,49 +1119,10 @@ class FeedAPI(BaseAPI):
         if not self.connected or not self.authenticated:
             return False
         
-        # Unsubscribe from each instrument individually (matching the working test implementation)
-        for instrument in instruments:
-            exchange = instrument.get("exchange")
-            symbol = instrument.get("symbol")
-            exchange_token = instrument.get("exchange_token")
-            
-            # If only exchange_token is provided, we need to map it to a symbol
-            if not symbol and exchange_token:
-                symbol = exchange_token
-                
-            if not exchange or not symbol:
-                print(f"Invalid instrument: {instrument}")
-                continue
-                
-            # Print information about unsubscription
-            print(f"Unsubscribing from {exchange}:{symbol}")
-            
-            # Use the exact same message format as the working test
-            unsubscribe_msg = {
-                "action": "unsubscribe",
-                "symbol": symbol,
-                "exchange": exchange,
-                "mode": 1  # 1 for LTP
-            }
-            
-            try:
-                self.ws.send(json.dumps(unsubscribe_msg))
-                
-                # Clean up the data
-                with self.lock:
-                    symbol_key = f"{exchange}:{symbol}"
-                    if symbol_key in self.ltp_data:
-                        del self.ltp_data[symbol_key]
-                
-                # Small delay to ensure the message is processed separately
-                time.sleep(0.1)
-            except Exception as e:
-                print(f"Error unsubscribing from {exchange}:{symbol}: {e}")
-                return False
-        
-        return True
+        return self._send_subscriptions("unsubscribe", 1, instruments, batch_size)
         
-    def subscribe_quote(self, instruments: List[Dict[str, Any]], on_data_received: Optional[Callable] = None) -> bool:
+    def subscribe_quote(self, instruments: List[Dict[str, Any]], on_data_received: Optional[Callable] = None,
+                        batch_size: Optional[int] = None) -> bool:
         """
         Subscribe to Quote updates for instruments.
         
@@ -468,6 +1132,7 @@ class FeedAPI(BaseAPI):
                 - symbol (str): Trading symbol
                 - exchange_token (str, optional): Exchange token for the instrument
             on_data_received: Callback function for data updates
+            batch_size: Instruments per subscription frame. Defaults to None (one frame per instrument).
             
         Returns:
             bool: True if subscription request sent successfully
@@ -484,42 +1149,9 @@ class FeedAPI(BaseAPI):
         if on_data_received:
             self.quote_callback = on_data_received
         
-        # Subscribe to each instrument individually
-        for instrument in instruments:
-            exchange = instrument.get("exchange")
-            symbol = instrument.get("symbol")
-            exchange_token = instrument.get("exchange_token")
-            
-            # If only exchange_token is provided, we need to map it to a symbol
-            if not symbol and exchange_token:
-                symbol = exchange_token
-                
-            if not exchange or not symbol:
-                print(f"Invalid instrument: {instrument}")
-                continue
-                
-            # Use the same message format as for LTP but with mode 2 for Quote
-            subscription_msg = {
-                "action": "subscribe",
-                "symbol": symbol,
-                "exchange": exchange,
-                "mode": 2,  # 2 for Quote
-                "depth": 5  # Default depth level
-            }
-            
-            print(f"Subscribing to {exchange}:{symbol} Quote")
-            try:
-                self.ws.send(json.dumps(subscription_msg))
-                
-                # Small delay to ensure the message is processed separately
-                time.sleep(0.1)
-            except Exception as e:
-                print(f"Error subscribing to {exchange}:{symbol}: {e}")
-                return False
-        
-        return True
+        return self._send_subscriptions("subscribe", 2, instruments, batch_size)
     
-    def unsubscribe_quote(self, instruments: List[Dict[str, Any]]) -> bool:
+    def unsubscribe_quote(self, instruments: List[Dict[str, Any]], batch_size: Optional[int] = None) -> bool:
         """
         Unsubscribe from Quote updates for instruments.
         
@@ -528,6 +1160,7 @@ class FeedAPI(BaseAPI):
                 - exchange (str): Exchange code (e.g., 'NSE', 'BSE', 'NFO')
                 - symbol (str): Trading symbol
                 - exchange_token (str, optional): Exchange token for the instrument
+            batch_size: Instruments per unsubscription frame. Defaults to None (one frame per instrument).
                 
         Returns:
             bool: True if unsubscription successful, False otherwise
@@ -535,49 +1168,10 @@ class FeedAPI(BaseAPI):
         if not self.connected or not self.authenticated:
             return False
         
-        # Unsubscribe from each instrument individually
-        for instrument in instruments:
-            exchange = instrument.get("exchange")
-            symbol = instrument.get("symbol")
-            exchange_token = instrument.get("exchange_token")
-            
-            # If only exchange_token is provided, we need to map it to a symbol
-            if not symbol and exchange_token:
-                symbol = exchange_token
-                
-            if not exchange or not symbol:
-                print(f"Invalid instrument: {instrument}")
-                continue
-                
-            # Print information about unsubscription
-            print(f"Unsubscribing from {exchange}:{symbol}")
-            
-            # Use the same message format as for LTP but with mode 2 for Quote
-            unsubscribe_msg = {
-                "action": "unsubscribe",
-                "symbol": symbol,
-                "exchange": exchange,
-                "mode": 2  # 2 for Quote
-            }
-            
-            try:
-                self.ws.send(json.dumps(unsubscribe_msg))
-                
-                # Clean up the data
-                with self.lock:
-                    symbol_key = f"{exchange}:{symbol}"
-                    if symbol_key in self.quotes_data:
-                        del self.quotes_data[symbol_key]
-                
-                # Small delay to ensure the message is processed separately
-                time.sleep(0.1)
-            except Exception as e:
-                print(f"Error unsubscribing from {exchange}:{symbol}: {e}")
-                return False
+        return self._send_subscriptions("unsubscribe", 2, instruments, batch_size)
         
-        return True
-        
-    def subscribe_depth(self, instruments: List[Dict[str, Any]], on_data_received: Optional[Callable] = None) -> bool:
+    def subscribe_depth(self, instruments: List[Dict[str, Any]], on_data_received: Optional[Callable] = None,
+                        batch_size: Optional[int] = None) -> bool:
         """
         Subscribe to Market Depth updates for instruments.
         
@@ -587,6 +1181,7 @@ class FeedAPI(BaseAPI):
                 - symbol (str): Trading symbol
                 - exchange_token (str, optional): Exchange token for the instrument
             on_data_received: Callback function for data updates
+            batch_size: Instruments per subscription frame. Defaults to None (one frame per instrument).
             
         Returns:
             bool: True if subscription request sent successfully
@@ -603,42 +1198,9 @@ class FeedAPI(BaseAPI):
         if on_data_received:
             self.depth_callback = on_data_received
         
-        # Subscribe to each instrument individually
-        for instrument in instruments:
-            exchange = instrument.get("exchange")
-            symbol = instrument.get("symbol")
-            exchange_token = instrument.get("exchange_token")
-            
-            # If only exchange_token is provided, we need to map it to a symbol
-            if not symbol and exchange_token:
-                symbol = exchange_token
-                
-            if not exchange or not symbol:
-                print(f"Invalid instrument: {instrument}")
-                continue
-                
-            # Use the same message format as for Quote but with mode 3 for Market Depth
-            subscription_msg = {
-                "action": "subscribe",
-                "symbol": symbol,
-                "exchange": exchange,
-                "mode": 3,  # 3 for Market Depth
-                "depth": 5  # Default depth level
-            }
-            
-            print(f"Subscribing to {exchange}:{symbol} Market Depth")
-            try:
-                self.ws.send(json.dumps(subscription_msg))
-                
-                # Small delay to ensure the message is processed separately
-                time.sleep(0.1)
-            except Exception as e:
-                print(f"Error subscribing to {exchange}:{symbol}: {e}")
-                return False
-        
-        return True
+        return self._send_subscriptions("subscribe", 3, instruments, batch_size)
     
-    def unsubscribe_depth(self, instruments: List[Dict[str, Any]]) -> bool:
+    def unsubscribe_depth(self, instruments: List[Dict[str, Any]], batch_size: Optional[int] = None) -> bool:
         """
         Unsubscribe from Market Depth updates for instruments.
         
@@ -647,6 +1209,7 @@ class FeedAPI(BaseAPI):
                 - exchange (str): Exchange code (e.g., 'NSE', 'BSE', 'NFO')
                 - symbol (str): Trading symbol
                 - exchange_token (str, optional): Exchange token for the instrument
+            batch_size: Instruments per unsubscription frame. Defaults to None (one frame per instrument).
                 
         Returns:
             bool: True if unsubscription successful, False otherwise
@@ -654,7 +1217,11 @@ class FeedAPI(BaseAPI):
         if not self.connected or not self.authenticated:
             return False
         
-        # Unsubscribe from each instrument individually
+        return self._send_subscriptions("unsubscribe", 3, instruments, batch_size)
+
+    def _valid_instruments(self, instruments: List[Dict[str, Any]]) -> List[tuple]:
+        """Return (exchange, symbol) pairs for the valid instruments in a subscription list."""
+        pairs = []
         for instrument in instruments:
             exchange = instrument.get("exchange")
             symbol = instrument.get("symbol")
@@ -667,35 +1234,171 @@ class FeedAPI(BaseAPI):
             if not exchange or not symbol:
                 print(f"Invalid instrument: {instrument}")
                 continue
-                
-            # Print information about unsubscription
-            print(f"Unsubscribing from {exchange}:{symbol}")
-            
-            # Use the same message format as for Quote but with mode 3 for Market Depth
-            unsubscribe_msg = {
-                "action": "unsubscribe",
-                "symbol": symbol,
-                "exchange": exchange,
-                "mode": 3  # 3 for Market Depth
-            }
-            
+            pairs.append((exchange, symbol))
+        return pairs
+
+    def _send_subscriptions(self, action: str, mode: int, instruments: List[Dict[str, Any]],
+                            batch_size: Optional[int] = None) -> bool:
+        """
+        Send subscribe/unsubscribe frames for a list of instruments.
+
+        With batch_size=None each instrument is sent in its own frame followed by a
+        0.1s delay (the original behaviour). Otherwise instruments are packed into
+        frames of batch_size symbols and pipelined without delays; at most
+        max_inflight_frames frames wait for a server response at any time.
+        """
+        pairs = self._valid_instruments(instruments)
+        data_store = self._stores[mode]
+        mode_name = self.MODE_NAMES[mode]
+
+        if batch_size is None:
+            frames = [[pair] for pair in pairs]
+        else:
+            batch_size = max(1, int(batch_size))
+            frames = [pairs[i:i + batch_size] for i in range(0, len(pairs), batch_size)]
+            verb = "Subscribing to" if action == "subscribe" else "Unsubscribing from"
+            print(f"{verb} {len(pairs)} instruments ({mode_name}) in {len(frames)} frame(s)")
+
+        for frame in frames:
+            if len(frame) == 1:
+                exchange, symbol = frame[0]
+                message = {"action": action, "symbol": symbol, "exchange": exchange, "mode": mode}
+            else:
+                message = {
+                    "action": action,
+                    "symbols": [{"symbol": symbol, "exchange": exchange} for exchange, symbol in frame],
+                    "mode": mode
+                }
+            if action == "subscribe":
+                message["depth"] = 5  # Default depth level
+
+            if batch_size is None:
+                exchange, symbol = frame[0]
+                if action == "subscribe":
+                    print(f"Subscribing to {exchange}:{symbol} {mode_name}")
+                else:
+                    print(f"Unsubscribing from {exchange}:{symbol}")
+            else:
+                self._wait_for_inflight()
+
             try:
-                self.ws.send(json.dumps(unsubscribe_msg))
-                
-                # Clean up the data
+                with self._ack_condition:
+                    for exchange, symbol in frame:
+                        if action == "subscribe":
+                            self.subscription_acks[(mode, f"{exchange}:{symbol}")] = "pending"
+                        else:
+                            self.subscription_acks.pop((mode, f"{exchange}:{symbol}"), None)
+                    self._inflight_frames += 1
                 with self.lock:
-                    symbol_key = f"{exchange}:{symbol}"
-                    if symbol_key in self.depth_data:
-                        del self.depth_data[symbol_key]
-                
-                # Small delay to ensure the message is processed separately
-                time.sleep(0.1)
+                    if action == "subscribe":
+                        self.subscriptions[mode].update(frame)
+                        for exchange, symbol in frame:
+                            symbol_id = self.symbols.intern(exchange, symbol)
+                            if mode in self.tick_store_modes:
+                                self._tick_ring(symbol_id)
+                    else:
+                        self.subscriptions[mode].difference_update(frame)
+                        for exchange, symbol in frame:
+                            if not any((exchange, symbol) in self.subscriptions[m] for m in self.tick_store_modes):
+                                self.tick_stores.pop(self.symbols.get(exchange, symbol), None)
+                self.ws.send(self.codec.dumps(message))
+
+                if action == "unsubscribe":
+                    # Clean up the data
+                    with self.lock:
+                        for exchange, symbol in frame:
+                            symbol_id = self.symbols.get(exchange, symbol)
+                            data_store.pop(symbol_id, None)
+                            if mode == 3 and self.depth_book is not None:
+                                self.depth_book.clear(symbol_id)
+
+                if batch_size is None:
+                    # Small delay to ensure the message is processed separately
+                    time.sleep(0.1)
             except Exception as e:
-                print(f"Error unsubscribing from {exchange}:{symbol}: {e}")
+                exchange, symbol = frame[0]
+                print(f"Error {action}ing {exchange}:{symbol}: {e}")
                 return False
         
         return True
 
+    def _wait_for_inflight(self) -> None:
+        """Block until fewer than max_inflight_frames frames await a server response."""
+        deadline = time.time() + self.ack_timeout
+        with self._ack_condition:
+            while self._inflight_frames >= self.max_inflight_frames and self.connected:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    # The server did not acknowledge in time; do not stall the pipeline forever
+                    self._inflight_frames = 0
+                    break
+                self._ack_condition.wait(remaining)
+
+    def _process_subscription_response(self, message: Dict[str, Any]) -> None:
+        """Record per-instrument acknowledgements and release flow control."""
+        with self._ack_condition:
+            self._inflight_frames = max(0, self._inflight_frames - 1)
+            if message.get("type") == "subscribe":
+                default_status = "success" if message.get("status") in ("success", "partial") else "error"
+                for item in message.get("subscriptions") or []:
+                    key = f"{item.get('exchange')}:{item.get('symbol')}"
+                    mode = item.get("mode")
+                    mode = self.MODE_CODES.get(mode, mode)
+                    status = item.get("status", default_status)
+                    if mode is None:
+                        for ack_mode, ack_key in list(self.subscription_acks):
+                            if ack_key == key and self.subscription_acks[(ack_mode, ack_key)] == "pending":
+                                self.subscription_acks[(ack_mode, ack_key)] = status
+                    else:
+                        self.subscription_acks[(mode, key)] = status
+            self._ack_condition.notify_all()
+
+    def get_subscription_acks(self, mode: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Get the per-instrument subscription acknowledgement map.
+
+        Args:
+            mode (int, optional): 1 (LTP), 2 (Quote) or 3 (Depth). Defaults to all modes.
+
+        Returns:
+            dict: {'EXCHANGE:SYMBOL': status} for one mode, or {mode: {'EXCHANGE:SYMBOL': status}}.
+                  status is 'pending' until the server responds, then 'success' or 'error'.
+        """
+        with self._ack_condition:
+            acks = {}
+            for (ack_mode, key), status in self.subscription_acks.items():
+                acks.setdefault(ack_mode, {})[key] = status
+        if mode is not None:
+            return acks.get(mode, {})
+        return acks
+
+    def get_symbol_id(self, exchange: str, symbol: str) -> Optional[int]:
+        """
+        Get the integer ID assigned to an instrument at subscribe time.
+
+        IDs are dense (0, 1, 2, ...) and stable for the lifetime of the client, so they can
+        index lists or arrays. Callbacks receive the same ID as 'symbol_id'.
+
+        Returns:
+            int: The symbol ID, or None if the instrument has not been subscribed or seen.
+        """
+        return self.symbols.get(exchange, symbol)
+
+    @property
+    def ltp_data(self) -> Mapping[str, Any]:
+        """Read-only view of the latest LTP per instrument: {'EXCHANGE:SYMBOL': {'price': price, 'timestamp': timestamp}}."""
+        return self._ltp_view
+
+    @property
+    def quotes_data(self) -> Mapping[str, Any]:
+        """Read-only view of the latest quote per instrument keyed by 'EXCHANGE:SYMBOL'."""
+        return self._quote_view
+
+    @property
+    def depth_data(self) -> Mapping[str, Any]:
+        """Read-only view of the latest depth per instrument keyed by 'EXCHANGE:SYMBOL'."""
+        return self._depth_view
+
     def get_ltp(self, exchange: str = None, symbol: str = None) -> Dict[str, Any]:
         """
         Get the latest LTP data in nested format.
@@ -713,30 +1416,27 @@ class FeedAPI(BaseAPI):
             result = {"ltp": {}}
             
             # Process each item in the data structure
-            for symbol_key, data in self.ltp_data.items():
-                # Extract exchange and symbol from the key (format: "EXCHANGE:SYMBOL")
-                if ":" in symbol_key:
-                    parts = symbol_key.split(":")
-                    ex = parts[0]  # Exchange
-                    sym = parts[1]  # Symbol
-                    
-                    # Filter by exchange if specified
-                    if exchange and ex != exchange:
-                        continue
-                        
-                    # Filter by symbol if specified
-                    if symbol and sym != symbol:
-                        continue
-                    
-                    # Initialize exchange dict if not exists
-                    if ex not in result["ltp"]:
-                        result["ltp"][ex] = {}
+            for symbol_id, data in self._ltp_store.items():
+                # Resolve exchange and symbol from the symbol ID
+                ex, sym = self.symbols.pair(symbol_id)
+                
+                # Filter by exchange if specified
+                if exchange and ex != exchange:
+                    continue
                     
-                    # Add data to the nested structure
-                    result["ltp"][ex][sym] = {
-                        "timestamp": data['timestamp'],
-                        "ltp": data['price']
-                    }
+                # Filter by symbol if specified
+                if symbol and sym != symbol:
+                    continue
+                
+                # Initialize exchange dict if not exists
+                if ex not in result["ltp"]:
+                    result["ltp"][ex] = {}
+                
+                # Add data to the nested structure
+                result["ltp"][ex][sym] = {
+                    "timestamp": data['timestamp'],
+                    "ltp": data['price']
+                }
             
             return result
             
@@ -765,35 +1465,32 @@ class FeedAPI(BaseAPI):
             result = {"quote": {}}
             
             # Process each item in the data structure
-            for symbol_key, data in self.quotes_data.items():
-                # Extract exchange and symbol from the key (format: "EXCHANGE:SYMBOL")
-                if ":" in symbol_key:
-                    parts = symbol_key.split(":")
-                    ex = parts[0]  # Exchange
-                    sym = parts[1]  # Symbol
-                    
-                    # Filter by exchange if specified
-                    if exchange and ex != exchange:
-                        continue
-                        
-                    # Filter by symbol if specified
-                    if symbol and sym != symbol:
-                        continue
-                    
-                    # Initialize exchange dict if not exists
-                    if ex not in result["quote"]:
-                        result["quote"][ex] = {}
+            for symbol_id, data in self._quote_store.items():
+                # Resolve exchange and symbol from the symbol ID
+                ex, sym = self.symbols.pair(symbol_id)
+                
+                # Filter by exchange if specified
+                if exchange and ex != exchange:
+                    continue
                     
-                    # Add data to the nested structure
-                    result["quote"][ex][sym] = {
-                        "timestamp": data['timestamp'],
-                        "open": data['open'],
-                        "high": data['high'],
-                        "low": data['low'],
-                        "close": data['close'],
-                        "ltp": data['ltp'],
-                        "volume": data.get('volume', 0)
-                    }
+                # Filter by symbol if specified
+                if symbol and sym != symbol:
+                    continue
+                
+                # Initialize exchange dict if not exists
+                if ex not in result["quote"]:
+                    result["quote"][ex] = {}
+                
+                # Add data to the nested structure
+                result["quote"][ex][sym] = {
+                    "timestamp": data['timestamp'],
+                    "open": data['open'],
+                    "high": data['high'],
+                    "low": data['low'],
+                    "close": data['close'],
+                    "ltp": data['ltp'],
+                    "volume": data.get('volume', 0)
+                }
             
             return result
             
@@ -825,69 +1522,66 @@ class FeedAPI(BaseAPI):
             result = {"depth": {}}
             
             # Process each item in the data structure
-            for symbol_key, data in self.depth_data.items():
-                # Extract exchange and symbol from the key (format: "EXCHANGE:SYMBOL")
-                if ":" in symbol_key:
-                    parts = symbol_key.split(":")
-                    ex = parts[0]  # Exchange
-                    sym = parts[1]  # Symbol
-                    
-                    # Filter by exchange if specified
-                    if exchange and ex != exchange:
-                        continue
-                        
-                    # Filter by symbol if specified
-                    if symbol and sym != symbol:
-                        continue
-                    
-                    # Initialize exchange dict if not exists
-                    if ex not in result["depth"]:
-                        result["depth"][ex] = {}
+            for symbol_id, data in self._depth_store.items():
+                # Resolve exchange and symbol from the symbol ID
+                ex, sym = self.symbols.pair(symbol_id)
+                
+                # Filter by exchange if specified
+                if exchange and ex != exchange:
+                    continue
                     
-                    # Initialize the symbol structure
-                    result["depth"][ex][sym] = {
-                        "timestamp": data.get('timestamp', int(time.time() * 1000)),
-                        "ltp": data.get('ltp', 0),
-                        "buyBook": {},
-                        "sellBook": {}
+                # Filter by symbol if specified
+                if symbol and sym != symbol:
+                    continue
+                
+                # Initialize exchange dict if not exists
+                if ex not in result["depth"]:
+                    result["depth"][ex] = {}
+                
+                # Initialize the symbol structure
+                result["depth"][ex][sym] = {
+                    "timestamp": data.get('timestamp', int(time.time() * 1000)),
+                    "ltp": data.get('ltp', 0),
+                    "buyBook": {},
+                    "sellBook": {}
+                }
+                
+                # Process buy depth book
+                buy_depth = data.get('depth', {}).get('buy', [])
+                for i, level in enumerate(buy_depth):
+                    level_num = str(i + 1)
+                    result["depth"][ex][sym]["buyBook"][level_num] = {
+                        "price": str(level.get('price', 0)),
+                        "qty": str(level.get('quantity', 0)),
+                        "orders": str(level.get('orders', 0))
+                    }
+                
+                # If there are fewer than 5 levels, add empty levels to complete the structure
+                for i in range(len(buy_depth), 5):
+                    level_num = str(i + 1)
+                    result["depth"][ex][sym]["buyBook"][level_num] = {
+                        "price": "0",
+                        "qty": "0",
+                        "orders": "0"
+                    }
+                
+                # Process sell depth book
+                sell_depth = data.get('depth', {}).get('sell', [])
+                for i, level in enumerate(sell_depth):
+                    level_num = str(i + 1)
+                    result["depth"][ex][sym]["sellBook"][level_num] = {
+                        "price": str(level.get('price', 0)),
+                        "qty": str(level.get('quantity', 0)),
+                        "orders": str(level.get('orders', 0))
+                    }
+                
+                # If there are fewer than 5 levels, add empty levels to complete the structure
+                for i in range(len(sell_depth), 5):
+                    level_num = str(i + 1)
+                    result["depth"][ex][sym]["sellBook"][level_num] = {
+                        "price": "0",
+                        "qty": "0",
+                        "orders": "0"
                     }
-                    
-                    # Process buy depth book
-                    buy_depth = data.get('depth', {}).get('buy', [])
-                    for i, level in enumerate(buy_depth):
-                        level_num = str(i + 1)
-                        result["depth"][ex][sym]["buyBook"][level_num] = {
-                            "price": str(level.get('price', 0)),
-                            "qty": str(level.get('quantity', 0)),
-                            "orders": str(level.get('orders', 0))
-                        }
-                    
-                    # If there are fewer than 5 levels, add empty levels to complete the structure
-                    for i in range(len(buy_depth), 5):
-                        level_num = str(i + 1)
-                        result["depth"][ex][sym]["buyBook"][level_num] = {
-                            "price": "0",
-                            "qty": "0",
-                            "orders": "0"
-                        }
-                    
-                    # Process sell depth book
-                    sell_depth = data.get('depth', {}).get('sell', [])
-                    for i, level in enumerate(sell_depth):
-                        level_num = str(i + 1)
-                        result["depth"][ex][sym]["sellBook"][level_num] = {
-                            "price": str(level.get('price', 0)),
-                            "qty": str(level.get('quantity', 0)),
-                            "orders": str(level.get('orders', 0))
-                        }
-                    
-                    # If there are fewer than 5 levels, add empty levels to complete the structure
-                    for i in range(len(sell_depth), 5):
-                        level_num = str(i + 1)
-                        result["depth"][ex][sym]["sellBook"][level_num] = {
-                            "price": "0",
-                            "qty": "0",
-                            "orders": "0"
-                        }
             
             return result
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+"""
+OpenAlgo Local Instrument Master
+    https://docs.openalgo.in
+"""
+
+from datetime import date, datetime
+import numpy as np
+
+STRING_FIELDS = ('symbol', 'brsymbol', 'name', 'exchange', 'brexchange', 'token', 'instrumenttype', 'expiry')
+NUMERIC_FIELDS = ('lotsize', 'strike', 'tick_size')
+
+class InstrumentMaster:
+    """
+    Offline instrument master with indexed lookups.
+
+    Records (as returned by DataAPI.search()) are held column-wise in NumPy
+    arrays with three indexes:
+    - symbols sorted per exchange for binary-search prefix lookups
+    - a hash on (exchange, token) and (exchange, symbol)
+    - rows sorted by (underlying, expiry, strike) for option chain lookups
+
+    search(), symbol() and strikes() answer from memory and return the same
+    response shapes as the REST endpoints.
+    """
+
+    def __init__(self, records=(), queries=None):
+        """
+        Attributes:
+        - records (iterable): Instrument dicts with the fields returned by DataAPI.search().
+        - queries (list, optional): (query, exchange) pairs the records were downloaded with,
+          used by refresh().
+        """
+        self.queries = list(queries or [])
+        records = list(records)
+        self.columns = {}
+        for field in STRING_FIELDS:
+            self.columns[field] = np.array([_text(record.get(field)) for record in records], dtype=str)
+        for field in NUMERIC_FIELDS:
+            self.columns[field] = np.array([_number(record.get(field)) for record in records], dtype=np.float64)
+        self._build_indexes()
+
+    @classmethod
+    def download(cls, client, queries, exchange=None):
+        """
+        Build a master from search() results.
+
+        Parameters:
+        - client: api or DataAPI instance.
+        - queries (list): Search queries, e.g. ["NIFTY", "BANKNIFTY", "RELIANCE"], or (query, exchange) pairs.
+        - exchange (str, optional): Exchange filter applied to plain string queries.
+
+        Returns:
+        InstrumentMaster
+        """
+        pairs = [query if isinstance(query, (tuple, list)) else (query, exchange) for query in queries]
+        records = []
+        for query, query_exchange in pairs:
+            result = client.search(query=query, exchange=query_exchange)
+            if result.get('status') != 'success':
+                raise RuntimeError(f"Instrument search failed for '{query}': {result.get('message')}")
+            records.extend(result.get('data') or [])
+        return cls(_unique(records), pairs)
+
+    def refresh(self, client):
+        """Re-download the master with the same queries and rebuild the indexes in place"""
+        fresh = self.download(client, self.queries)
+        self.columns = fresh.columns
+        self._build_indexes()
+        return self
+
+    def save(self, path):
+        """Save the master as a compressed .npz file"""
+        np.savez_compressed(path, queries=np.array([[q, e or ''] for q, e in self.queries], dtype=str).reshape(-1, 2),
+                            **self.columns)
+
+    @classmethod
+    def load(cls, path):
+        """Load a master saved with save()"""
+        with np.load(path, allow_pickle=False) as data:
+            master = cls()
+            master.columns = {field: data[field] for field in STRING_FIELDS + NUMERIC_FIELDS}
+            master.queries = [(str(query), str(exchange) or None) for query, exchange in data['queries']]
+        master._build_indexes()
+        return master
+
+    def __len__(self):
+        return len(self.columns['symbol'])
+
+    def _build_indexes(self):
+        symbols = self.columns['symbol']
+        exchanges = self.columns['exchange']
+        size = len(symbols)
+
+        # Prefix index: rows ordered by symbol, with per-exchange orderings for filtered search
+        self._by_symbol = np.argsort(symbols, kind='stable')
+        self._sorted_symbols = symbols[self._by_symbol]
+        self._by_exchange = {}
+        for exchange in np.unique(exchanges):
+            rows = self._by_symbol[exchanges[self._by_symbol] == exchange]
+            self._by_exchange[exchange] = (rows, symbols[rows])
+
+        # Hash indexes
+        self._token_index = {}
+        self._symbol_index = {}
+        for row in range(size):
+            self._token_index.setdefault((exchanges[row], self.columns['token'][row]), row)
+            self._symbol_index.setdefault((exchanges[row], symbols[row]), row)
+
+        # Option chain index sorted by (underlying, expiry, strike)
+        self._expiry_dates = np.array([_parse_expiry(value) for value in self.columns['expiry']], dtype='datetime64[D]')
+        self._option_type = np.array([symbol[-2:] if symbol[-2:] in ('CE', 'PE') else '' for symbol in symbols], dtype=str)
+        chain_rows = np.flatnonzero(self._option_type != '')
+        order = np.lexsort((self.columns['strike'][chain_rows], self._expiry_dates[chain_rows],
+                            self.columns['name'][chain_rows]))
+        self._chain_rows = chain_rows[order]
+        self._chain = {}
+        names = self.columns['name'][self._chain_rows]
+        for name in np.unique(names):
+            start = np.searchsorted(names, name, side='left')
+            end = np.searchsorted(names, name, side='right')
+            self._chain[name] = self._chain_rows[start:end]
+
+    def record(self, row):
+        """Return the instrument at a row as a dict"""
+        record = {field: str(self.columns[field][row]) for field in STRING_FIELDS}
+        for field in NUMERIC_FIELDS:
+            value = float(self.columns[field][row])
+            record[field] = int(value) if field == 'lotsize' and value == value else value
+        return record
+
+    def search(self, query, exchange=None, limit=None):
+        """
+        Find instruments whose symbol starts with query (case-insensitive).
+
+        Returns:
+        dict: {'status': 'success', 'data': [instrument, ...]} like DataAPI.search()
+        """
+        prefix = str(query).upper()
+        if exchange:
+            rows, sorted_symbols = self._by_exchange.get(exchange, (np.empty(0, dtype=np.int64), np.empty(0, dtype=str)))
+        else:
+            rows, sorted_symbols = self._by_symbol, self._sorted_symbols
+        start = np.searchsorted(sorted_symbols, prefix, side='left')
+        end = np.searchsorted(sorted_symbols, prefix + '\uffff', side='left')
+        matches = rows[start:end] if limit is None else rows[start:min(end, start + limit)]
+        return {'status': 'success', 'data': [self.record(row) for row in matches]}
+
+    def symbol(self, symbol, exchange):
+        """
+        Get details for a symbol.
+
+        Returns:
+        dict: {'status': 'success', 'data': instrument} like DataAPI.symbol(), or an error dict.
+        """
+        row = self._symbol_index.get((exchange, symbol))
+        if row is None:
+            return {
+                'status': 'error',
+                'message': f'Symbol {exchange}:{symbol} not found in instrument master',
+                'error_type': 'not_found'
+            }
+        return {'status': 'success', 'data': self.record(row)}
+
+    def token(self, token, exchange):
+        """Get details for an exchange token, or None if unknown"""
+        row = self._token_index.get((exchange, str(token)))
+        return None if row is None else self.record(row)
+
+    def expiries(self, underlying):
+        """Sorted option expiry dates for an underlying"""
+        rows = self._chain.get(underlying, np.empty(0, dtype=np.int64))
+        return np.unique(self._expiry_dates[rows])
+
+    def strikes(self, underlying, expiry, option_type=None):
+        """
+        Option strikes for an underlying and expiry.
+
+        Parameters:
+        - underlying (str): Underlying name, e.g. "NIFTY".
+        - expiry (str or date): Expiry as 'DD-MMM-YY', 'YYYY-MM-DD' or a date.
+        - option_type (str, optional): "CE" or "PE". Defaults to both.
+
+        Returns:
+        dict: {'status': 'success', 'data': [instrument, ...]} sorted by strike.
+        """
+        rows = self._chain_slice(underlying, expiry)
+        if option_type:
+            rows = rows[self._option_type[rows] == option_type]
+        return {'status': 'success', 'data': [self.record(row) for row in rows]}
+
+    def option(self, underlying, expiry, strike, option_type):
+        """Return the option contract at an exact strike, or None"""
+        rows = self._chain_slice(underlying, expiry)
+        strikes = self.columns['strike'][rows]
+        start = np.searchsorted(strikes, strike, side='left')
+        end = np.searchsorted(strikes, strike, side='right')
+        for row in rows[start:end]:
+            if self._option_type[row] == option_type:
+                return self.record(row)
+        return None
+
+    def _chain_slice(self, underlying, expiry):
+        rows = self._chain.get(underlying, np.empty(0, dtype=np.int64))
+        day = _parse_expiry(expiry)
+        if day is None:
+            return rows[:0]
+        day = np.datetime64(day, 'D')
+        expiries = self._expiry_dates[rows]
+        start, end = np.searchsorted(expiries, day, side='left'), np.searchsorted(expiries, day, side='right')
+        return rows[start:end]
+
+def _text(value):
+    return '' if value is None else str(value)
+
+def _number(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+def _parse_expiry(value):
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    value = str(value or '').strip().upper()
+    for pattern in ('%d-%b-%y', '%d-%b-%Y', '%Y-%m-%d', '%d%b%y'):
+        try:
+            return datetime.strptime(value, pattern).date()
+        except ValueError:
+            continue
+    return None
+
+def _unique(records):
+    seen = set()
+    unique = []
+    for record in records:
+        key = (record.get('exchange'), record.get('symbol'))
+        if key not in seen:
+            seen.add(key)
+            unique.append(record)
+    return unique
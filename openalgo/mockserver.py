@@ -0,0 +1,368 @@
+# -*- coding: utf-8 -*-
+"""
+OpenAlgo WebSocket Feed - Local Mock Server and Synthetic Tick Generator
+    https://docs.openalgo.in
+"""
+
+import base64
+import hashlib
+import json
+import random
+import socket
+import struct
+import threading
+import time
+
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+LOOPBACK_HOSTS = ("127.0.0.1", "localhost", "::1")
+MODE_NAMES = {1: "LTP", 2: "Quote", 3: "Depth"}
+
+class TickGenerator:
+    """
+    Synthetic market data for the mock server.
+
+    Prices follow a random walk per instrument, and the send rate follows a
+    steady or burst profile: rate ticks per second, switching to burst_rate
+    for burst_length seconds every burst_every seconds. A rate of 0 sends as
+    fast as the connection allows.
+    """
+
+    def __init__(self, rate=1000, burst_rate=None, burst_every=1.0, burst_length=0.1,
+                 depth_levels=5, precise_timestamps=False, seed=None):
+        """
+        Attributes:
+        - rate (float): Ticks per second per connection, 0 for no limit. Defaults to 1000.
+        - burst_rate (float, optional): Ticks per second during bursts. Defaults to no bursts.
+        - burst_every (float): Seconds between burst starts. Defaults to 1.0.
+        - burst_length (float): Seconds each burst lasts. Defaults to 0.1.
+        - depth_levels (int): Levels per side in depth frames. Defaults to 5.
+        - precise_timestamps (bool): Send fractional epoch-millisecond timestamps so
+          latency can be measured below a millisecond. Defaults to False (integer ms).
+        - seed (int, optional): Random seed for reproducible prices.
+        """
+        self.rate = rate
+        self.burst_rate = burst_rate
+        self.burst_every = burst_every
+        self.burst_length = burst_length
+        self.depth_levels = depth_levels
+        self.precise_timestamps = precise_timestamps
+        self._random = random.Random(seed)
+        self._prices = {}
+        self._volumes = {}
+
+    def rate_at(self, elapsed):
+        """Ticks per second at elapsed seconds into the stream (0 for no limit)"""
+        if self.burst_rate is not None and elapsed % self.burst_every < self.burst_length:
+            return self.burst_rate
+        return self.rate
+
+    def frame(self, exchange, symbol, mode):
+        """Build one market_data frame as a dict"""
+        key = (exchange, symbol)
+        price = self._prices.get(key)
+        if price is None:
+            price = self._random.uniform(100.0, 5000.0)
+        price = round(max(0.05, price * (1.0 + self._random.gauss(0.0, 0.0005))), 2)
+        self._prices[key] = price
+        volume = self._volumes[key] = self._volumes.get(key, 0) + self._random.randint(1, 500)
+        timestamp = time.time() * 1000
+        data = {"ltp": price, "timestamp": timestamp if self.precise_timestamps else int(timestamp)}
+        if mode == 2:
+            data.update(open=price, high=price, low=price, close=price, volume=volume,
+                        bid=round(price - 0.05, 2), ask=round(price + 0.05, 2))
+        elif mode == 3:
+            data["volume"] = volume
+            data["depth"] = {
+                "buy": [{"price": round(price - 0.05 * (i + 1), 2), "quantity": self._random.randint(1, 1000),
+                         "orders": self._random.randint(1, 20)} for i in range(self.depth_levels)],
+                "sell": [{"price": round(price + 0.05 * (i + 1), 2), "quantity": self._random.randint(1, 1000),
+                          "orders": self._random.randint(1, 20)} for i in range(self.depth_levels)],
+            }
+        return {"type": "market_data", "exchange": exchange, "symbol": symbol, "mode": mode, "data": data}
+
+class MockFeedServer:
+    """
+    Localhost stand-in for the OpenAlgo WebSocket server.
+
+    Speaks the authenticate / subscribe / unsubscribe / market_data protocol
+    over a minimal RFC 6455 implementation from the standard library, and
+    streams synthetic ticks from a TickGenerator for whatever each connection
+    has subscribed. Meant for tests and benchmarks; it only binds to loopback.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, api_key=None, generator=None):
+        """
+        Attributes:
+        - host (str): Loopback address to bind. Defaults to "127.0.0.1".
+        - port (int): Port to listen on, 0 for any free port. Defaults to 0.
+        - api_key (str, optional): Accepted API key. Defaults to accepting any key.
+        - generator (TickGenerator, optional): Tick source. Defaults to TickGenerator().
+        """
+        if host not in LOOPBACK_HOSTS:
+            raise ValueError("MockFeedServer only binds to localhost")
+        self.host = host
+        self.port = port
+        self.api_key = api_key
+        self.generator = generator or TickGenerator()
+        self.stats = {'connections': 0, 'frames_sent': 0, 'ticks_sent': 0, 'frames_received': 0}
+        self._socket = None
+        self._stop = threading.Event()
+        self._threads = []
+        self._connections = []
+        self._lock = threading.Lock()
+
+    @property
+    def url(self):
+        """ws:// URL to pass to FeedAPI(ws_url=...)"""
+        return f"ws://{self.host}:{self.port}"
+
+    def start(self):
+        """Start listening in a background thread and return the server."""
+        family = socket.AF_INET6 if self.host == "::1" else socket.AF_INET
+        self._socket = socket.socket(family, socket.SOCK_STREAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind((self.host, self.port))
+        self.port = self._socket.getsockname()[1]
+        self._socket.listen()
+        self._socket.settimeout(0.2)
+        self._stop.clear()
+        self._spawn(self._accept_loop)
+        return self
+
+    def stop(self, timeout=2.0):
+        """Close every connection and stop listening."""
+        self._stop.set()
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def _spawn(self, target, *args):
+        thread = threading.Thread(target=target, args=args, daemon=True)
+        self._threads.append(thread)
+        thread.start()
+
+    def _accept_loop(self):
+        while not self._stop.is_set():
+            try:
+                sock, _ = self._socket.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+            sock.settimeout(None)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            connection = _Connection(self, sock)
+            with self._lock:
+                self._connections.append(connection)
+                self.stats['connections'] += 1
+            self._spawn(connection.serve)
+
+    def _count(self, name, value=1):
+        with self._lock:
+            self.stats[name] += value
+
+class _Connection:
+    """One client connection: handshake, protocol handling and the tick stream"""
+
+    def __init__(self, server, sock):
+        self.server = server
+        self.sock = sock
+        self.authenticated = False
+        self.subscriptions = {}   # (exchange, symbol, mode) -> None, in subscription order
+        self.closed = threading.Event()
+        self._send_lock = threading.Lock()
+        self._subscription_lock = threading.Lock()
+        self._buffer = b""
+
+    def serve(self):
+        try:
+            if not self._handshake():
+                return
+            streamer = threading.Thread(target=self._stream, daemon=True)
+            streamer.start()
+            while not self.closed.is_set():
+                message = self._read_message()
+                if message is None:
+                    break
+                self.server._count('frames_received')
+                self._handle(message)
+        except OSError:
+            pass
+        finally:
+            self.close()
+
+    def close(self):
+        if self.closed.is_set():
+            return
+        self.closed.set()
+        try:
+            with self._send_lock:
+                self.sock.sendall(_encode_frame(b"", opcode=0x8))
+        except OSError:
+            pass
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
+
+    # -- RFC 6455 ------------------------------------------------------
+
+    def _recv(self, size):
+        while len(self._buffer) < size:
+            chunk = self.sock.recv(65536)
+            if not chunk:
+                raise OSError("connection closed")
+            self._buffer += chunk
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def _handshake(self):
+        while b"\r\n\r\n" not in self._buffer:
+            chunk = self.sock.recv(4096)
+            if not chunk:
+                return False
+            self._buffer += chunk
+        request, self._buffer = self._buffer.split(b"\r\n\r\n", 1)
+        headers = {}
+        for line in request.decode("latin-1").split("\r\n")[1:]:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        key = headers.get("sec-websocket-key")
+        if not key or "websocket" not in headers.get("upgrade", "").lower():
+            self.sock.sendall(b"HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\n\r\n")
+            return False
+        accept = base64.b64encode(hashlib.sha1((key + WS_GUID).encode()).digest()).decode()
+        self.sock.sendall(("HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                           f"Sec-WebSocket-Accept: {accept}\r\n\r\n").encode())
+        return True
+
+    def _read_message(self):
+        """Read one (possibly fragmented) text message; None once the client closes"""
+        parts = []
+        while True:
+            first, second = self._recv(2)
+            opcode = first & 0x0F
+            length = second & 0x7F
+            if length == 126:
+                length = struct.unpack(">H", self._recv(2))[0]
+            elif length == 127:
+                length = struct.unpack(">Q", self._recv(8))[0]
+            mask = self._recv(4) if second & 0x80 else None
+            payload = self._recv(length)
+            if mask:
+                payload = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+            if opcode == 0x8:
+                return None
+            if opcode == 0x9:
+                with self._send_lock:
+                    self.sock.sendall(_encode_frame(payload, opcode=0xA))
+                continue
+            if opcode == 0xA:
+                continue
+            parts.append(payload)
+            if first & 0x80:
+                return b"".join(parts).decode()
+
+    def send(self, message):
+        with self._send_lock:
+            self.sock.sendall(_encode_frame(json.dumps(message).encode()))
+        self.server._count('frames_sent')
+
+    # -- OpenAlgo protocol -----------------------------------------------
+
+    def _handle(self, text):
+        try:
+            message = json.loads(text)
+        except ValueError:
+            self.send({"type": "error", "status": "error", "message": "Invalid JSON"})
+            return
+        action = message.get("action")
+        if action == "authenticate":
+            api_key = self.server.api_key
+            self.authenticated = api_key is None or message.get("api_key") == api_key
+            self.send({"type": "auth", "status": "success" if self.authenticated else "error",
+                       "message": "Authentication successful" if self.authenticated else "Invalid API key"})
+            return
+        if not self.authenticated:
+            self.send({"type": "error", "status": "error", "message": "Not authenticated"})
+            return
+        if action not in ("subscribe", "unsubscribe"):
+            self.send({"type": "error", "status": "error", "message": f"Unknown action: {action}"})
+            return
+        mode = message.get("mode", 1)
+        mode = {"LTP": 1, "QUOTE": 2, "DEPTH": 3}.get(str(mode).upper(), mode)
+        symbols = message.get("symbols") or [{"exchange": message.get("exchange"), "symbol": message.get("symbol")}]
+        results = []
+        for item in symbols:
+            key = (item.get("exchange"), item.get("symbol"), mode)
+            with self._subscription_lock:
+                if action == "subscribe":
+                    self.subscriptions[key] = None
+                else:
+                    self.subscriptions.pop(key, None)
+            results.append({"exchange": key[0], "symbol": key[1], "mode": MODE_NAMES.get(mode, mode),
+                            "status": "success"})
+        if action == "subscribe":
+            self.send({"type": "subscribe", "status": "success", "subscriptions": results,
+                       "message": "Subscription processing complete"})
+        else:
+            self.send({"type": "unsubscribe", "status": "success", "subscriptions": results,
+                       "message": "Unsubscription processing complete"})
+
+    def _stream(self):
+        """Send ticks for the current subscriptions at the generator's rate"""
+        generator = self.server.generator
+        started = last = time.perf_counter()
+        budget = 0.0
+        position = 0
+        while not self.closed.is_set():
+            with self._subscription_lock:
+                subscriptions = list(self.subscriptions)
+            if not subscriptions:
+                time.sleep(0.001)
+                started = last = time.perf_counter()
+                budget = 0.0
+                continue
+            now = time.perf_counter()
+            rate = generator.rate_at(now - started)
+            if rate:
+                budget = min(budget + rate * (now - last), max(rate * 0.05, 1.0))
+                count = int(budget)
+                budget -= count
+            else:
+                count = len(subscriptions)
+            last = now
+            if count == 0:
+                time.sleep(0.0005)
+                continue
+            frames = []
+            for _ in range(count):
+                exchange, symbol, mode = subscriptions[position % len(subscriptions)]
+                position += 1
+                frames.append(_encode_frame(json.dumps(generator.frame(exchange, symbol, mode)).encode()))
+            try:
+                with self._send_lock:
+                    self.sock.sendall(b"".join(frames))
+            except OSError:
+                self.closed.set()
+                return
+            self.server._count('ticks_sent', count)
+
+def _encode_frame(payload, opcode=0x1):
+    """Encode an unmasked server-to-client frame"""
+    length = len(payload)
+    if length < 126:
+        header = struct.pack(">BB", 0x80 | opcode, length)
+    elif length < 65536:
+        header = struct.pack(">BBH", 0x80 | opcode, 126, length)
+    else:
+        header = struct.pack(">BBQ", 0x80 | opcode, 127, length)
+    return header + payload
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+OpenAlgo Client-Side Rate Limiting
+    https://docs.openalgo.in
+"""
+
+import asyncio
+import threading
+import time
+
+# Endpoint groups used to key the per-class rate limiters
+ENDPOINT_GROUPS = {
+    'placeorder': 'order',
+    'placesmartorder': 'order',
+    'basketorder': 'order',
+    'splitorder': 'order',
+    'modifyorder': 'order',
+    'cancelorder': 'order',
+    'cancelallorder': 'order',
+    'closeposition': 'order',
+    'optionsorder': 'order',
+    'quotes': 'quote',
+    'depth': 'quote',
+    'history': 'history',
+}
+
+class RateLimiter:
+    """
+    Thread-safe token bucket usable from threads and asyncio tasks.
+
+    Each caller reserves a token up front; when the bucket is empty the
+    reservation goes into debt and the caller sleeps until its slot comes up,
+    so bursts are smoothed into a steady rate instead of being rejected.
+    """
+
+    def __init__(self, rate, burst=None):
+        """
+        Attributes:
+        - rate (float): Sustained requests per second.
+        - burst (int, optional): Bucket capacity. Defaults to max(1, rate).
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1.0, rate))
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._waiting = 0
+        self.total_requests = 0
+        self.total_wait = 0.0
+
+    def _reserve(self):
+        """Take one token and return how long the caller must wait for it"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self.total_requests += 1
+            self.total_wait += delay
+            if delay > 0:
+                self._waiting += 1
+            return delay
+
+    def _release(self):
+        with self._lock:
+            self._waiting -= 1
+
+    def acquire(self):
+        """Block the calling thread until a token is available. Returns the time waited."""
+        delay = self._reserve()
+        if delay > 0:
+            try:
+                time.sleep(delay)
+            finally:
+                self._release()
+        return delay
+
+    async def acquire_async(self):
+        """Suspend the calling task until a token is available. Returns the time waited."""
+        delay = self._reserve()
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                self._release()
+        return delay
+
+    @property
+    def queue_depth(self):
+        """Number of callers currently waiting for a token"""
+        return self._waiting
+
+    @property
+    def wait_time(self):
+        """Seconds a request issued now would have to wait"""
+        with self._lock:
+            tokens = min(self.burst, self._tokens + (time.monotonic() - self._updated) * self.rate)
+        return max(0.0, (1 - tokens) / self.rate)
+
+    def status(self):
+        """Snapshot of the limiter state"""
+        return {
+            'rate': self.rate,
+            'burst': self.burst,
+            'queue_depth': self.queue_depth,
+            'wait_time': self.wait_time,
+            'total_requests': self.total_requests,
+            'total_wait': self.total_wait
+        }
+
+def build_rate_limiters(rate_limits):
+    """
+    Create limiters from a {group: rate} or {group: (rate, burst)} mapping.
+    Groups are 'order', 'quote' and 'history'.
+    """
+    limiters = {}
+    for group, limit in (rate_limits or {}).items():
+        if group not in set(ENDPOINT_GROUPS.values()):
+            raise ValueError(f"Unknown rate limit group '{group}'. Use one of: order, quote, history")
+        if isinstance(limit, RateLimiter):
+            limiters[group] = limit
+        elif isinstance(limit, (tuple, list)):
+            limiters[group] = RateLimiter(*limit)
+        else:
+            limiters[group] = RateLimiter(limit)
+    return limiters
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""
+OpenAlgo WebSocket Feed - Tick Recorder and Replayer
+    https://docs.openalgo.in
+"""
+
+import mmap
+import os
+import struct
+import threading
+import time
+import numpy as np
+
+MAGIC = b'OATR'
+VERSION = 1
+FILE_HEADER = struct.Struct('<4sHHq')   # magic, version, reserved, session start (epoch ns)
+RECORD_HEADER = struct.Struct('<qI')    # receive time (epoch ns), frame length
+
+class TickRecorder:
+    """
+    Appends market_data frames with their receive times to a binary log.
+
+    The log is a small file header followed by one record per frame: the
+    receive time in epoch nanoseconds, the frame length, and the frame bytes
+    exactly as they came off the socket. Replaying the bytes through the feed
+    reproduces the session, decoding included, so it also serves as a
+    throughput benchmark. Writes go through a large buffer; call flush() or
+    close() to make them visible to readers.
+    """
+
+    def __init__(self, path, buffer_size=1 << 20):
+        """
+        Attributes:
+        - path (str): Log file. An existing log is appended to.
+        - buffer_size (int): Write buffer in bytes. Defaults to 1 MiB.
+        """
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        if exists:
+            with open(path, 'rb') as f:
+                _check_header(f.read(FILE_HEADER.size), path)
+        self._file = open(path, 'ab', buffering=buffer_size)
+        if not exists:
+            self._file.write(FILE_HEADER.pack(MAGIC, VERSION, 0, time.time_ns()))
+        self.frames = 0
+        self.bytes = 0
+        self._lock = threading.Lock()
+
+    def write(self, frame, recv_ns=None):
+        """
+        Append a frame.
+
+        Parameters:
+        - frame (str or bytes): The raw WebSocket frame.
+        - recv_ns (int, optional): Receive time in epoch nanoseconds. Defaults to now.
+        """
+        if isinstance(frame, str):
+            frame = frame.encode()
+        record = RECORD_HEADER.pack(recv_ns if recv_ns is not None else time.time_ns(), len(frame))
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(record)
+            self._file.write(frame)
+            self.frames += 1
+            self.bytes += len(record) + len(frame)
+
+    def flush(self):
+        """Write buffered records to the file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def close(self):
+        """Flush and close the log."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+class TickLog:
+    """
+    Read-only, memory-mapped view of a recorded log.
+
+    Opening a log scans the record headers once to build NumPy arrays of
+    receive times, offsets and lengths; frames are then sliced straight out
+    of the mapping.
+    """
+
+    def __init__(self, path):
+        """
+        Attributes:
+        - path (str): Log file written by TickRecorder.
+        """
+        self.path = path
+        self._file = open(path, 'rb')
+        size = os.path.getsize(path)
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        _, _, _, self.session_start = _check_header(self._map[:FILE_HEADER.size], path)
+        recv_ns, offsets, lengths = [], [], []
+        position = FILE_HEADER.size
+        unpack = RECORD_HEADER.unpack_from
+        header_size = RECORD_HEADER.size
+        while position + header_size <= size:
+            received, length = unpack(self._map, position)
+            if position + header_size + length > size:
+                break  # Last record cut short by a crash
+            recv_ns.append(received)
+            offsets.append(position + header_size)
+            lengths.append(length)
+            position += header_size + length
+        self.recv_ns = np.array(recv_ns, dtype=np.int64)
+        self.offsets = np.array(offsets, dtype=np.int64)
+        self.lengths = np.array(lengths, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __getitem__(self, index):
+        """Return the bytes of frame index"""
+        start = int(self.offsets[index])
+        return self._map[start:start + int(self.lengths[index])]
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def close(self):
+        """Unmap and close the log."""
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+def _check_header(data, path):
+    if len(data) < FILE_HEADER.size:
+        raise ValueError(f"{path} is not an OpenAlgo tick log")
+    header = FILE_HEADER.unpack(data[:FILE_HEADER.size])
+    if header[0] != MAGIC or header[1] != VERSION:
+        raise ValueError(f"{path} is not an OpenAlgo tick log (version {VERSION})")
+    return header
+
+def replay(log, process, speed=None, start=0, stop=None):
+    """
+    Feed recorded frames to process() in their original order.
+
+    Parameters:
+    - log (TickLog): The recording.
+    - process (callable): Called with each frame's bytes, e.g. FeedAPI._process_message.
+    - speed (float, optional): 1.0 replays at the recorded pace, 10.0 ten times faster;
+      None or 0 replays as fast as possible. Defaults to None.
+    - start, stop (int): Range of frame indices to replay. Defaults to all.
+
+    Returns:
+    dict: {'frames', 'elapsed', 'frames_per_second', 'recorded_seconds', 'max_lag'}.
+    """
+    stop = len(log) if stop is None else min(stop, len(log))
+    frames = max(0, stop - start)
+    max_lag = 0.0
+    began = time.perf_counter()
+    if frames and speed:
+        first = log.recv_ns[start]
+        offsets = (log.recv_ns[start:stop] - first) / 1e9 / speed
+        for i in range(frames):
+            due = began + offsets[i]
+            now = time.perf_counter()
+            if due > now:
+                time.sleep(due - now)
+            elif now - due > max_lag:
+                max_lag = now - due
+            process(log[start + i])
+    else:
+        for i in range(start, stop):
+            process(log[i])
+    elapsed = time.perf_counter() - began
+    recorded = float(log.recv_ns[stop - 1] - log.recv_ns[start]) / 1e9 if frames else 0.0
+    return {
+        'frames': frames,
+        'elapsed': elapsed,
+        'frames_per_second': frames / elapsed if elapsed > 0 else 0.0,
+        'recorded_seconds': recorded,
+        'max_lag': max_lag,
+    }
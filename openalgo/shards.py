@@ -0,0 +1,360 @@
+# -*- coding: utf-8 -*-
+"""
+OpenAlgo WebSocket Feed - Sharded Multi-Connection Feed
+    https://docs.openalgo.in
+"""
+
+import threading
+from typing import List, Dict, Any, Callable, Optional
+from .feed import FeedAPI
+from .dispatch import TickDispatcher
+from .symbols import SymbolRegistry
+
+class ShardedFeed:
+    """
+    Spreads a large subscription set over several WebSocket connections.
+
+    Each shard is a FeedAPI with its own socket and reader thread, so frame
+    reads, decoding and store updates of different shards do not queue behind
+    one socket. Every instrument lives on exactly one shard, which keeps its
+    ticks in order; ticks of all shards are merged into one callback per mode
+    (optionally through a dispatcher that keeps per-symbol order).
+
+    New instruments go to the least-loaded shard. When unsubscribing leaves
+    the shards uneven, instruments are moved make-before-break: the target
+    shard subscribes first, and the source shard unsubscribes once the target
+    delivers its first tick, so the stream has no gap. Ticks from a shard that
+    no longer owns an instrument, or older than the last delivered tick, are
+    dropped.
+    """
+
+    def __init__(self, api_key, host="http://127.0.0.1:5000", version="v1", ws_port=8765, ws_url=None,
+                 shards=4, auto_rebalance=True, **kwargs):
+        """
+        Attributes:
+        - api_key (str): User's API key.
+        - host (str): Base URL for the API endpoints. Defaults to localhost.
+        - version (str): API version. Defaults to "v1".
+        - ws_port (int): WebSocket server port. Defaults to 8765.
+        - ws_url (str, optional): Custom WebSocket URL. If provided, this overrides host and ws_port settings.
+        - shards (int): Number of WebSocket connections. Defaults to 4.
+        - auto_rebalance (bool): Rebalance after unsubscribing. Defaults to True.
+        - **kwargs: Settings passed through to each shard's FeedAPI (timeout, json_codec, ...).
+        """
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+        self.shards = [FeedAPI(api_key, host, version, ws_port, ws_url, **kwargs) for _ in range(shards)]
+        self.auto_rebalance = auto_rebalance
+        self.symbols = SymbolRegistry()
+        self.assignments = {}   # (exchange, symbol) -> shard index that owns it
+        self.modes = {}         # (exchange, symbol) -> set of subscribed modes
+        self.instruments = {}   # (exchange, symbol) -> instrument dict as passed in
+        self.moving = {}        # (exchange, symbol) -> (source, target) while migrating
+        self.callbacks = {1: None, 2: None, 3: None}
+        self.dispatcher = None
+        self.stats = {'delivered': 0, 'dropped_stale': 0, 'moved': 0}
+        self._last = {}         # (exchange, symbol, mode) -> last delivered timestamp
+        self._lock = threading.RLock()
+        for index, shard in enumerate(self.shards):
+            handler = self._handler(index)
+            shard.ltp_callback = shard.quote_callback = shard.depth_callback = handler
+
+    # ------------------------------------------------------------------
+    # Connection
+    # ------------------------------------------------------------------
+
+    def connect(self, **kwargs) -> bool:
+        """
+        Connect and authenticate all shards in parallel.
+
+        Args:
+            **kwargs: Passed to each shard's FeedAPI.connect (auto_reconnect, reconnect_delay, ...).
+
+        Returns:
+            bool: True if every shard connected and authenticated.
+        """
+        results = [False] * len(self.shards)
+
+        def run(index):
+            results[index] = self.shards[index].connect(**kwargs)
+
+        threads = [threading.Thread(target=run, args=(i,), daemon=True) for i in range(len(self.shards))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return all(results)
+
+    def disconnect(self) -> None:
+        """Disconnect every shard."""
+        for shard in self.shards:
+            shard.disconnect()
+
+    def close(self) -> None:
+        """Disconnect every shard, stop the dispatcher and release the HTTP clients."""
+        self.stop_dispatcher()
+        for shard in self.shards:
+            shard.close()
+
+    # ------------------------------------------------------------------
+    # Delivery
+    # ------------------------------------------------------------------
+
+    def start_dispatcher(self, workers: int = 1, maxsize: int = 10000, overflow: str = "block",
+                         loop: Any = None, late_threshold: float = 1.0) -> TickDispatcher:
+        """
+        Run the merged callbacks on a worker pool or asyncio loop instead of the shard reader threads.
+        Ticks of one instrument always go to the same worker, so they stay in order.
+
+        Args: see FeedAPI.start_dispatcher().
+
+        Returns:
+            TickDispatcher: The running dispatcher.
+        """
+        self.stop_dispatcher()
+        self.dispatcher = TickDispatcher(workers, maxsize, overflow, loop, late_threshold)
+        return self.dispatcher
+
+    def stop_dispatcher(self, timeout: float = 5.0) -> None:
+        """Stop the dispatcher and go back to calling callbacks on the shard reader threads."""
+        dispatcher, self.dispatcher = self.dispatcher, None
+        if dispatcher is not None:
+            dispatcher.stop(timeout)
+
+    def _handler(self, index: int) -> Callable:
+        def on_data(data):
+            self._deliver(index, data)
+        return on_data
+
+    def _deliver(self, index: int, data: Dict[str, Any]) -> None:
+        """Merge a tick from shard index into the single delivery stream."""
+        pair = (data['exchange'], data['symbol'])
+        mode = data['mode']
+        timestamp = data['data'].get('timestamp') or 0
+        handover = None
+        with self._lock:
+            owner = self.assignments.get(pair)
+            if owner != index:
+                move = self.moving.get(pair)
+                if move is None or move[1] != index:
+                    self.stats['dropped_stale'] += 1
+                    return
+                # First tick from the target shard: it takes over the instrument
+                handover = move[0]
+            last_key = pair + (mode,)
+            if timestamp < self._last.get(last_key, 0):
+                self.stats['dropped_stale'] += 1
+                return
+            self._last[last_key] = timestamp
+            if handover is not None:
+                self.assignments[pair] = index
+                del self.moving[pair]
+                self.stats['moved'] += 1
+            self.stats['delivered'] += 1
+            callback = self.callbacks.get(mode)
+        if handover is not None:
+            threading.Thread(target=self._release, args=(handover, pair), daemon=True).start()
+        if callback is None:
+            return
+        data['symbol_id'] = symbol_id = self.symbols.intern(*pair)
+        dispatcher = self.dispatcher
+        if dispatcher is not None:
+            # Conflate per mode, but keep every mode of a symbol on one worker
+            dispatcher.submit((mode, symbol_id), callback, data, route=symbol_id)
+            return
+        try:
+            callback(data)
+        except Exception as e:
+            print(f"Error in sharded feed callback: {e}")
+
+    # ------------------------------------------------------------------
+    # Subscriptions
+    # ------------------------------------------------------------------
+
+    def subscribe_ltp(self, instruments: List[Dict[str, Any]], on_data_received: Optional[Callable] = None,
+                      batch_size: Optional[int] = None) -> bool:
+        """Subscribe to LTP updates, spreading instruments over the shards. Args as FeedAPI.subscribe_ltp()."""
+        return self._subscribe(1, instruments, on_data_received, batch_size)
+
+    def subscribe_quote(self, instruments: List[Dict[str, Any]], on_data_received: Optional[Callable] = None,
+                        batch_size: Optional[int] = None) -> bool:
+        """Subscribe to Quote updates, spreading instruments over the shards. Args as FeedAPI.subscribe_quote()."""
+        return self._subscribe(2, instruments, on_data_received, batch_size)
+
+    def subscribe_depth(self, instruments: List[Dict[str, Any]], on_data_received: Optional[Callable] = None,
+                        batch_size: Optional[int] = None) -> bool:
+        """Subscribe to Market Depth updates, spreading instruments over the shards. Args as FeedAPI.subscribe_depth()."""
+        return self._subscribe(3, instruments, on_data_received, batch_size)
+
+    def unsubscribe_ltp(self, instruments: List[Dict[str, Any]], batch_size: Optional[int] = None) -> bool:
+        """Unsubscribe from LTP updates and rebalance the shards."""
+        return self._unsubscribe(1, instruments, batch_size)
+
+    def unsubscribe_quote(self, instruments: List[Dict[str, Any]], batch_size: Optional[int] = None) -> bool:
+        """Unsubscribe from Quote updates and rebalance the shards."""
+        return self._unsubscribe(2, instruments, batch_size)
+
+    def unsubscribe_depth(self, instruments: List[Dict[str, Any]], batch_size: Optional[int] = None) -> bool:
+        """Unsubscribe from Market Depth updates and rebalance the shards."""
+        return self._unsubscribe(3, instruments, batch_size)
+
+    def _subscribe(self, mode: int, instruments: List[Dict[str, Any]], callback: Optional[Callable],
+                   batch_size: Optional[int]) -> bool:
+        if callback is not None:
+            self.callbacks[mode] = callback
+        groups = {}
+        with self._lock:
+            loads = self.get_shard_loads()
+            for instrument in instruments:
+                exchange, symbol = instrument.get("exchange"), instrument.get("symbol")
+                if not exchange or not symbol:
+                    print(f"Invalid instrument: {instrument}")
+                    continue
+                pair = (exchange, symbol)
+                index = self.assignments.get(pair)
+                if index is None:
+                    index = loads.index(min(loads))
+                    loads[index] += 1
+                    self.assignments[pair] = index
+                    self.instruments[pair] = instrument
+                    self.symbols.intern(exchange, symbol)
+                self.modes.setdefault(pair, set()).add(mode)
+                groups.setdefault(index, []).append(instrument)
+                move = self.moving.get(pair)
+                if move is not None:
+                    # Keep the target of an unfinished move in step
+                    groups.setdefault(move[1], []).append(instrument)
+        ok = True
+        for index, group in groups.items():
+            ok = self._send(index, "subscribe", mode, group, batch_size) and ok
+        return ok
+
+    def _unsubscribe(self, mode: int, instruments: List[Dict[str, Any]], batch_size: Optional[int]) -> bool:
+        groups = {}
+        with self._lock:
+            for instrument in instruments:
+                pair = (instrument.get("exchange"), instrument.get("symbol"))
+                index = self.assignments.get(pair)
+                if index is None or mode not in self.modes.get(pair, ()):
+                    continue
+                targets = [index]
+                move = self.moving.get(pair)
+                if move is not None:
+                    targets = list(move)
+                for target in targets:
+                    groups.setdefault(target, []).append(instrument)
+                self.modes[pair].discard(mode)
+                self._last.pop(pair + (mode,), None)
+                if not self.modes[pair]:
+                    del self.modes[pair], self.assignments[pair], self.instruments[pair]
+                    self.moving.pop(pair, None)
+        ok = True
+        for index, group in groups.items():
+            ok = self._send(index, "unsubscribe", mode, group, batch_size) and ok
+        if self.auto_rebalance:
+            self.rebalance(batch_size=batch_size)
+        return ok
+
+    def _send(self, index: int, action: str, mode: int, instruments: List[Dict[str, Any]],
+              batch_size: Optional[int]) -> bool:
+        shard = self.shards[index]
+        name = {1: "ltp", 2: "quote", 3: "depth"}[mode]
+        if action == "subscribe":
+            return getattr(shard, f"subscribe_{name}")(instruments, batch_size=batch_size)
+        return getattr(shard, f"unsubscribe_{name}")(instruments, batch_size=batch_size)
+
+    # ------------------------------------------------------------------
+    # Rebalancing
+    # ------------------------------------------------------------------
+
+    def get_shard_loads(self) -> List[int]:
+        """Number of instruments owned by each shard (an instrument being moved counts on its target)."""
+        with self._lock:
+            loads = [0] * len(self.shards)
+            for pair, index in self.assignments.items():
+                move = self.moving.get(pair)
+                loads[move[1] if move is not None else index] += 1
+            return loads
+
+    def rebalance(self, max_moves: Optional[int] = None, batch_size: Optional[int] = None) -> int:
+        """
+        Move instruments from the fullest to the emptiest shards until their loads differ by at most one.
+
+        Each move subscribes the instrument on the target shard first; the source shard unsubscribes
+        once the target delivers a tick for it.
+
+        Args:
+            max_moves: Maximum instruments to move in this call. Defaults to no limit.
+            batch_size: Passed to the shard subscribe calls.
+
+        Returns:
+            int: Number of moves started.
+        """
+        moves = []
+        with self._lock:
+            loads = self.get_shard_loads()
+            while max_moves is None or len(moves) < max_moves:
+                source = loads.index(max(loads))
+                target = loads.index(min(loads))
+                if loads[source] - loads[target] <= 1:
+                    break
+                pair = next((p for p, i in self.assignments.items() if i == source and p not in self.moving), None)
+                if pair is None:
+                    break
+                self.moving[pair] = (source, target)
+                loads[source] -= 1
+                loads[target] += 1
+                moves.append((pair, target, sorted(self.modes[pair])))
+        for pair, target, modes in moves:
+            for mode in modes:
+                self._send(target, "subscribe", mode, [self.instruments[pair]], batch_size)
+        return len(moves)
+
+    def _release(self, source: int, pair: tuple) -> None:
+        """Unsubscribe a moved instrument from the shard that used to own it."""
+        with self._lock:
+            instrument = self.instruments.get(pair)
+            modes = sorted(self.modes.get(pair, ()))
+        for mode in modes:
+            self._send(source, "unsubscribe", mode, [instrument], batch_size=1)
+
+    def get_shard_stats(self) -> List[Dict[str, Any]]:
+        """
+        Get the state of every shard.
+
+        Returns:
+            list: One dict per shard with 'instruments', 'connected', 'authenticated' and 'reconnects'.
+        """
+        loads = self.get_shard_loads()
+        return [{
+            'instruments': loads[index],
+            'connected': shard.connected,
+            'authenticated': shard.authenticated,
+            'reconnects': shard.get_reconnect_stats().get('reconnects', 0),
+        } for index, shard in enumerate(self.shards)]
+
+    # ------------------------------------------------------------------
+    # Snapshots
+    # ------------------------------------------------------------------
+
+    def get_ltp(self, exchange: str = None, symbol: str = None) -> Dict[str, Any]:
+        """Merged FeedAPI.get_ltp() of all shards."""
+        return self._merge("ltp", "get_ltp", exchange, symbol)
+
+    def get_quotes(self, exchange: str = None, symbol: str = None) -> Dict[str, Any]:
+        """Merged FeedAPI.get_quotes() of all shards."""
+        return self._merge("quote", "get_quotes", exchange, symbol)
+
+    def get_depth(self, exchange: str = None, symbol: str = None) -> Dict[str, Any]:
+        """Merged FeedAPI.get_depth() of all shards."""
+        return self._merge("depth", "get_depth", exchange, symbol)
+
+    def _merge(self, key: str, method: str, exchange: str, symbol: str) -> Dict[str, Any]:
+        result = {key: {}}
+        for index, shard in enumerate(self.shards):
+            for ex, symbols in getattr(shard, method)(exchange, symbol).get(key, {}).items():
+                for sym, data in symbols.items():
+                    # During a move both shards hold data; prefer the owner's
+                    if self.assignments.get((ex, sym)) == index or sym not in result[key].get(ex, {}):
+                        result[key].setdefault(ex, {})[sym] = data
+        return result
@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+"""
+OpenAlgo WebSocket Feed - Shared-Memory Tick Fan-Out
+    https://docs.openalgo.in
+"""
+
+import os
+import secrets
+import threading
+import time
+import numpy as np
+from multiprocessing import shared_memory
+
+try:
+    from multiprocessing import resource_tracker
+except ImportError:  # pragma: no cover - Windows
+    resource_tracker = None
+
+MAGIC = 0x4F41544B  # 'OATK'
+VERSION = 2
+HEADER_FIELDS = ('magic', 'version', 'capacity', 'max_symbols', 'head', 'symbol_count', 'pid', 'token')
+HEADER_SIZE = 64
+NAME_SIZE = 64
+
+SLOT_DTYPE = np.dtype([
+    ('seq', '<u8'), ('symbol_id', '<i4'), ('mode', '<i4'), ('timestamp', '<i8'),
+    ('ltp', '<f8'), ('open', '<f8'), ('high', '<f8'), ('low', '<f8'), ('close', '<f8'),
+    ('volume', '<f8'), ('bid', '<f8'), ('ask', '<f8'),
+])
+TICK_FIELDS = SLOT_DTYPE.names[3:]
+
+def _header(shm):
+    return np.ndarray(len(HEADER_FIELDS), dtype='<i8', buffer=shm.buf).tolist()
+
+def _owner_pid(shm):
+    """Publisher pid stored in a block's header, or None if it is not a tick ring of this version"""
+    if shm.size < HEADER_SIZE:
+        return None
+    header = _header(shm)
+    return header[6] if header[0] == MAGIC and header[1] == VERSION else None
+
+def _attach(name):
+    """
+    Open an existing block. Python registers every opened block with the resource tracker,
+    which unlinks it at exit; only the process that created the block should do that.
+    """
+    shm = shared_memory.SharedMemory(name=name)
+    if _owner_pid(shm) != os.getpid() and resource_tracker is not None and hasattr(resource_tracker, "unregister"):
+        try:
+            resource_tracker.unregister(shm._name, "shared_memory")
+        except Exception:
+            pass
+    return shm
+
+if os.name == 'nt':
+    def _pid_alive(pid):
+        # os.kill(pid, 0) would send CTRL_C_EVENT on Windows, so ask the kernel instead
+        import ctypes
+        kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+        handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            return ctypes.get_last_error() == 5  # ERROR_ACCESS_DENIED: it exists but is not ours
+        try:
+            code = ctypes.c_ulong()
+            if not kernel32.GetExitCodeProcess(handle, ctypes.byref(code)):
+                return True
+            return code.value == 259  # STILL_ACTIVE
+        finally:
+            kernel32.CloseHandle(handle)
+else:
+    def _pid_alive(pid):
+        try:
+            os.kill(pid, 0)  # Signal 0 only checks that the process exists
+        except ProcessLookupError:
+            return False
+        except OSError:
+            return True
+        return True
+
+def _layout(buf, capacity, max_symbols):
+    """Map the header, symbol table and slots onto a shared memory buffer"""
+    header = np.ndarray(len(HEADER_FIELDS), dtype='<i8', buffer=buf)
+    names = np.ndarray(max_symbols, dtype=f'S{NAME_SIZE}', buffer=buf, offset=HEADER_SIZE)
+    slots = np.ndarray(capacity, dtype=SLOT_DTYPE, buffer=buf, offset=HEADER_SIZE + NAME_SIZE * max_symbols)
+    return header, names, slots
+
+class TickPublisher:
+    """
+    Writes decoded ticks into a shared-memory ring that other local processes read.
+
+    The block holds a header, a table of 'EXCHANGE:SYMBOL' names indexed by
+    symbol ID, and a ring of fixed-size tick slots. Every slot carries its own
+    sequence number used as a seqlock: it is odd while the slot is being
+    written and 2 * n + 2 once tick n is complete, so readers can tell a
+    finished tick from a torn or overwritten one without any locks.
+
+    There is a single writer; readers never block it, and a reader that falls
+    more than capacity ticks behind loses the overwritten ticks. The header
+    records the publisher's pid, so a block left behind by a crashed process
+    is replaced, while a block with a live publisher is never taken over
+    unless overwrite=True.
+    """
+
+    def __init__(self, name="openalgo-ticks", capacity=65536, max_symbols=4096, overwrite=False):
+        """
+        Attributes:
+        - name (str): Shared memory block name that subscribers attach to. Defaults to "openalgo-ticks".
+        - capacity (int): Tick slots in the ring. Defaults to 65536.
+        - max_symbols (int): Size of the symbol table; ticks with higher symbol IDs are skipped. Defaults to 4096.
+        - overwrite (bool): Replace an existing block even if its publisher is still running. Defaults to False,
+          which raises FileExistsError for a live publisher.
+        """
+        self.capacity = int(capacity)
+        self.max_symbols = int(max_symbols)
+        size = HEADER_SIZE + NAME_SIZE * self.max_symbols + SLOT_DTYPE.itemsize * self.capacity
+        try:
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            existing = _attach(name)
+            owner = _owner_pid(existing)
+            if not overwrite and (owner is None or _pid_alive(owner)):
+                existing.close()
+                raise FileExistsError(
+                    f"Shared memory block '{name}' is in use" + (f" by publisher pid {owner}" if owner else "") +
+                    "; choose another name or pass overwrite=True") from None
+            # A block left behind by a publisher that did not shut down cleanly
+            existing.close()
+            stale = shared_memory.SharedMemory(name=name)
+            stale.close()
+            stale.unlink()
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        self.name = self.shm.name
+        self.header, self.names, self.slots = _layout(self.shm.buf, self.capacity, self.max_symbols)
+        self.slots[:] = np.zeros(1, dtype=SLOT_DTYPE)
+        self._seq = self.slots['seq']
+        self.token = secrets.randbits(62)
+        self.header[:] = (MAGIC, VERSION, self.capacity, self.max_symbols, 0, 0, os.getpid(), self.token)
+        self.head = 0
+        self.skipped = 0
+        self._lock = threading.Lock()
+
+    def publish(self, symbol_id, symbol_key, mode, timestamp, ltp, open=np.nan, high=np.nan, low=np.nan,
+                close=np.nan, volume=np.nan, bid=np.nan, ask=np.nan):
+        """
+        Append a tick to the ring.
+
+        Parameters:
+        - symbol_id (int): Dense symbol ID (the feed's), indexing the shared symbol table.
+        - symbol_key (str): 'EXCHANGE:SYMBOL', written to the table the first time an ID is seen.
+        - mode (int): Feed mode the tick came from (1 LTP, 2 Quote, 3 Depth).
+        """
+        if symbol_id >= self.max_symbols:
+            self.skipped += 1
+            return
+        with self._lock:
+            if self.header is None:
+                return
+            if symbol_id >= self.header[5]:
+                self.header[5] = symbol_id + 1
+            if not self.names[symbol_id]:
+                self.names[symbol_id] = symbol_key.encode()[:NAME_SIZE]
+            n = self.head
+            i = n % self.capacity
+            self._seq[i] = 2 * n + 1
+            self.slots[i] = (2 * n + 1, symbol_id, mode, timestamp, ltp, open, high, low, close, volume, bid, ask)
+            self._seq[i] = 2 * n + 2
+            self.head = n + 1
+            self.header[4] = n + 1
+
+    def close(self):
+        """Release the shared memory block and remove it, unless another publisher has replaced it."""
+        with self._lock:
+            if self.header is None:
+                return
+            self.header = self.names = self.slots = self._seq = None
+        self.shm.close()
+        try:
+            current = _attach(self.name)
+        except FileNotFoundError:
+            return
+        owned = _header(current)[7] == self.token
+        current.close()
+        if owned:
+            self.shm.unlink()
+
+class TickSubscriber:
+    """
+    Reads the ticks of a TickPublisher from another process, without a socket.
+
+    slots is a NumPy view straight onto the shared ring. poll() copies the new
+    slots out in one vectorized slice and keeps only those whose sequence
+    number shows a complete tick, so a tick overwritten while being read is
+    never returned half-updated.
+    """
+
+    def __init__(self, name="openalgo-ticks", from_start=False):
+        """
+        Attributes:
+        - name (str): Shared memory block name used by the publisher. Defaults to "openalgo-ticks".
+        - from_start (bool): Start with the oldest tick still in the ring rather than the next new one.
+          Defaults to False.
+        """
+        self.shm = _attach(name)
+        header = np.ndarray(len(HEADER_FIELDS), dtype='<i8', buffer=self.shm.buf)
+        if header[0] != MAGIC or header[1] != VERSION:
+            self.shm.close()
+            raise ValueError(f"Shared memory block '{name}' is not an OpenAlgo tick ring")
+        self.capacity = int(header[2])
+        self.max_symbols = int(header[3])
+        self.header, self.names, self.slots = _layout(self.shm.buf, self.capacity, self.max_symbols)
+        head = int(self.header[4])
+        self.cursor = max(0, head - self.capacity) if from_start else head
+        self.lost = 0
+        self._keys = {}
+
+    def poll(self, max_ticks=None, timeout=None):
+        """
+        Return the ticks published since the last call.
+
+        Parameters:
+        - max_ticks (int, optional): Maximum ticks to return. Defaults to all available.
+        - timeout (float, optional): Seconds to wait for at least one tick. Defaults to not waiting.
+
+        Returns:
+        numpy.ndarray: Structured array (SLOT_DTYPE) with fields seq, symbol_id, mode, timestamp, ltp,
+        open, high, low, close, volume, bid and ask, oldest first.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        head = int(self.header[4])
+        while head == self.cursor and deadline is not None and time.monotonic() < deadline:
+            time.sleep(0.0005)
+            head = int(self.header[4])
+        if head - self.cursor > self.capacity:
+            self.lost += head - self.capacity - self.cursor
+            self.cursor = head - self.capacity
+        end = head if max_ticks is None else min(head, self.cursor + int(max_ticks))
+        if end <= self.cursor:
+            return np.empty(0, dtype=SLOT_DTYPE)
+        positions = np.arange(self.cursor, end, dtype=np.uint64)
+        index = positions % self.capacity
+        start = int(index[0])
+        if start + len(index) <= self.capacity:
+            ticks = self.slots[start:start + len(index)].copy()
+        else:
+            ticks = self.slots[index]
+        # Seqlock check: the sequence must match before and after the copy
+        expected = 2 * positions + 2
+        after = self.slots['seq'][index]
+        valid = (ticks['seq'] == expected) & (after == expected)
+        if not valid.all():
+            # A slot still being written ends the batch; slots reused by newer ticks are lost
+            pending = np.flatnonzero(~valid & (after < expected))
+            if len(pending):
+                cut = int(pending[0])
+                end = self.cursor + cut
+                ticks, valid, after, expected = ticks[:cut], valid[:cut], after[:cut], expected[:cut]
+            self.lost += int(np.count_nonzero(~valid))
+            ticks = ticks[valid]
+        self.cursor = end
+        return ticks
+
+    def symbol(self, symbol_id):
+        """Return (exchange, symbol) of a symbol ID"""
+        return tuple(self.key(symbol_id).split(':', 1))
+
+    def key(self, symbol_id):
+        """Return 'EXCHANGE:SYMBOL' of a symbol ID"""
+        key = self._keys.get(symbol_id)
+        if key is None:
+            key = self._keys[symbol_id] = self.names[symbol_id].decode()
+        return key
+
+    def close(self):
+        """Detach from the shared memory block."""
+        self.header = self.names = self.slots = None
+        self.shm.close()
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+OpenAlgo WebSocket Feed - Symbol Registry
+    https://docs.openalgo.in
+"""
+
+import threading
+from collections.abc import Mapping
+
+class SymbolRegistry:
+    """
+    Assigns dense integer IDs to (exchange, symbol) pairs.
+
+    IDs start at 0 and are never reused, so they can index arrays and lists.
+    Looking up a known pair is two dict lookups on the incoming strings and
+    allocates nothing; the 'EXCHANGE:SYMBOL' key of every ID is built once.
+    """
+
+    def __init__(self):
+        self.ids = {}        # exchange -> {symbol: id}
+        self.exchanges = []  # id -> exchange
+        self.symbols = []    # id -> symbol
+        self.keys = []       # id -> 'EXCHANGE:SYMBOL'
+        self._lock = threading.Lock()
+
+    def intern(self, exchange, symbol):
+        """Return the ID of an instrument, assigning the next ID if it is new"""
+        by_symbol = self.ids.get(exchange)
+        if by_symbol is not None:
+            symbol_id = by_symbol.get(symbol)
+            if symbol_id is not None:
+                return symbol_id
+        with self._lock:
+            by_symbol = self.ids.setdefault(exchange, {})
+            symbol_id = by_symbol.get(symbol)
+            if symbol_id is None:
+                symbol_id = len(self.keys)
+                self.exchanges.append(exchange)
+                self.symbols.append(symbol)
+                self.keys.append(f"{exchange}:{symbol}")
+                by_symbol[symbol] = symbol_id
+            return symbol_id
+
+    def get(self, exchange, symbol):
+        """Return the ID of an instrument, or None if it has not been registered"""
+        by_symbol = self.ids.get(exchange)
+        return by_symbol.get(symbol) if by_symbol is not None else None
+
+    def key(self, symbol_id):
+        """Return 'EXCHANGE:SYMBOL' for an ID"""
+        return self.keys[symbol_id]
+
+    def pair(self, symbol_id):
+        """Return (exchange, symbol) for an ID"""
+        return self.exchanges[symbol_id], self.symbols[symbol_id]
+
+    def __len__(self):
+        return len(self.keys)
+
+class SymbolKeyedView(Mapping):
+    """
+    Read-only 'EXCHANGE:SYMBOL'-keyed view of a store keyed by symbol ID.
+
+    Lookups go through the registry, so reading one instrument costs a split
+    and two dict lookups however many instruments the store holds, and nothing
+    is copied. The view is live: it reflects later updates to the store.
+    """
+
+    def __init__(self, registry, store):
+        """
+        Attributes:
+        - registry (SymbolRegistry): Registry that assigned the store's IDs.
+        - store (dict): {symbol_id: value}.
+        """
+        self._registry = registry
+        self._store = store
+
+    def __getitem__(self, key):
+        exchange, _, symbol = key.partition(':')
+        symbol_id = self._registry.get(exchange, symbol)
+        if symbol_id is None:
+            raise KeyError(key)
+        try:
+            return self._store[symbol_id]
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __iter__(self):
+        keys = self._registry.keys
+        for symbol_id in list(self._store):
+            yield keys[symbol_id]
+
+    def __len__(self):
+        return len(self._store)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self.items())!r})"
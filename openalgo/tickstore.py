@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+OpenAlgo WebSocket Feed - Tick Ring Buffer
+    https://docs.openalgo.in
+"""
+
+import numpy as np
+
+TICK_FIELDS = ('timestamp', 'ltp', 'volume', 'bid', 'ask')
+
+class TickRing:
+    """
+    Fixed-capacity columnar ring buffer of ticks for one instrument.
+
+    Columns are preallocated at twice the capacity and every tick is written
+    to two mirrored slots, so the last N ticks are always one contiguous slice.
+    window() therefore returns read-only NumPy views without copying, ready
+    for ta.* functions.
+
+    Views share memory with the ring: once more than capacity - N further
+    ticks have arrived, the slots behind an old view are reused. Copy a
+    window if it must outlive that.
+    """
+
+    def __init__(self, capacity=10000):
+        """
+        Attributes:
+        - capacity (int): Number of most recent ticks kept. Defaults to 10000.
+        """
+        self.capacity = max(1, int(capacity))
+        self.columns = {'timestamp': np.zeros(2 * self.capacity, dtype=np.int64)}
+        for field in TICK_FIELDS[1:]:
+            self.columns[field] = np.full(2 * self.capacity, np.nan, dtype=np.float64)
+        self.count = 0  # Total ticks appended
+
+    def append(self, timestamp, ltp, volume=np.nan, bid=np.nan, ask=np.nan):
+        """Add a tick, overwriting the oldest one when the ring is full"""
+        i = self.count % self.capacity
+        j = i + self.capacity
+        columns = self.columns
+        columns['timestamp'][i] = columns['timestamp'][j] = timestamp
+        columns['ltp'][i] = columns['ltp'][j] = ltp
+        columns['volume'][i] = columns['volume'][j] = volume
+        columns['bid'][i] = columns['bid'][j] = bid
+        columns['ask'][i] = columns['ask'][j] = ask
+        self.count += 1
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    def window(self, n=None):
+        """
+        Return the last n ticks (all buffered ticks by default) as zero-copy views.
+
+        Returns:
+        dict: {'timestamp': int64 view, 'ltp': float64 view, 'volume', 'bid', 'ask'}, oldest first.
+        """
+        size = len(self)
+        n = size if n is None else max(0, min(int(n), size))
+        end = (self.count - 1) % self.capacity + self.capacity + 1 if self.count else 0
+        views = {}
+        for name, values in self.columns.items():
+            view = values[end - n:end]
+            view.flags.writeable = False
+            views[name] = view
+        return views
+
+    def last(self):
+        """Return the newest tick as a dict, or None if the ring is empty"""
+        if not self.count:
+            return None
+        i = (self.count - 1) % self.capacity
+        tick = {name: float(values[i]) for name, values in self.columns.items()}
+        tick['timestamp'] = int(self.columns['timestamp'][i])
+        return tick
@@ -17,6 +17,10 @@ setup(
         "numpy>=2.0.0",
         "numba>=0.61.0"
     ],
+    extras_require={
+        "http2": ["httpx[http2]>=0.23.0"],
+        "fastjson": ["msgspec>=0.18.0", "orjson>=3.8.0"]
+    },
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Developers",
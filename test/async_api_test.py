@@ -0,0 +1,54 @@
+"""
+OpenAlgo Asyncio Client Test
+Verifies that AsyncAPI mirrors the synchronous api methods and error shapes.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import asyncio
+import httpx
+from openalgo import AsyncAPI
+from helpers import make_client
+
+def test_async_requests():
+    """Endpoint methods return awaitables that resolve to the usual dicts"""
+    print("\n🔍 TESTING ASYNCIO CLIENT")
+    print("=" * 50)
+
+    def handler(request):
+        if request.url.path.endswith("/history"):
+            return httpx.Response(200, json={"status": "success", "data": [
+                {"timestamp": 1700000060, "open": 2, "high": 2, "low": 2, "close": 2, "volume": 20},
+                {"timestamp": 1700000000, "open": 1, "high": 1, "low": 1, "close": 1, "volume": 10},
+            ]})
+        if request.url.path.endswith("/funds"):
+            return httpx.Response(500, text="Internal Server Error")
+        return httpx.Response(200, json={"status": "success", "data": {"ltp": 100}})
+
+    async def run():
+        async with make_client(handler, AsyncAPI) as client:
+            quotes = await asyncio.gather(*[
+                client.quotes(symbol=symbol, exchange="NSE") for symbol in ("RELIANCE", "INFY", "TCS")
+            ])
+            order = await client.placeorder(symbol="RELIANCE", action="BUY", exchange="NSE")
+            funds = await client.funds()
+            df = await client.history(symbol="RELIANCE", exchange="NSE", interval="1m",
+                                      start_date="2023-11-14", end_date="2023-11-14")
+        return client, quotes, order, funds, df
+
+    client, quotes, order, funds, df = asyncio.run(run())
+
+    print(f"✅ Concurrent quotes: {quotes}")
+    assert all(q['data']['ltp'] == 100 for q in quotes)
+    assert order['status'] == 'success'
+    print(f"✅ HTTP error shape: {funds}")
+    assert funds['error_type'] == 'http_error'
+    print(f"✅ History rows: {len(df)}")
+    assert list(df['close']) == [1, 2]
+    assert client.client.is_closed
+
+if __name__ == "__main__":
+    test_async_requests()
+    print("\n✅ ASYNCIO CLIENT TEST COMPLETED!")
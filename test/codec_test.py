@@ -0,0 +1,115 @@
+"""
+OpenAlgo JSON Codec Test
+Tests the pluggable JSON codecs used for REST responses and feed frames.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import json
+import httpx
+import numpy as np
+from openalgo import api
+from openalgo.codec import available_codecs, get_codec
+from helpers import make_client
+
+FRAMES = [
+    {"type": "auth", "status": "success"},
+    {"type": "market_data", "exchange": "NSE", "symbol": "INFY", "mode": 1, "data": {"ltp": 1500.5, "timestamp": 1, "ltt": 7}},
+    {"type": "market_data", "exchange": "NSE", "symbol": "INFY", "mode": 2,
+     "data": {"ltp": 1501, "open": 1490, "high": 1510.5, "low": 1480, "close": 1495, "volume": 12345, "timestamp": 2}},
+    {"type": "market_data", "exchange": "NSE", "symbol": "INFY", "mode": 3,
+     "data": {"ltp": 1501, "timestamp": 3, "depth": {"buy": [{"price": 1500.9, "quantity": 10, "orders": 2}], "sell": []}}},
+    {"type": "market_data", "exchange": "NSE", "symbol": "INFY", "mode": 1, "data": {"ltp": "bad", "timestamp": 4}},
+    # Nulls stay None and unknown fields are kept, whichever codec decodes the frame
+    {"type": "market_data", "exchange": "NSE", "symbol": "TCS", "mode": 1, "data": {"ltp": 3500, "timestamp": None}},
+    {"type": "market_data", "exchange": "NSE", "symbol": "TCS", "mode": 1,
+     "data": {"ltp": 3501, "timestamp": 5, "data": {"ltt": 9}}},
+    {"type": "market_data", "exchange": "NSE", "symbol": "TCS", "mode": 2,
+     "data": {"ltp": 3502, "open": None, "volume": None, "oi": 7, "timestamp": 6}},
+    {"type": "market_data", "exchange": "NSE", "symbol": "TCS", "mode": 3, "broker": "test",
+     "data": {"ltp": None, "timestamp": 7, "depth": {"buy": [], "sell": []}}},
+]
+
+def run_feed(codec):
+    client = api(api_key="test_key_1234567890", host="http://127.0.0.1:5000", json_codec=codec)
+    received = []
+    client.ltp_callback = client.quote_callback = client.depth_callback = received.append
+    for frame in FRAMES:
+        client._process_message(json.dumps(frame))
+    client._process_message("{not json")
+    return received, client.get_quotes(), client.get_depth()
+
+def test_codecs_agree():
+    """Every installed codec yields the same callbacks and stores as the stdlib codec"""
+    print("\n🔍 TESTING JSON CODECS")
+    print("=" * 50)
+
+    print(f"✅ Available codecs: {available_codecs()}")
+    expected = run_feed("json")
+    assert [tick['data'].get('ltt') for tick in expected[0][:1]] == [7]
+    for name in available_codecs():
+        codec = get_codec(name)
+        payload = {"quantity": np.int64(5), "price": np.float64(1.5), "symbol": np.str_("INFY")}
+        assert json.loads(codec.dumps(payload)) == {"quantity": 5, "price": 1.5, "symbol": "INFY"}
+        assert run_feed(name) == expected, name
+        for frame in FRAMES[1:]:
+            decoded = codec.decode_frame(json.dumps(frame))
+            for key, value in frame['data'].items():
+                assert key in decoded['data'] and decoded['data'].get(key, "absent") == value, (name, key)
+            assert "bid" not in decoded['data'] and decoded['data'].get("bid", "absent") == "absent"
+        if name == "msgspec":
+            assert type(codec.decode_frame(json.dumps(FRAMES[1]))).__name__ == "MarketDataFrame"
+
+def test_rest_codec():
+    """REST requests are encoded and responses decoded with the selected codec"""
+    print("\n🔍 TESTING REST CODEC")
+    print("=" * 50)
+
+    def handler(request):
+        assert json.loads(request.content) == {"apikey": "test_key_1234567890", "symbol": "INFY", "exchange": "NSE"}
+        return httpx.Response(200, content=b'{"status": "success", "data": {"ltp": 1500.5}}')
+
+    for name in available_codecs():
+        with make_client(handler, api_key="test_key_1234567890", json_codec=name) as client:
+            assert client.quotes(symbol="INFY", exchange="NSE") == {"status": "success", "data": {"ltp": 1500.5}}
+        with make_client(lambda request: httpx.Response(200, content=b"<html>"), api_key="test_key_1234567890",
+                         json_codec=name) as client:
+            assert client.quotes(symbol="INFY", exchange="NSE")['error_type'] == 'json_error'
+
+def test_feed_frames():
+    """Outgoing feed frames are encoded by the selected codec, with identical bytes for every codec"""
+    print("\n🔍 TESTING FEED FRAME ENCODING")
+    print("=" * 50)
+
+    class RecordingSocket:
+        def __init__(self):
+            self.frames = []
+
+        def send(self, frame):
+            self.frames.append(frame)
+
+    sent = {}
+    for name in available_codecs():
+        client = api(api_key="test_key_1234567890", host="http://127.0.0.1:5000", json_codec=name)
+        client.ws = RecordingSocket()
+        client.connected = True
+        client._authenticate()
+        client.authenticated = True
+        client.subscribe_ltp([{"exchange": "NSE", "symbol": "INFY"}, {"exchange": "BSE", "symbol": "SENSEX"}])
+        client.unsubscribe_ltp([{"exchange": "BSE", "symbol": "SENSEX"}])
+        sent[name] = client.ws.frames
+
+    print(f"✅ Frames: {sent['json']}")
+    assert len(sent["json"]) == 4 and all(isinstance(frame, bytes) for frame in sent["json"])
+    assert json.loads(sent["json"][0]) == {"action": "authenticate", "api_key": "test_key_1234567890"}
+    assert json.loads(sent["json"][3])["action"] == "unsubscribe"
+    for name, frames in sent.items():
+        assert frames == sent["json"], name
+
+if __name__ == "__main__":
+    test_codecs_agree()
+    test_rest_codec()
+    test_feed_frames()
+    print("\n✅ JSON CODEC TEST COMPLETED!")
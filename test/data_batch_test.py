@@ -0,0 +1,279 @@
+"""
+OpenAlgo Batch Data Test
+Tests the concurrent multi-symbol DataAPI helpers against a local mock transport.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import json
+import asyncio
+import tempfile
+import httpx
+import numpy as np
+import pandas as pd
+from openalgo import AsyncAPI
+from openalgo.cache import HistoryCache
+from helpers import make_client
+
+def quote_handler(request):
+    """Serve quotes for every symbol except 'BAD'"""
+    body = json.loads(request.content)
+    if body['symbol'] == 'BAD':
+        return httpx.Response(200, json={"status": "error", "message": "Invalid symbol"})
+    ltp = float(len(body['symbol']))
+    return httpx.Response(200, json={"status": "success", "data": {
+        "ltp": ltp, "bid": ltp - 0.05, "ask": ltp + 0.05, "volume": 1000
+    }})
+
+INSTRUMENTS = [
+    {"symbol": "RELIANCE", "exchange": "NSE"},
+    {"symbol": "TCS", "exchange": "NSE"},
+    {"symbol": "BAD", "exchange": "NSE"},
+    {"symbol": "INFY"},
+]
+
+def test_quotes_many():
+    """Successes and failures are keyed by EXCHANGE:SYMBOL and kept apart"""
+    print("\n🔍 TESTING quotes_many()")
+    print("=" * 50)
+
+    with make_client(quote_handler) as client:
+        result = client.quotes_many(INSTRUMENTS, max_concurrency=4)
+        print(f"✅ Result: {result}")
+        assert result['status'] == 'success'
+        assert set(result['data']) == {"NSE:RELIANCE", "NSE:TCS"}
+        assert result['data']["NSE:TCS"]['ltp'] == 3.0
+        assert result['errors']["NSE:BAD"]['error_type'] == 'api_error'
+        assert result['errors']["None:INFY"]['error_type'] == 'validation_error'
+
+        df = client.quotes_many(INSTRUMENTS, format="dataframe")['data']
+        print(f"✅ DataFrame:\n{df}")
+        assert df.loc["NSE:RELIANCE", "ltp"] == 8.0
+
+        arrays = client.quotes_many(INSTRUMENTS, format="numpy")['data']
+        print(f"✅ NumPy: {arrays}")
+        assert arrays['keys'] == ["NSE:RELIANCE", "NSE:TCS"]
+        assert arrays['ltp'].dtype == np.float64
+        np.testing.assert_allclose(arrays['ltp'], [8.0, 3.0])
+
+def test_quotes_many_async():
+    """AsyncAPI.quotes_many returns the same shape as the sync client"""
+    print("\n🔍 TESTING AsyncAPI.quotes_many()")
+    print("=" * 50)
+
+    async def run():
+        async with make_client(quote_handler, AsyncAPI) as client:
+            return await client.quotes_many(INSTRUMENTS, max_concurrency=2)
+
+    result = asyncio.run(run())
+    print(f"✅ Result: {result}")
+    assert set(result['data']) == {"NSE:RELIANCE", "NSE:TCS"}
+    assert set(result['errors']) == {"NSE:BAD", "None:INFY"}
+
+def history_handler(request):
+    """Serve one bar per calendar day, repeating the first bar to exercise dedupe"""
+    body = json.loads(request.content)
+    days = pd.date_range(body['start_date'], body['end_date'], freq='D', tz='UTC')
+    bars = [{"timestamp": int(day.timestamp()) + 13500, "open": day.day, "high": day.day,
+             "low": day.day, "close": day.day, "volume": 1} for day in days]
+    return httpx.Response(200, json={"status": "success", "data": bars[::-1] + bars[:1]})
+
+def test_history_chunked():
+    """Chunked history downloads match a single request after sort/dedupe"""
+    print("\n🔍 TESTING CHUNKED history()")
+    print("=" * 50)
+
+    requests = []
+
+    def handler(request):
+        requests.append(json.loads(request.content))
+        return history_handler(request)
+
+    with make_client(handler) as client:
+        whole = client.history(symbol="RELIANCE", exchange="NSE", interval="1m",
+                               start_date="2024-01-01", end_date="2024-03-31")
+        requests.clear()
+        chunked = client.history(symbol="RELIANCE", exchange="NSE", interval="1m",
+                                 start_date="2024-01-01", end_date="2024-03-31",
+                                 chunk_days="auto", max_concurrency=3)
+
+    ranges = sorted((r['start_date'], r['end_date']) for r in requests)
+    print(f"✅ Chunks: {ranges}")
+    assert ranges == [("2024-01-01", "2024-01-30"), ("2024-01-31", "2024-02-29"),
+                      ("2024-03-01", "2024-03-30"), ("2024-03-31", "2024-03-31")]
+    print(f"✅ Rows: {len(chunked)}")
+    assert len(chunked) == 91
+    assert chunked.index.is_monotonic_increasing
+    pd.testing.assert_frame_equal(whole, chunked)
+
+def test_history_chunked_error():
+    """A failed chunk fails the whole download"""
+    def handler(request):
+        if json.loads(request.content)['start_date'] == "2024-01-11":
+            return httpx.Response(200, json={"status": "error", "message": "Rate limited"})
+        return history_handler(request)
+
+    async def run():
+        async with make_client(handler, AsyncAPI) as client:
+            return await client.history(symbol="RELIANCE", exchange="NSE", interval="5m",
+                                        start_date="2024-01-01", end_date="2024-01-31", chunk_days=10)
+
+    result = asyncio.run(run())
+    print(f"✅ Result: {result}")
+    assert result['error_type'] == 'api_error'
+
+def test_history_numpy():
+    """format='numpy' returns sorted, de-duplicated contiguous arrays"""
+    print("\n🔍 TESTING history(format='numpy')")
+    print("=" * 50)
+
+    with make_client(history_handler) as client:
+        df = client.history(symbol="RELIANCE", exchange="NSE", interval="1m",
+                            start_date="2024-01-01", end_date="2024-01-10")
+        arrays = client.history(symbol="RELIANCE", exchange="NSE", interval="1m",
+                                start_date="2024-01-01", end_date="2024-01-10", format="numpy")
+
+    print(f"✅ Arrays: {arrays}")
+    assert arrays['timestamp'].dtype == np.int64
+    assert arrays['close'].dtype == np.float64 and arrays['close'].flags['C_CONTIGUOUS']
+    assert np.all(np.diff(arrays['timestamp']) > 0)
+    np.testing.assert_array_equal(arrays['close'], df['close'].values)
+    np.testing.assert_array_equal(pd.to_datetime(arrays['timestamp'], unit='s', utc=True), df.index)
+
+def test_history_many():
+    """history_many returns per-symbol frames or NaN-padded (time x symbol) panels"""
+    print("\n🔍 TESTING history_many()")
+    print("=" * 50)
+
+    def handler(request):
+        body = json.loads(request.content)
+        if body['symbol'] == 'BAD':
+            return httpx.Response(200, json={"status": "error", "message": "Invalid symbol"})
+        if body['symbol'] == 'TCS':
+            body['start_date'] = "2024-01-03"
+            request = httpx.Request("POST", request.url, json=body)
+        return history_handler(request)
+
+    instruments = INSTRUMENTS[:3]
+    with make_client(handler) as client:
+        frames = client.history_many(instruments, interval="5m", start_date="2024-01-01",
+                                     end_date="2024-01-05", max_concurrency=3)
+        panel = client.history_many(instruments, interval="5m", start_date="2024-01-01",
+                                    end_date="2024-01-05", format="panel")
+
+    assert set(frames['data']) == {"NSE:RELIANCE", "NSE:TCS"}
+    assert len(frames['data']["NSE:TCS"]) == 3
+    assert set(frames['errors']) == {"NSE:BAD"}
+
+    data = panel['data']
+    print(f"✅ Panel close:\n{data['close']}")
+    assert data['symbols'] == ["NSE:RELIANCE", "NSE:TCS"]
+    assert data['close'].shape == (5, 2)
+    assert np.isnan(data['close'][:2, 1]).all()
+    np.testing.assert_array_equal(data['close'][:, 0], [1, 2, 3, 4, 5])
+    np.testing.assert_array_equal(data['close'][2:, 1], [3, 4, 5])
+
+def test_history_cache():
+    """Cached ranges are served locally and only the missing tail is downloaded"""
+    print("\n🔍 TESTING history() CACHE")
+    print("=" * 50)
+
+    requests = []
+
+    def handler(request):
+        requests.append(json.loads(request.content))
+        return history_handler(request)
+
+    with tempfile.TemporaryDirectory() as directory:
+        with make_client(handler) as client:
+            client.history_cache = HistoryCache(directory)
+            first = client.history(symbol="RELIANCE", exchange="NSE", interval="5m",
+                                   start_date="2024-01-01", end_date="2024-01-20")
+            assert [(r['start_date'], r['end_date']) for r in requests] == [("2024-01-01", "2024-01-20")]
+
+            requests.clear()
+            cached = client.history(symbol="RELIANCE", exchange="NSE", interval="5m",
+                                    start_date="2024-01-05", end_date="2024-01-10")
+            print(f"✅ Requests for a cached window: {requests}")
+            assert requests == []
+            assert len(cached) == 6
+            pd.testing.assert_frame_equal(cached, first.loc["2024-01-05":"2024-01-10"])
+
+            extended = client.history(symbol="RELIANCE", exchange="NSE", interval="5m",
+                                      start_date="2024-01-01", end_date="2024-01-31")
+            print(f"✅ Requests for an extended window: {requests}")
+            assert [(r['start_date'], r['end_date']) for r in requests] == [("2024-01-21", "2024-01-31")]
+            assert len(extended) == 31
+            assert extended.index.is_monotonic_increasing
+
+def test_history_cache_truncated():
+    """Only the span a capped response actually returned is cached; empty ranges are cached whole"""
+    print("\n🔍 TESTING history() CACHE WITH CAPPED RESPONSES")
+    print("=" * 50)
+
+    requests = []
+
+    def handler(request):
+        body = json.loads(request.content)
+        requests.append((body['start_date'], body['end_date']))
+        if body['start_date'] >= "2024-02-01":
+            return httpx.Response(200, json={"status": "success", "data": []})
+        days = pd.date_range(body['start_date'], body['end_date'], freq='D', tz='UTC')[:5]
+        bars = [{"timestamp": int(day.timestamp()) + 13500, "open": 1.0, "high": 1.0, "low": 1.0,
+                 "close": float(day.day), "volume": 1} for day in days]
+        return httpx.Response(200, json={"status": "success", "data": bars})
+
+    kwargs = dict(symbol="RELIANCE", exchange="NSE", interval="5m")
+    with tempfile.TemporaryDirectory() as directory:
+        with make_client(handler, history_cache=directory) as client:
+            assert len(client.history(start_date="2024-01-01", end_date="2024-01-20", **kwargs)) == 5
+            ranges = client.history_cache.ranges("RELIANCE", "NSE", "5m")
+            print(f"✅ Cached after a capped response: {ranges}")
+            assert [(s.isoformat(), e.isoformat()) for s, e in ranges] == [("2024-01-01", "2024-01-05")]
+
+            requests.clear()
+            assert len(client.history(start_date="2024-01-01", end_date="2024-01-20", **kwargs)) == 10
+            assert requests == [("2024-01-06", "2024-01-20")]
+
+            client.history(start_date="2024-02-03", end_date="2024-02-04", **kwargs)
+            assert client.history_cache.missing_ranges("RELIANCE", "NSE", "5m", "2024-02-03", "2024-02-04") == []
+
+def test_history_cache_dtypes():
+    """Cold and warm cached calls return the same column dtypes as an uncached call"""
+    print("\n🔍 TESTING history() CACHE DTYPES")
+    print("=" * 50)
+
+    def handler(request):
+        body = json.loads(request.content)
+        days = pd.date_range(body['start_date'], body['end_date'], freq='D', tz='UTC')
+        bars = [{"timestamp": int(day.timestamp()) + 13500, "open": 100.5, "high": 101.0, "low": 99.5,
+                 "close": 100.0 + day.day, "volume": 1000 * day.day, "oi": 0} for day in days]
+        return httpx.Response(200, json={"status": "success", "data": bars})
+
+    kwargs = dict(symbol="RELIANCE", exchange="NSE", interval="5m", start_date="2024-01-01", end_date="2024-01-10")
+    with tempfile.TemporaryDirectory() as directory:
+        with make_client(handler) as client:
+            uncached = client.history(**kwargs)
+            client.history_cache = HistoryCache(directory)
+            cold = client.history(**kwargs)
+            warm = client.history(**kwargs)
+
+    print(f"✅ Dtypes: {dict(warm.dtypes.astype(str))}")
+    assert uncached['volume'].dtype == np.int64 and uncached['close'].dtype == np.float64
+    pd.testing.assert_series_equal(cold.dtypes, uncached.dtypes)
+    pd.testing.assert_series_equal(warm.dtypes, uncached.dtypes)
+    pd.testing.assert_frame_equal(warm, uncached)
+
+if __name__ == "__main__":
+    test_quotes_many()
+    test_quotes_many_async()
+    test_history_chunked()
+    test_history_chunked_error()
+    test_history_numpy()
+    test_history_many()
+    test_history_cache()
+    test_history_cache_truncated()
+    test_history_cache_dtypes()
+    print("\n✅ BATCH DATA TEST COMPLETED!")
@@ -0,0 +1,114 @@
+"""
+OpenAlgo Feed Bar Builder Test
+Tests streaming multi-timeframe OHLCV aggregation aligned to IST sessions.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+import pandas as pd
+from openalgo import api
+from openalgo.bars import BarBuilder
+from helpers import tick
+
+SESSION = int(pd.Timestamp("2025-01-06 09:15", tz="Asia/Kolkata").timestamp())
+
+def test_multi_timeframe_bars():
+    """One tick stream builds 1m, 5m and 15m bars with bar-close events"""
+    print("\n🔍 TESTING BAR BUILDER")
+    print("=" * 50)
+
+    closed = []
+    builder = BarBuilder(intervals=("1m", "5m", "15m", "D"), on_bar=closed.append)
+    # One tick every 20 seconds from 09:15:00 to 09:34:40 with rising prices and cumulative volume
+    for i in range(60):
+        builder.update("NSE:INFY", (SESSION + 20 * i) * 1000, 100.0 + i, volume=1000.0 + 10 * i)
+
+    one = builder.bars("NSE:INFY", "1m")
+    print(f"✅ {len(one['timestamp'])} closed 1m bars, {len(closed)} bar-close events")
+    assert len(one['timestamp']) == 19
+    assert one['timestamp'][0] == SESSION and np.all(np.diff(one['timestamp']) == 60)
+    np.testing.assert_array_equal(one['open'][:2], [100.0, 103.0])
+    np.testing.assert_array_equal(one['close'][:2], [102.0, 105.0])
+    np.testing.assert_array_equal(one['volume'][:2], [20.0, 30.0])
+
+    five = builder.bars("NSE:INFY", "5m")
+    assert list(five['timestamp'] - SESSION) == [0, 300, 600]
+    assert five['high'][0] == 114.0 and five['low'][1] == 115.0
+    assert len(builder.bars("NSE:INFY", "15m")['timestamp']) == 1
+    assert {bar['interval'] for bar in closed} == {"1m", "5m", "15m"}
+    assert closed[0] == {'timestamp': SESSION, 'open': 100.0, 'high': 102.0, 'low': 100.0, 'close': 102.0,
+                         'volume': 20.0, 'symbol': 'INFY', 'exchange': 'NSE', 'interval': '1m'}
+
+    partial = builder.bars("NSE:INFY", "5m", include_partial=True)
+    assert partial['close'][-1] == 159.0
+
+    builder.flush(SESSION + 86400)
+    daily = builder.bars("NSE:INFY", "D", format="dataframe")
+    assert daily.index[0] == pd.Timestamp("2025-01-06")
+    frame = builder.bars("NSE:INFY", "15m", format="dataframe")
+    print(f"✅ 15m bars:\n{frame}")
+    assert str(frame.index.tz) == "Asia/Kolkata"
+    assert frame.index[1] == pd.Timestamp("2025-01-06 09:30", tz="Asia/Kolkata")
+    assert list(frame.columns) == ["open", "high", "low", "close", "volume"]
+
+def test_late_ticks_and_grace():
+    """A bar is emitted once: late ticks for closed bars are dropped, and flush waits for the grace period"""
+    print("\n🔍 TESTING LATE TICKS")
+    print("=" * 50)
+
+    closed = []
+    builder = BarBuilder(intervals=("1m",), on_bar=closed.append, grace=2.0)
+    builder.update("NSE:INFY", SESSION + 10, 100.0)
+    assert builder.flush(SESSION + 61) == []
+    builder.update("NSE:INFY", SESSION + 59, 101.0)
+    assert len(builder.flush(SESSION + 62)) == 1
+
+    # A tick stamped inside the closed bar must not open a second bar with the same start
+    builder.update("NSE:INFY", SESSION + 30, 99.0)
+    builder.flush(SESSION + 200)
+    bars = builder.bars("NSE:INFY", "1m")
+    print(f"✅ Bars {bars['timestamp'] - SESSION}, late ticks {builder.late_ticks}")
+    assert list(bars['timestamp'] - SESSION) == [0] and len(closed) == 1
+    assert closed[0]['close'] == 101.0 and builder.late_ticks == 1
+
+    # Numeric strings are parsed; anything else is rejected with a clear error
+    builder.update("NSE:INFY", str((SESSION + 70) * 1000), 102.0)
+    assert builder.bars("NSE:INFY", "1m", include_partial=True)['close'][-1] == 102.0
+    try:
+        builder.update("NSE:INFY", "2025-01-06T09:17:00", 103.0)
+        assert False, "non-numeric timestamp accepted"
+    except ValueError as e:
+        assert "epoch seconds or milliseconds" in str(e)
+
+def test_feed_bars():
+    """Quote ticks from the feed are aggregated and appended to seeded history"""
+    print("\n🔍 TESTING FEED BARS")
+    print("=" * 50)
+
+    client = api(api_key="test_key", host="http://127.0.0.1:5000")
+    closed = []
+    client.enable_bars(intervals=("1m",), on_bar=closed.append, modes=(2,), flush_interval=None)
+    history = {'timestamp': np.array([SESSION - 120, SESSION - 60], dtype=np.int64),
+               'open': np.array([1.0, 2.0]), 'high': np.array([1.0, 2.0]), 'low': np.array([1.0, 2.0]),
+               'close': np.array([1.0, 2.0]), 'volume': np.array([5.0, 5.0])}
+    client.bar_builder.seed("NSE:TCS", "1m", history)
+
+    for i in range(5):
+        client._process_message(tick("TCS", 3000.0 + i, 2, timestamp=(SESSION + 30 * i) * 1000, volume=100 * i))
+
+    bars = client.get_bars("NSE", "TCS", "1m")
+    print(f"✅ Bars: {bars['close']}")
+    np.testing.assert_array_equal(bars['close'], [1.0, 2.0, 3001.0, 3003.0])
+    assert [bar['close'] for bar in closed] == [3001.0, 3003.0]
+    assert bars['volume'][-1] == 200.0
+    client.disable_bars()
+    assert client.get_bars("NSE", "TCS", "1m") is None
+
+if __name__ == "__main__":
+    test_multi_timeframe_bars()
+    test_late_ticks_and_grace()
+    test_feed_bars()
+    print("\n✅ FEED BAR BUILDER TEST COMPLETED!")
@@ -0,0 +1,49 @@
+"""
+OpenAlgo Feed Conflation Test
+Tests latest-value-wins delivery where consumers drain changed instruments.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from openalgo import api
+from helpers import tick
+
+OHLC = {"open": 1, "high": 2, "low": 0.5, "close": 1}
+
+def test_conflated_drain():
+    """Many ticks per instrument collapse to one drained value and no callbacks"""
+    print("\n🔍 TESTING CONFLATION")
+    print("=" * 50)
+
+    client = api(api_key="test_key", host="http://127.0.0.1:5000")
+    calls = []
+    client.ltp_callback = calls.append
+    client.quote_callback = calls.append
+    client.set_conflation(modes=(1,))
+
+    for i in range(1000):
+        client._process_message(tick(f"OPT{i % 10}", float(i), exchange="NFO", timestamp=i, **OHLC))
+    latest = client.drain(1)
+    print(f"✅ Drained {len(latest)} symbols from 1000 ticks: {latest['NFO:OPT9']}")
+    assert calls == []
+    assert len(latest) == 10
+    assert latest["NFO:OPT9"] == {"ltp": 999.0, "timestamp": 999}
+    assert client.drain(1) == {}
+
+    client._process_message(tick("OPT3", 1003.0, exchange="NFO", timestamp=1003, **OHLC))
+    assert list(client.drain(1)) == ["NFO:OPT3"]
+
+    # Quotes are not conflated, so their callback still fires per tick
+    client._process_message(tick("OPT3", 5.0, 2, exchange="NFO", timestamp=5, **OHLC))
+    assert len(calls) == 1 and calls[0]['data']['ltp'] == 5.0
+    assert client.drain(2) == {}
+
+    client.set_conflation(False)
+    client._process_message(tick("OPT3", 6.0, exchange="NFO", timestamp=6, **OHLC))
+    assert calls[-1]['data']['ltp'] == 6.0
+
+if __name__ == "__main__":
+    test_conflated_drain()
+    print("\n✅ FEED CONFLATION TEST COMPLETED!")
@@ -0,0 +1,61 @@
+"""
+OpenAlgo Feed Readiness Test
+Tests event-driven connect/auth signalling and wait_until_ready().
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import json
+import time
+import asyncio
+import threading
+from openalgo import api
+
+def test_wait_until_ready():
+    """Waiters wake as soon as authentication succeeds instead of on a 100 ms poll"""
+    print("\n🔍 TESTING wait_until_ready()")
+    print("=" * 50)
+
+    client = api(api_key="test_key_1234567890", host="http://127.0.0.1:5000")
+    assert client.wait_until_ready(timeout=0.01) is False
+
+    def handshake():
+        time.sleep(0.02)
+        client._set_state(connected=True)
+        client._process_message(json.dumps({"type": "auth", "status": "success"}))
+
+    threading.Thread(target=handshake).start()
+    start = time.monotonic()
+    assert client.wait_until_ready(timeout=2)
+    elapsed = time.monotonic() - start
+    print(f"✅ Ready after {elapsed * 1000:.1f} ms")
+    assert elapsed < 0.1
+
+    client._handle_close(client.ws)
+    assert not client.wait_until_ready(timeout=0)
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.02, lambda: threading.Thread(target=handshake).start())
+        return await client.wait_until_ready_async(timeout=2)
+
+    assert asyncio.run(run())
+
+def test_connect_fails_fast():
+    """A refused connection is reported immediately rather than after the timeout"""
+    print("\n🔍 TESTING CONNECT FAILURE")
+    print("=" * 50)
+
+    client = api(api_key="test_key_1234567890", host="http://127.0.0.1:5000", ws_url="ws://127.0.0.1:1")
+    start = time.monotonic()
+    assert client.connect() is False
+    elapsed = time.monotonic() - start
+    print(f"✅ Failed after {elapsed * 1000:.1f} ms")
+    assert elapsed < 2
+
+if __name__ == "__main__":
+    test_wait_until_ready()
+    test_connect_fails_fast()
+    print("\n✅ FEED READINESS TEST COMPLETED!")
@@ -0,0 +1,122 @@
+"""
+OpenAlgo Sharded Feed Test
+Tests instrument placement, merged delivery and make-before-break rebalancing.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import json
+import time
+import threading
+from openalgo import ShardedFeed
+from helpers import tick
+
+class FakeSocket:
+    """Stands in for the WebSocketApp and records every frame sent"""
+
+    def __init__(self):
+        self.frames = []
+
+    def send(self, message):
+        self.frames.append(json.loads(message))
+
+    def close(self):
+        pass
+
+def _tick(feed, shard, symbol, ltp, timestamp, mode=1):
+    feed.shards[shard]._process_message(tick(symbol, ltp, mode, timestamp=timestamp))
+
+def _sent(socket, action):
+    return [s["symbol"] for f in socket.frames if f["action"] == action for s in f.get("symbols", [f])]
+
+def test_sharded_feed():
+    """Instruments spread over shards, ticks merge into one stream, and moves hand over cleanly"""
+    print("\n🔍 TESTING SHARDED FEED")
+    print("=" * 50)
+
+    feed = ShardedFeed(api_key="test_key", host="http://127.0.0.1:5000", shards=2)
+    for shard in feed.shards:
+        shard.ws = FakeSocket()
+        shard.connected = shard.authenticated = True
+
+    received = []
+    instruments = [{"exchange": "NSE", "symbol": f"SYM{i}"} for i in range(4)]
+    assert feed.subscribe_ltp(instruments, on_data_received=received.append, batch_size=10)
+    assert feed.get_shard_loads() == [2, 2]
+    assert _sent(feed.shards[0].ws, "subscribe") == ["SYM0", "SYM2"]
+    assert _sent(feed.shards[1].ws, "subscribe") == ["SYM1", "SYM3"]
+
+    _tick(feed, 0, "SYM0", 10.0, 1)
+    _tick(feed, 1, "SYM1", 20.0, 1)
+    assert [(d["symbol"], d["data"]["ltp"]) for d in received] == [("SYM0", 10.0), ("SYM1", 20.0)]
+    assert received[1]["symbol_id"] == feed.symbols.get("NSE", "SYM1")
+    assert set(feed.get_ltp()["ltp"]["NSE"]) == {"SYM0", "SYM1"}
+    print(f"✅ Loads {feed.get_shard_loads()}, merged ticks {len(received)}")
+
+    # Removing both instruments of shard 0 moves one instrument over from shard 1
+    feed.unsubscribe_ltp(instruments[0::2], batch_size=10)
+    assert feed.moving == {("NSE", "SYM1"): (1, 0)} and feed.get_shard_loads() == [1, 1]
+    assert _sent(feed.shards[0].ws, "subscribe")[-1] == "SYM1"
+
+    # The source keeps delivering until the target's first tick takes over
+    _tick(feed, 1, "SYM1", 21.0, 2)
+    _tick(feed, 0, "SYM1", 22.0, 3)
+    assert feed.assignments[("NSE", "SYM1")] == 0 and not feed.moving
+    deadline = time.time() + 2
+    while "SYM1" not in _sent(feed.shards[1].ws, "unsubscribe") and time.time() < deadline:
+        time.sleep(0.01)
+    assert "SYM1" in _sent(feed.shards[1].ws, "unsubscribe")
+
+    # Late ticks from the old shard and out-of-order ticks are dropped
+    _tick(feed, 1, "SYM1", 99.0, 4)
+    _tick(feed, 0, "SYM1", 98.0, 2)
+    assert [d["data"]["ltp"] for d in received if d["symbol"] == "SYM1"] == [20.0, 21.0, 22.0]
+    assert feed.stats["moved"] == 1 and feed.stats["dropped_stale"] == 2
+    print(f"✅ Stats: {feed.stats}")
+
+def test_dispatcher_modes():
+    """Under a conflating dispatcher each mode keeps its own tick, and one symbol's modes stay in order"""
+    print("\n🔍 TESTING SHARDED DISPATCHER")
+    print("=" * 50)
+
+    feed = ShardedFeed(api_key="test_key", host="http://127.0.0.1:5000", shards=2)
+    for shard in feed.shards:
+        shard.ws = FakeSocket()
+        shard.connected = shard.authenticated = True
+
+    started, release = threading.Event(), threading.Event()
+    delivered = []
+
+    def on_ltp(data):
+        delivered.append(("ltp", data["data"]["ltp"]))
+        started.set()
+        release.wait(2)
+
+    instrument = [{"exchange": "NSE", "symbol": "INFY"}]
+    feed.subscribe_ltp(instrument, on_data_received=on_ltp)
+    feed.subscribe_quote(instrument, on_data_received=lambda data: delivered.append(("quote", data["data"]["ltp"])))
+    dispatcher = feed.start_dispatcher(workers=4, overflow="conflate")
+    shard = feed.assignments[("NSE", "INFY")]
+    try:
+        # The worker is busy with the first LTP tick while a quote and another LTP tick queue up
+        _tick(feed, shard, "INFY", 1500.0, 1)
+        assert started.wait(2)
+        _tick(feed, shard, "INFY", 1501.0, 2, mode=2)
+        _tick(feed, shard, "INFY", 1502.0, 2)
+        release.set()
+        deadline = time.time() + 2
+        while len(delivered) < 3 and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        release.set()
+        feed.stop_dispatcher()
+    print(f"✅ Delivered: {delivered}")
+    assert delivered == [("ltp", 1500.0), ("quote", 1501.0), ("ltp", 1502.0)]
+    assert dispatcher.conflated == 0
+
+if __name__ == "__main__":
+    test_sharded_feed()
+    test_dispatcher_modes()
+    print("\n✅ SHARDED FEED TEST COMPLETED!")
@@ -0,0 +1,124 @@
+"""
+OpenAlgo Shared-Memory Tick Fan-Out Test
+Tests the seqlock tick ring between a publishing feed and subscribers.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import subprocess
+import uuid
+import numpy as np
+from openalgo import api
+from openalgo.sharedring import TickPublisher, TickSubscriber
+from helpers import tick
+
+def test_ring_sequencing():
+    """Subscribers see committed ticks in order and count ticks lost to overruns"""
+    print("\n🔍 TESTING SHARED TICK RING")
+    print("=" * 50)
+
+    name = f"oa-test-{uuid.uuid4().hex[:8]}"
+    publisher = TickPublisher(name, capacity=8, max_symbols=4)
+    try:
+        subscriber = TickSubscriber(name)
+        for i in range(5):
+            publisher.publish(1, "NSE:INFY", 1, 1000 + i, 1500.0 + i)
+        ticks = subscriber.poll()
+        print(f"✅ Polled {len(ticks)} ticks: {ticks['ltp']}")
+        np.testing.assert_array_equal(ticks['ltp'], [1500, 1501, 1502, 1503, 1504])
+        assert subscriber.key(1) == "NSE:INFY" and subscriber.symbol(1) == ("NSE", "INFY")
+        assert len(subscriber.poll()) == 0
+
+        # A half-written slot ends the batch until it is committed
+        publisher._seq[5 % 8] = 2 * 5 + 1
+        publisher.header[4] = 6
+        assert len(subscriber.poll()) == 0 and subscriber.cursor == 5
+        publisher._seq[5 % 8] = 2 * 5 + 2
+        assert len(subscriber.poll()) == 1
+        publisher.head = 6
+
+        # Falling more than capacity behind loses the overwritten ticks
+        for i in range(20):
+            publisher.publish(2, "NSE:TCS", 2, 2000 + i, 3000.0 + i, volume=float(i))
+        ticks = subscriber.poll(max_ticks=5)
+        assert subscriber.lost == 12 and ticks['timestamp'][0] == 2012 and len(ticks) == 5
+        assert len(subscriber.poll(timeout=0.01)) == 3
+        assert len(TickSubscriber(name, from_start=True).poll()) == 8
+        print(f"✅ Lost {subscriber.lost} ticks to the overrun")
+
+        publisher.publish(7, "NSE:SBIN", 1, 0, 1.0)
+        assert publisher.skipped == 1
+        subscriber.close()
+    finally:
+        publisher.close()
+
+def test_publisher_ownership():
+    """A live publisher's block is never taken over silently; a dead publisher's block is replaced"""
+    print("\n🔍 TESTING PUBLISHER OWNERSHIP")
+    print("=" * 50)
+
+    name = f"oa-test-{uuid.uuid4().hex[:8]}"
+    first = TickPublisher(name, capacity=8, max_symbols=4)
+    try:
+        TickPublisher(name, capacity=8, max_symbols=4)
+        assert False, "second publisher took over a live block"
+    except FileExistsError as e:
+        print(f"✅ {e}")
+    first.publish(0, "NSE:INFY", 1, 1, 1500.0)
+    subscriber = TickSubscriber(name, from_start=True)
+    assert len(subscriber.poll()) == 1
+    subscriber.close()
+
+    # overwrite=True replaces it, and the old publisher's close() leaves the new block alone
+    second = TickPublisher(name, capacity=8, max_symbols=4, overwrite=True)
+    first.close()
+    second.publish(0, "NSE:TCS", 1, 2, 3500.0)
+    subscriber = TickSubscriber(name, from_start=True)
+    ticks = subscriber.poll()
+    subscriber.close()
+    assert len(ticks) == 1 and ticks[0]['ltp'] == 3500.0
+
+    # A block whose publisher process has exited is replaced without overwrite
+    dead = subprocess.run([sys.executable, "-c", "import os; print(os.getpid())"],
+                          capture_output=True, text=True).stdout
+    second.header[6] = int(dead)
+    third = TickPublisher(name, capacity=8, max_symbols=4)
+    second.close()
+    subscriber = TickSubscriber(name)
+    assert subscriber.header[6] == os.getpid()
+    subscriber.close()
+    third.close()
+    print("✅ Stale block replaced")
+
+def test_feed_publisher():
+    """A feed publishes every decoded tick for other processes"""
+    print("\n🔍 TESTING FEED PUBLISHER")
+    print("=" * 50)
+
+    name = f"oa-test-{uuid.uuid4().hex[:8]}"
+    client = api(api_key="test_key", host="http://127.0.0.1:5000")
+    client.enable_publisher(name, capacity=64, max_symbols=16)
+    subscriber = TickSubscriber(name)
+    client._process_message(tick("INFY", 1500.5, 2, timestamp=1700000000000, open=1490, high=1510, low=1480,
+                                 close=1495, volume=1000, bid=1500.0, ask=1501.0))
+    client._process_message(tick("TCS", 3500.0, 3, timestamp=1700000000001,
+                                 depth={"buy": [{"price": 3499.5, "quantity": 10}], "sell": []}))
+
+    ticks = subscriber.poll()
+    assert list(ticks['mode']) == [2, 3]
+    assert ticks[0]['high'] == 1510 and ticks[0]['ask'] == 1501.0
+    assert ticks[1]['bid'] == 3499.5 and np.isnan(ticks[1]['ask'])
+    assert subscriber.symbol(int(ticks[1]['symbol_id'])) == ("NSE", "TCS")
+    print(f"✅ Subscriber read {len(ticks)} ticks without a socket")
+
+    subscriber.close()
+    client.close()
+    assert client.publisher is None
+
+if __name__ == "__main__":
+    test_ring_sequencing()
+    test_publisher_ownership()
+    test_feed_publisher()
+    print("\n✅ SHARED-MEMORY TICK FAN-OUT TEST COMPLETED!")
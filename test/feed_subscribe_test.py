@@ -0,0 +1,101 @@
+"""
+OpenAlgo Feed Subscription Test
+Tests batched subscribe/unsubscribe frames, flow control and the acknowledgement map.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import json
+import time
+import threading
+from openalgo import api
+
+class RecordingSocket:
+    """Stands in for the WebSocketApp and records every frame sent"""
+
+    def __init__(self):
+        self.frames = []
+
+    def send(self, message):
+        self.frames.append(json.loads(message))
+
+def make_feed():
+    client = api(api_key="test_key", host="http://127.0.0.1:5000")
+    client.ws = RecordingSocket()
+    client.connected = True
+    client.authenticated = True
+    return client
+
+INSTRUMENTS = [{"exchange": "NSE", "symbol": f"SYM{i}"} for i in range(10)]
+
+def ack(frame, status="success"):
+    """Build the server response for a subscription frame"""
+    symbols = frame.get("symbols") or [{"symbol": frame["symbol"], "exchange": frame["exchange"]}]
+    return json.dumps({"type": frame["action"], "status": status, "subscriptions": [
+        {"symbol": s["symbol"], "exchange": s["exchange"], "mode": frame["mode"], "status": status} for s in symbols
+    ]})
+
+def test_batched_subscribe():
+    """Instruments are packed into frames and tracked per instrument until acknowledged"""
+    print("\n🔍 TESTING BATCHED SUBSCRIBE")
+    print("=" * 50)
+
+    client = make_feed()
+    start = time.monotonic()
+    assert client.subscribe_ltp(INSTRUMENTS, batch_size=4)
+    elapsed = time.monotonic() - start
+    frames = client.ws.frames
+    print(f"✅ {len(frames)} frames in {elapsed:.3f}s")
+    assert elapsed < 0.1
+    assert [len(f["symbols"]) for f in frames] == [4, 4, 2]
+    assert frames[0]["action"] == "subscribe" and frames[0]["mode"] == 1
+
+    assert set(client.get_subscription_acks(1).values()) == {"pending"}
+    for frame in frames:
+        client._process_message(ack(frame))
+    acks = client.get_subscription_acks()
+    print(f"✅ Acks: {acks}")
+    assert acks[1]["NSE:SYM9"] == "success"
+    assert client._inflight_frames == 0
+
+    client._ltp_store[client.get_symbol_id("NSE", "SYM0")] = {'price': 1.0, 'timestamp': 0}  # ltp_data is read-only
+    assert client.unsubscribe_ltp(INSTRUMENTS, batch_size=10)
+    assert client.ws.frames[-1]["action"] == "unsubscribe"
+    assert len(client.ws.frames[-1]["symbols"]) == 10
+    assert "depth" not in client.ws.frames[-1]
+    assert client.ltp_data == {}
+    assert client.get_subscription_acks(1) == {}
+
+def test_flow_control():
+    """No more than max_inflight_frames frames wait for acknowledgement"""
+    print("\n🔍 TESTING FLOW CONTROL")
+    print("=" * 50)
+
+    client = make_feed()
+    client.max_inflight_frames = 2
+    thread = threading.Thread(target=client.subscribe_quote, args=(INSTRUMENTS,), kwargs={"batch_size": 1})
+    thread.start()
+    time.sleep(0.1)
+    assert len(client.ws.frames) == 2
+    assert "symbol" in client.ws.frames[0]
+
+    acknowledged = 0
+    while thread.is_alive() or acknowledged < len(client.ws.frames):
+        if acknowledged < len(client.ws.frames):
+            client._process_message(ack(client.ws.frames[acknowledged], "error" if acknowledged == 3 else "success"))
+            acknowledged += 1
+        time.sleep(0.001)
+    thread.join()
+
+    acks = client.get_subscription_acks(2)
+    print(f"✅ Acks: {acks}")
+    assert len(client.ws.frames) == 10
+    assert acks["NSE:SYM3"] == "error"
+    assert list(acks.values()).count("success") == 9
+
+if __name__ == "__main__":
+    test_batched_subscribe()
+    test_flow_control()
+    print("\n✅ FEED SUBSCRIPTION TEST COMPLETED!")
@@ -0,0 +1,78 @@
+"""
+OpenAlgo Feed Symbol Registry Test
+Tests integer symbol IDs assigned at subscribe time and the string-keyed compatibility views.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import json
+from openalgo import api
+from openalgo.symbols import SymbolRegistry
+from helpers import tick
+
+class RecordingSocket:
+    def __init__(self):
+        self.frames = []
+
+    def send(self, message):
+        self.frames.append(json.loads(message))
+
+def test_registry():
+    """IDs are dense, stable and resolve back to exchange and symbol"""
+    print("\n🔍 TESTING SYMBOL REGISTRY")
+    print("=" * 50)
+
+    registry = SymbolRegistry()
+    assert registry.intern("NSE", "INFY") == 0
+    assert registry.intern("NFO", "INFY") == 1
+    assert registry.intern("NSE", "INFY") == 0
+    assert registry.get("BSE", "INFY") is None
+    assert registry.key(1) == "NFO:INFY" and registry.pair(0) == ("NSE", "INFY")
+    assert len(registry) == 2
+
+def test_feed_symbol_ids():
+    """Subscriptions get IDs, callbacks carry them and string getters are unchanged"""
+    print("\n🔍 TESTING FEED SYMBOL IDS")
+    print("=" * 50)
+
+    client = api(api_key="test_key", host="http://127.0.0.1:5000")
+    client.ws = RecordingSocket()
+    client.connected = client.authenticated = True
+    received = []
+    client.subscribe_ltp([{"exchange": "NSE", "symbol": "TCS"}, {"exchange": "NSE", "symbol": "INFY"}],
+                         on_data_received=received.append, batch_size=10)
+    assert client.get_symbol_id("NSE", "TCS") == 0
+    assert client.get_symbol_id("NSE", "INFY") == 1
+
+    prices = [0.0, 0.0]
+    client.ltp_callback = lambda tick: (prices.__setitem__(tick['symbol_id'], tick['data']['ltp']),
+                                        received.append(tick))
+    for symbol, ltp in (("INFY", 1500.0), ("TCS", 4000.0)):
+        client._process_message(tick(symbol, ltp))
+    print(f"✅ Prices by ID: {prices}")
+    assert prices == [4000.0, 1500.0]
+    assert received[0]['symbol'] == "INFY" and received[0]['symbol_id'] == 1
+
+    assert client.get_ltp() == {"ltp": {"NSE": {"INFY": {"timestamp": 1, "ltp": 1500.0},
+                                                "TCS": {"timestamp": 1, "ltp": 4000.0}}}}
+    assert client.get_ltp("NSE", "TCS") == {"ltp": {"NSE": {"TCS": {"timestamp": 1, "ltp": 4000.0}}}}
+    view = client.ltp_data
+    assert view["NSE:TCS"]["price"] == 4000.0
+    assert "NSE:WIPRO" not in view and "BSE:TCS" not in view and len(view) == 2
+    assert dict(view) == {"NSE:INFY": {'price': 1500.0, 'timestamp': 1}, "NSE:TCS": {'price': 4000.0, 'timestamp': 1}}
+    try:
+        view["NSE:TCS"] = {'price': 0.0, 'timestamp': 0}
+        assert False, "ltp_data accepted a write"
+    except TypeError:
+        print("✅ ltp_data is a read-only view")
+
+    client.set_conflation(modes=(1,))
+    client._process_message(tick("TCS", 4001.0, timestamp=2))
+    assert client.drain(1, by_id=True) == {0: {"ltp": 4001.0, "timestamp": 2}}
+
+if __name__ == "__main__":
+    test_registry()
+    test_feed_symbol_ids()
+    print("\n✅ FEED SYMBOL REGISTRY TEST COMPLETED!")
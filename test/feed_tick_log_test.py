@@ -0,0 +1,66 @@
+"""
+OpenAlgo Feed Tick Logging Test
+Tests that tick logging is silent by default, level-gated and rate-limited.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import io
+import logging
+import contextlib
+from openalgo import api
+from helpers import tick
+
+DEPTH = {"buy": [{"price": 1.0, "quantity": 10, "orders": 1}], "sell": []}
+
+def test_tick_logging():
+    """Ticks are not printed unless a sink is enabled, and then only within budget"""
+    print("\n🔍 TESTING TICK LOGGING")
+    print("=" * 50)
+
+    client = api(api_key="test_key", host="http://127.0.0.1:5000")
+    stdout = io.StringIO()
+    with contextlib.redirect_stdout(stdout):
+        for mode in (1, 2, 3):
+            client._process_message(tick(mode=mode, depth=DEPTH))
+    print(f"✅ Default output: {stdout.getvalue()!r}")
+    assert stdout.getvalue() == ""
+    assert client.get_ltp()["ltp"]["NSE"]["RELIANCE"]["ltp"] == 1.0
+
+    lines = []
+    logger = client.set_tick_logging(lines.append, level=logging.INFO, max_per_second=5)
+    for i in range(20):
+        client._process_message(tick(ltp=float(i)))
+    print(f"✅ Lines: {lines}")
+    assert lines[0] == "LTP NSE:RELIANCE: 0.0 | Time: 1"
+    assert len(lines) <= 10
+    assert logger.suppressed + len(lines) >= 20
+
+    lines.clear()
+    client.set_tick_logging(lines.append, level=logging.DEBUG, max_per_second=None)
+    client._process_message(tick(mode=3, depth=DEPTH))
+    assert "BUY DEPTH:" in lines[0] and "No sell depth data available" in lines[0]
+
+    # A depth tick over budget is suppressed, and counted, exactly once
+    lines.clear()
+    logger = client.set_tick_logging(lines.append, level=logging.DEBUG, max_per_second=5)
+    for i in range(20):
+        client._process_message(tick(ltp=float(i), mode=3, depth=DEPTH))
+    depth = [line for line in lines if line.startswith("\nDepth")]
+    reported = sum(int(line.split()[3]) for line in lines if line.startswith("Tick log: suppressed"))
+    print(f"✅ Depth lines: {len(depth)}, suppressed: {reported + logger.suppressed}")
+    assert len(depth) + reported + logger.suppressed == 20
+
+    client.set_tick_logging(lines.append, level=logging.WARNING)
+    lines.clear()
+    client._process_message(tick())
+    assert lines == []
+
+    client.set_tick_logging(None)
+    assert client.tick_logger is None
+
+if __name__ == "__main__":
+    test_tick_logging()
+    print("\n✅ FEED TICK LOGGING TEST COMPLETED!")
@@ -0,0 +1,48 @@
+"""
+OpenAlgo Test Helpers
+Shared mock clients and feed frames for the test scripts.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import json
+import httpx
+from openalgo import api
+from openalgo.aio import AsyncBaseAPI
+
+def make_client(handler, client_class=api, api_key="test_key", host="http://openalgo.test", **kwargs):
+    """
+    Create a client whose pooled HTTP client is served by a local handler.
+
+    The mock transport is injected when the pooled client is created, so no
+    real connection pool is opened and left behind.
+
+    Parameters:
+    - handler (callable): Receives each httpx.Request and returns an httpx.Response.
+    - client_class (type): api, AsyncAPI or another BaseAPI subclass. Defaults to api.
+    - **kwargs: Other constructor arguments (rate_limits, reference_cache, json_codec, ...).
+    """
+    transport = httpx.MockTransport(handler)
+    pool = httpx.AsyncClient if issubclass(client_class, AsyncBaseAPI) else httpx.Client
+
+    class MockClient(client_class):
+        def _create_client(self):
+            return pool(transport=transport, timeout=self.timeout)
+
+    return MockClient(api_key=api_key, host=host, **kwargs)
+
+def tick(symbol="RELIANCE", ltp=1.0, mode=1, exchange="NSE", timestamp=1, **data):
+    """
+    Build a market_data frame as the feed server sends it.
+
+    Parameters:
+    - symbol, ltp, mode, exchange, timestamp: Frame fields. Defaults to an NSE:RELIANCE LTP tick.
+    - **data: Other tick fields (open, volume, bid, depth, ...).
+
+    Returns:
+    str: The JSON frame, ready for FeedAPI._process_message().
+    """
+    return json.dumps({"type": "market_data", "exchange": exchange, "symbol": symbol, "mode": mode,
+                       "data": {"ltp": ltp, "timestamp": timestamp, **data}})
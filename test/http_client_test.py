@@ -0,0 +1,67 @@
+"""
+OpenAlgo Pooled HTTP Client Test
+Verifies that every REST mixin routes through the single pooled client owned by BaseAPI.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import json
+import httpx
+from helpers import make_client
+
+def test_shared_client():
+    """All mixins should send requests through the same httpx.Client"""
+    print("\n🔍 TESTING SHARED POOLED CLIENT")
+    print("=" * 50)
+
+    seen = []
+
+    def handler(request):
+        seen.append(request.url.path)
+        return httpx.Response(200, json={"status": "success", "data": {}})
+
+    client = make_client(handler)
+    client.placeorder(symbol="RELIANCE", action="BUY", exchange="NSE")
+    client.quotes(symbol="RELIANCE", exchange="NSE")
+    client.funds()
+    client.optionsymbol(underlying="NIFTY", exchange="NSE_INDEX", strike_int=50, offset="ATM", option_type="CE")
+    client.telegram(username="trader", message="hello")
+    client.close()
+
+    print(f"✅ Requests sent: {seen}")
+    assert seen == [
+        "/api/v1/placeorder",
+        "/api/v1/quotes",
+        "/api/v1/funds",
+        "/api/v1/optionsymbol",
+        "/api/v1/telegram/notify",
+    ]
+    assert client.client.is_closed
+
+def test_error_shapes():
+    """HTTP and API errors keep the existing error-dict structure"""
+    print("\n🔍 TESTING ERROR RESPONSE STRUCTURE")
+    print("=" * 50)
+
+    def handler(request):
+        body = json.loads(request.content)
+        if body.get("symbol") == "BAD":
+            return httpx.Response(200, json={"status": "error", "message": "Invalid symbol"})
+        return httpx.Response(429, text="Too Many Requests")
+
+    with make_client(handler) as client:
+        response = client.quotes(symbol="BAD", exchange="NSE")
+        print(f"✅ API error: {response}")
+        assert response['error_type'] == 'api_error'
+
+        response = client.quotes(symbol="RELIANCE", exchange="NSE")
+        print(f"✅ HTTP error: {response}")
+        assert response['error_type'] == 'http_error'
+        assert response['code'] == 429
+
+if __name__ == "__main__":
+    test_shared_client()
+    test_error_shapes()
+    print("\n✅ POOLED HTTP CLIENT TEST COMPLETED!")
@@ -0,0 +1,88 @@
+"""
+OpenAlgo Instrument Master Test
+Tests offline symbol search, token lookup and option strike lookups.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import json
+import tempfile
+import httpx
+import numpy as np
+from openalgo.instruments import InstrumentMaster
+from helpers import make_client
+
+def option(strike, option_type, expiry="27-MAR-25", token=0):
+    code = expiry.replace('-', '')
+    return {"symbol": f"NIFTY{code}{strike}{option_type}", "brsymbol": f"NIFTY{code}{strike}{option_type}",
+            "name": "NIFTY", "exchange": "NFO", "brexchange": "NFO", "token": str(token),
+            "instrumenttype": "OPTIDX", "expiry": expiry, "lotsize": 75, "strike": float(strike), "tick_size": 0.05}
+
+RECORDS = [
+    {"symbol": "RELIANCE", "brsymbol": "RELIANCE-EQ", "name": "RELIANCE INDUSTRIES", "exchange": "NSE",
+     "brexchange": "NSE", "token": "2885", "instrumenttype": "EQ", "expiry": "", "lotsize": 1,
+     "strike": -0.01, "tick_size": 0.05},
+    {"symbol": "RELINFRA", "brsymbol": "RELINFRA-EQ", "name": "RELIANCE INFRA", "exchange": "NSE",
+     "brexchange": "NSE", "token": "553", "instrumenttype": "EQ", "expiry": "", "lotsize": 1,
+     "strike": -0.01, "tick_size": 0.05},
+    option(23000, "CE", token=1), option(22500, "PE", token=2), option(22500, "CE", token=3),
+    option(23000, "CE", expiry="24-APR-25", token=4),
+]
+
+def test_offline_lookups():
+    """Prefix search, symbol/token hash lookups and strike lookups answer from memory"""
+    print("\n🔍 TESTING INSTRUMENT MASTER")
+    print("=" * 50)
+
+    master = InstrumentMaster(RECORDS)
+    print(f"✅ Instruments loaded: {len(master)}")
+
+    result = master.search("rel", exchange="NSE")
+    print(f"✅ search('rel'): {[r['symbol'] for r in result['data']]}")
+    assert [r['symbol'] for r in result['data']] == ["RELIANCE", "RELINFRA"]
+    assert master.search("NIFTY27MAR25")['data'][0]['symbol'] == "NIFTY27MAR2522500CE"
+
+    assert master.symbol("RELIANCE", "NSE")['data']['token'] == "2885"
+    assert master.symbol("RELIANCE", "NFO")['error_type'] == 'not_found'
+    assert master.token("4", "NFO")['expiry'] == "24-APR-25"
+
+    expiries = master.expiries("NIFTY")
+    assert list(expiries.astype(str)) == ["2025-03-27", "2025-04-24"]
+    chain = master.strikes("NIFTY", "27-MAR-25", option_type="CE")['data']
+    print(f"✅ CE strikes: {[r['strike'] for r in chain]}")
+    assert [r['strike'] for r in chain] == [22500.0, 23000.0]
+    assert master.option("NIFTY", "2025-03-27", 22500, "PE")['token'] == "2"
+    assert master.option("NIFTY", "2025-03-27", 22000, "PE") is None
+
+def test_download_and_persist():
+    """The master is built from search() responses and round-trips through save()/load()"""
+    print("\n🔍 TESTING DOWNLOAD AND PERSISTENCE")
+    print("=" * 50)
+
+    def handler(request):
+        query = json.loads(request.content)['query']
+        return httpx.Response(200, json={"status": "success",
+                                         "data": [r for r in RECORDS if r['symbol'].startswith(query)]})
+
+    client = make_client(handler)
+
+    master = InstrumentMaster.download(client, ["RELIANCE", "NIFTY", "NIFTY27MAR25"], exchange=None)
+    assert len(master) == 5
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "instruments.npz")
+        master.save(path)
+        loaded = InstrumentMaster.load(path)
+    assert len(loaded) == 5
+    assert loaded.queries == master.queries
+    np.testing.assert_array_equal(loaded.columns['symbol'], master.columns['symbol'])
+    assert loaded.symbol("RELIANCE", "NSE") == master.symbol("RELIANCE", "NSE")
+    assert len(loaded.refresh(client)) == 5
+    client.close()
+
+if __name__ == "__main__":
+    test_offline_lookups()
+    test_download_and_persist()
+    print("\n✅ INSTRUMENT MASTER TEST COMPLETED!")
@@ -0,0 +1,79 @@
+"""
+OpenAlgo Rate Limiter Test
+Tests the client-side token bucket used to throttle order, quote and history calls.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import time
+import asyncio
+import threading
+import httpx
+from helpers import make_client
+from openalgo.ratelimit import RateLimiter
+
+def test_token_bucket_smooths_bursts():
+    """A burst larger than the bucket is spread out instead of rejected"""
+    print("\n🔍 TESTING TOKEN BUCKET")
+    print("=" * 50)
+
+    limiter = RateLimiter(rate=50, burst=5)
+    start = time.monotonic()
+    threads = [threading.Thread(target=limiter.acquire) for _ in range(15)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    depth = limiter.queue_depth
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - start
+
+    print(f"✅ 15 requests at 50/s with burst 5 took {elapsed:.3f}s (queue depth {depth})")
+    assert elapsed >= 0.18
+    assert depth > 0
+    assert limiter.queue_depth == 0
+    assert limiter.status()['total_requests'] == 15
+
+def test_token_bucket_async():
+    """Async callers wait on the event loop without blocking each other"""
+    print("\n🔍 TESTING TOKEN BUCKET (ASYNCIO)")
+    print("=" * 50)
+
+    limiter = RateLimiter(rate=100, burst=1)
+
+    async def run():
+        start = time.monotonic()
+        await asyncio.gather(*[limiter.acquire_async() for _ in range(11)])
+        return time.monotonic() - start
+
+    elapsed = asyncio.run(run())
+    print(f"✅ 11 tasks at 100/s with burst 1 took {elapsed:.3f}s")
+    assert elapsed >= 0.09
+    assert limiter.wait_time > 0
+
+def test_endpoint_groups():
+    """Only endpoints in a configured group are throttled"""
+    print("\n🔍 TESTING ENDPOINT GROUPS")
+    print("=" * 50)
+
+    client = make_client(lambda request: httpx.Response(200, json={"status": "success"}),
+                         rate_limits={'order': (10, 1)})
+
+    for _ in range(3):
+        client.placeorder(symbol="RELIANCE", action="BUY", exchange="NSE")
+        client.quotes(symbol="RELIANCE", exchange="NSE")
+
+    status = client.rate_limit_status()
+    print(f"✅ Status: {status}")
+    assert list(status) == ['order']
+    assert status['order']['total_requests'] == 3
+    assert status['order']['total_wait'] > 0.15
+    client.close()
+
+if __name__ == "__main__":
+    test_token_bucket_smooths_bursts()
+    test_token_bucket_async()
+    test_endpoint_groups()
+    print("\n✅ RATE LIMITER TEST COMPLETED!")
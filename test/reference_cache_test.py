@@ -0,0 +1,85 @@
+"""
+OpenAlgo Reference Data Cache Test
+Tests TTL/LRU caching of symbol(), search(), expiry() and intervals() responses.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import json
+import time
+import tempfile
+import httpx
+from openalgo.cache import TTLCache
+from helpers import make_client
+
+def recording_client(reference_cache, requests):
+    """Create an api client that records every request reaching the server"""
+    def handler(request):
+        body = json.loads(request.content)
+        requests.append((request.url.path.rsplit('/', 1)[-1], body))
+        if body.get('symbol') == 'BAD':
+            return httpx.Response(200, json={"status": "error", "message": "Invalid symbol"})
+        return httpx.Response(200, json={"status": "success", "data": {"lotsize": 1, "tick_size": 0.05}})
+
+    return make_client(handler, reference_cache=reference_cache)
+
+def test_reference_cache_hits():
+    """Repeated reference calls are served from memory; errors and orders are never cached"""
+    print("\n🔍 TESTING REFERENCE DATA CACHE")
+    print("=" * 50)
+
+    requests = []
+    client = recording_client(True, requests)
+    for _ in range(3):
+        client.symbol(symbol="RELIANCE", exchange="NSE")
+        client.search(query="NIFTY", exchange="NFO")
+        client.intervals()
+        client.symbol(symbol="BAD", exchange="NSE")
+        client.quotes(symbol="RELIANCE", exchange="NSE")
+
+    endpoints = [endpoint for endpoint, _ in requests]
+    print(f"✅ Requests sent: {endpoints}")
+    assert endpoints.count("symbol") == 4  # RELIANCE once, BAD every time
+    assert endpoints.count("search") == 1
+    assert endpoints.count("intervals") == 1
+    assert endpoints.count("quotes") == 3
+
+    result = client.symbol(symbol="RELIANCE", exchange="NSE")
+    result['data']['lotsize'] = 999
+    assert client.symbol(symbol="RELIANCE", exchange="NSE")['data']['lotsize'] == 1
+
+    client.reference_cache.invalidate("symbol", symbol="RELIANCE", exchange="NSE")
+    client.symbol(symbol="RELIANCE", exchange="NSE")
+    assert [endpoint for endpoint, _ in requests].count("symbol") == 5
+    client.close()
+
+def test_ttl_lru_and_persistence():
+    """Entries expire, the oldest are evicted, and the cache survives a restart"""
+    print("\n🔍 TESTING TTL, LRU AND PERSISTENCE")
+    print("=" * 50)
+
+    cache = TTLCache(ttl={'symbol': 0.05}, maxsize=2)
+    cache.set('symbol', {'symbol': 'A'}, {'status': 'success'})
+    time.sleep(0.06)
+    assert cache.get('symbol', {'symbol': 'A'}) is None
+
+    for name in ('A', 'B', 'C'):
+        cache.set('search', {'query': name}, {'status': 'success', 'query': name})
+    assert cache.get('search', {'query': 'A'}) is None
+    assert cache.get('search', {'query': 'C'})['query'] == 'C'
+    print(f"✅ Hits: {cache.hits}, misses: {cache.misses}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'reference.json')
+        requests = []
+        recording_client(path, requests).expiry(symbol="NIFTY", exchange="NFO", instrumenttype="options")
+        recording_client(path, requests).expiry(symbol="NIFTY", exchange="NFO", instrumenttype="options")
+        print(f"✅ Requests across restarts: {len(requests)}")
+        assert len(requests) == 1
+
+if __name__ == "__main__":
+    test_reference_cache_hits()
+    test_ttl_lru_and_persistence()
+    print("\n✅ REFERENCE DATA CACHE TEST COMPLETED!")